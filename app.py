@@ -1,5 +1,8 @@
 import streamlit as st
-from youtube_agent_team import youtube_team
+from src.tools.helper.team_loader import get_team_runner, get_youtube_team, warm_up_team
+from src.tools.helper.intent_router import route_message
+from src.tools.helper.models import warm_up_from_env
+from src.tools.helper.kernels import get_kernel_pool, kernel_session
 from mem0 import MemoryClient
 import hashlib
 import uuid
@@ -12,6 +15,15 @@ st.set_page_config(
     layout="wide"
 )
 
+# Optionally start loading CLIP in the background (WARM_UP_MODELS=1)
+warm_up_from_env()
+
+# Import the tools and build the agent team in the background; the page renders meanwhile
+warm_up_team()
+
+# Start spare Python kernels for the calculation agents in the background (PYTHON_KERNEL_SPARES=0 disables)
+get_kernel_pool().warm_up()
+
 # Initialize mem0 client
 client = MemoryClient()
 
@@ -143,16 +155,24 @@ def main():
         with st.chat_message("assistant"):
             with st.spinner("Analyzing..."):
                 try:
-                    # Get short-term memory context for the team
-                    user_id = get_user_id()
-                    run_id = st.session_state.current_conversation_id
-                    short_term_memories = client.get_all(user_id=user_id, run_id=run_id, page=1, page_size=50)
-                    
-                    # Update team context with short-term memory
-                    if short_term_memories:
-                        youtube_team.context = {"memory": short_term_memories}
-                    
-                    response = youtube_team.run(prompt)
+                    # Common lookups (subscribers, last-N video stats, median views, sponsor checks)
+                    # are answered directly; everything else goes to the team
+                    response = route_message(prompt)
+                    if response is None:
+                        youtube_team = get_youtube_team()
+
+                        # Get short-term memory context for the team
+                        user_id = get_user_id()
+                        run_id = st.session_state.current_conversation_id
+                        short_term_memories = client.get_all(user_id=user_id, run_id=run_id, page=1, page_size=50)
+
+                        # Update team context with short-term memory
+                        if short_term_memories:
+                            youtube_team.context = {"memory": short_term_memories}
+
+                        # Each conversation gets its own agent session and Python kernel
+                        with kernel_session(run_id):
+                            response = get_team_runner().run(prompt, session_id=run_id)
                     st.markdown(response.content)
                     
                     # Add assistant response to chat history
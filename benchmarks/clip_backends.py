@@ -0,0 +1,110 @@
+"""
+Benchmark the CLIP image-encoder backends used for thumbnail scoring.
+
+Reports per-batch latency, throughput and score drift of each backend against the
+fp32 PyTorch baseline on a fixed thumbnail set. Run from the repository root:
+
+    python -m benchmarks.clip_backends --backends torch int8 onnx
+    python -m benchmarks.clip_backends --images path/to/thumbnails --batch-size 8
+"""
+import argparse
+import os
+import time
+from typing import Dict, List
+
+import numpy as np
+import torch
+from PIL import Image
+
+from src.tools.helper.clip import encode_pixel_values, preprocess_images
+from src.tools.helper.clip_backends import BACKENDS
+from src.tools.helper.helper import NEGATIVE_PROMPTS, POSITIVE_PROMPTS, _download_image, _thumbnail_scores
+
+# Fixed thumbnail set so runs are comparable over time
+DEFAULT_THUMBNAILS = [
+    "https://i.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg",
+    "https://i.ytimg.com/vi/9bZkp7q19f0/hqdefault.jpg",
+    "https://i.ytimg.com/vi/kJQP7kiw5Fk/hqdefault.jpg",
+    "https://i.ytimg.com/vi/JGwWNGJdvx8/hqdefault.jpg",
+    "https://i.ytimg.com/vi/OPf0YbXqDm0/hqdefault.jpg",
+    "https://i.ytimg.com/vi/RgKAFK5djSk/hqdefault.jpg",
+    "https://i.ytimg.com/vi/fJ9rUzIMcZQ/hqdefault.jpg",
+    "https://i.ytimg.com/vi/hT_nvWreIhg/hqdefault.jpg",
+    "https://i.ytimg.com/vi/YQHsXMglC9A/hqdefault.jpg",
+    "https://i.ytimg.com/vi/60ItHLz5WEA/hqdefault.jpg",
+    "https://i.ytimg.com/vi/2Vv-BfVoq4g/hqdefault.jpg",
+    "https://i.ytimg.com/vi/pRpeEdMmmQ0/hqdefault.jpg",
+    "https://i.ytimg.com/vi/CevxZvSJLk8/hqdefault.jpg",
+    "https://i.ytimg.com/vi/uelHwf8o7_U/hqdefault.jpg",
+    "https://i.ytimg.com/vi/e-ORhEE9VVg/hqdefault.jpg",
+    "https://i.ytimg.com/vi/09R8_2nJtjg/hqdefault.jpg",
+]
+
+
+def load_images(images_dir: str = None) -> List[Image.Image]:
+    if images_dir:
+        paths = sorted(
+            os.path.join(images_dir, name)
+            for name in os.listdir(images_dir)
+            if name.lower().endswith((".jpg", ".jpeg", ".png", ".webp"))
+        )
+        return [Image.open(path).convert("RGB") for path in paths]
+    return [_download_image(url) for url in DEFAULT_THUMBNAILS]
+
+
+def run_backend(backend: str, pixel_values: torch.Tensor, batch_size: int, repeats: int) -> Dict:
+    # First call builds the backend (quantization / ONNX export) and is not timed
+    encode_pixel_values(pixel_values[:1], backend)
+
+    latencies = []
+    embeddings = None
+    for _ in range(repeats):
+        batches = []
+        for i in range(0, len(pixel_values), batch_size):
+            start = time.perf_counter()
+            batches.append(encode_pixel_values(pixel_values[i:i + batch_size], backend))
+            latencies.append(time.perf_counter() - start)
+        embeddings = torch.cat(batches)
+
+    latencies = np.array(latencies) * 1000
+    total_seconds = latencies.sum() / 1000
+    return {
+        "embeddings": embeddings,
+        "scores": np.array(_thumbnail_scores(embeddings, POSITIVE_PROMPTS, NEGATIVE_PROMPTS)),
+        "latency_ms_mean": float(latencies.mean()),
+        "latency_ms_p95": float(np.percentile(latencies, 95)),
+        "throughput": len(pixel_values) * repeats / total_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--images", help="Directory of thumbnail images (default: fixed YouTube thumbnail set)")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    images = load_images(args.images)
+    pixel_values = preprocess_images(images)
+    print(f"{len(images)} thumbnails, batch size {args.batch_size}, {args.repeats} repeats\n")
+
+    # fp32 PyTorch is always the reference for drift
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+    results = {b: run_backend(b, pixel_values, args.batch_size, args.repeats) for b in backends}
+    baseline = results["torch"]
+
+    header = f"{'backend':<8} {'batch ms':>10} {'p95 ms':>10} {'img/s':>8} {'min cos':>8} {'max |Δscore|':>13} {'mean |Δscore|':>14}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        cosine = (r["embeddings"] * baseline["embeddings"]).sum(dim=-1).min().item()
+        drift = np.abs(r["scores"] - baseline["scores"])
+        print(
+            f"{name:<8} {r['latency_ms_mean']:>10.1f} {r['latency_ms_p95']:>10.1f} {r['throughput']:>8.1f} "
+            f"{cosine:>8.4f} {drift.max():>13.4f} {drift.mean():>14.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark the built-in crawler against a local fixture agency site served by
+http.server with simulated network latency, and check that it finds every talent
+page, skips robots.txt-disallowed pages and strips boilerplate. Run from the
+repository root:
+
+    python -m benchmarks.crawler --talents 60 --latency-ms 80
+
+Each concurrency level crawls the same site; 1 corresponds to fetching pages one
+after the other, the way a synchronous crawler would.
+"""
+import argparse
+import asyncio
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.tools.helper.crawler import LocalCrawler
+from src.tools.helper.link_extraction import extract_page_links
+
+PAGE_TEMPLATE = """<!doctype html>
+<html><head><title>{title}</title><script>var tracking = "{title}";</script></head>
+<body>
+<header><a href="/">Fixture Talent Agency</a></header>
+<nav>{nav}</nav>
+<main>{content}</main>
+<footer>Contact us: hello@fixture-agency.test <a href="/private/admin.html">Admin</a></footer>
+</body></html>
+"""
+
+
+def build_site(root: Path, talents: int) -> None:
+    nav = '<a href="/index.html">Home</a> <a href="/roster.html">Roster</a> <a href="/about.html">About</a>'
+    cards = []
+    for i in range(talents):
+        cards.append(
+            f'<div class="card"><h3>Creator {i}</h3>'
+            f'<a href="/talent/{i}.html">Profile</a> '
+            f'<a href="https://www.youtube.com/@creator{i}">YouTube</a> '
+            f'<a href="https://www.instagram.com/creator{i}/">Instagram</a></div>'
+        )
+        page = (
+            f'<h1>Creator {i}</h1><p>Creator {i} makes videos about topic {i % 7}.</p>'
+            f'<a href="https://www.youtube.com/@creator{i}">YouTube</a>'
+            f'<a href="/roster.html?utm_source=profile#top">Back to roster</a>'
+        )
+        (root / "talent").mkdir(exist_ok=True)
+        (root / "talent" / f"{i}.html").write_text(PAGE_TEMPLATE.format(title=f"Creator {i}", nav=nav, content=page))
+    (root / "roster.html").write_text(PAGE_TEMPLATE.format(title="Roster", nav=nav, content="".join(cards)))
+    (root / "index.html").write_text(PAGE_TEMPLATE.format(title="Home", nav=nav, content="<h1>Fixture Talent Agency</h1>"))
+    (root / "about.html").write_text(PAGE_TEMPLATE.format(title="About", nav=nav, content="<p>We represent creators.</p>"))
+    (root / "private").mkdir(exist_ok=True)
+    (root / "private" / "admin.html").write_text(PAGE_TEMPLATE.format(title="Admin", nav=nav, content="secret"))
+    (root / "robots.txt").write_text("User-agent: *\nDisallow: /private/\n")
+
+
+class SlowHandler(SimpleHTTPRequestHandler):
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(root: Path, latency: float) -> ThreadingHTTPServer:
+    handler = type("Handler", (SlowHandler,), {"latency": latency})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(handler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--talents", type=int, default=60)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    parser.add_argument("--delay", type=float, default=0.0, help="politeness delay between request starts")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_site(root, args.talents)
+        server = serve(root, args.latency_ms / 1000)
+        start_url = f"http://127.0.0.1:{server.server_address[1]}/index.html"
+        expected = args.talents + 3
+        print(f"fixture site: {expected} crawlable pages, {args.latency_ms:.0f} ms latency per request\n")
+
+        baseline = None
+        for concurrency in args.concurrency:
+            crawler = LocalCrawler(concurrency=concurrency, delay=args.delay)
+            start = time.perf_counter()
+            pages = asyncio.run(crawler.crawl(start_url, limit=expected + 10))
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+
+            urls = {p.url for p in pages}
+            private = [u for u in urls if "/private/" in u]
+            leaked = [p.url for p in pages if "tracking" in p.markdown or "Contact us" in p.markdown]
+            roster = next((p for p in pages if p.url.endswith("/roster.html")), None)
+            cards = extract_page_links(roster.html, roster.markdown, roster.url)["cards"] if roster else []
+            print(
+                f"concurrency {concurrency:>3}: {len(pages):>4} pages in {seconds:6.2f} s "
+                f"({len(pages) / seconds:6.1f} pages/s, {baseline / seconds:4.1f}x)  "
+                f"robots violations: {len(private)}  boilerplate leaks: {len(leaked)}  "
+                f"roster cards: {len(cards)}/{args.talents}"
+            )
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
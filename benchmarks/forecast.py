@@ -0,0 +1,68 @@
+"""
+Benchmark the vectorized log-normal view forecaster against per-channel
+scipy.stats.lognorm.fit and check that both give the same intervals.
+Run from the repository root:
+
+    python -m benchmarks.forecast --channels 5000
+"""
+import argparse
+import time
+
+import numpy as np
+from scipy import stats
+
+from src.tools.helper.forecast import forecast_views, rank_channels
+
+
+def synthetic_channels(n_channels: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return {
+        f"channel_{i}": rng.lognormal(rng.uniform(7, 14), rng.uniform(0.3, 1.5), size=rng.integers(3, 50)).round() + 1
+        for i in range(n_channels)
+    }
+
+
+def scipy_forecast(views, confidence_level: float):
+    alpha = 1.0 - confidence_level
+    bounds = []
+    for v in views:
+        shape, loc, scale = stats.lognorm.fit(v, floc=0)
+        bounds.append((
+            stats.lognorm.ppf(alpha / 2, shape, loc=loc, scale=scale),
+            stats.lognorm.ppf(1 - alpha / 2, shape, loc=loc, scale=scale)
+        ))
+    return np.array(bounds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--channels", type=int, default=5000)
+    parser.add_argument("--confidence-level", type=float, default=0.90)
+    args = parser.parse_args()
+
+    channels = synthetic_channels(args.channels)
+    views = list(channels.values())
+    print(f"{len(views)} channels, {sum(len(v) for v in views)} videos\n")
+
+    start = time.perf_counter()
+    reference = scipy_forecast(views, args.confidence_level)
+    scipy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = forecast_views(views, args.confidence_level)
+    vectorized_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rank_channels(channels, args.confidence_level, top_k=10)
+    rank_seconds = time.perf_counter() - start
+
+    bounds = np.stack([result["lower"], result["upper"]], axis=1)
+    rel_diff = np.abs(bounds - reference) / reference
+    print(f"{'scipy lognorm.fit':<22} {scipy_seconds * 1000:>10.1f} ms")
+    print(f"{'vectorized forecast':<22} {vectorized_seconds * 1000:>10.1f} ms  ({scipy_seconds / vectorized_seconds:.0f}x)")
+    print(f"{'rank channels':<22} {rank_seconds * 1000:>10.1f} ms")
+    print(f"\nmax relative difference of interval bounds: {rel_diff.max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare the parallel task-graph executor with running the same member tasks one at a
+time (what coordinate mode does), on the plan of a full creator evaluation with
+simulated member latencies. No API calls are made. Run from the repository root:
+
+    python -m benchmarks.parallel_team --scale 0.5
+
+Latencies are in seconds times --scale; the report task depends on every other branch.
+"""
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from src.tools.helper.parallel_team import ParallelTeamRunner, PlannedTask, dependency_levels
+
+# (task id, member, simulated seconds, dependencies)
+CREATOR_EVALUATION = [
+    ("channel", "channel_collector", 6.0, []),
+    ("stats", "video_statistics_specialist", 8.0, []),
+    ("risk", "risk_sentiment_analyzer", 14.0, []),
+    ("sponsors", "video_analysis_specialist", 11.0, []),
+    ("metrics", "metrics_calculator", 5.0, []),
+    ("report", "document_generator", 7.0, ["channel", "stats", "risk", "sponsors", "metrics"]),
+]
+
+
+class SimulatedMember:
+    def __init__(self, name: str, latencies: dict):
+        self.name = name
+        self.role = name
+        self.latencies = latencies
+
+    def deep_copy(self):
+        return self
+
+    async def arun(self, prompt: str):
+        await asyncio.sleep(self.latencies[prompt.split("\n", 1)[0]])
+        return SimpleNamespace(content=f"{self.name} result")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=0.5, help="multiplier on the simulated latencies")
+    parser.add_argument("--max-parallel", type=int, default=6)
+    args = parser.parse_args()
+
+    latencies = {task_id: seconds * args.scale for task_id, _, seconds, _ in CREATOR_EVALUATION}
+    members = {member for _, member, _, _ in CREATOR_EVALUATION}
+    team = SimpleNamespace(members=[SimulatedMember(name, latencies) for name in members], session_id=None)
+    tasks = [
+        PlannedTask(id=task_id, member=member, task=task_id, depends_on=deps)
+        for task_id, member, _, deps in CREATOR_EVALUATION
+    ]
+
+    sequential = sum(latencies.values())
+    critical_path = max(latencies[t] for t in latencies if t != "report") + latencies["report"]
+    print(f"{len(tasks)} tasks in {len(dependency_levels(tasks))} dependency levels")
+    print(f"sequential (coordinate mode): {sequential:6.2f} s")
+
+    for max_parallel in sorted({1, args.max_parallel}):
+        runner = ParallelTeamRunner(team, max_parallel=max_parallel)
+        start = time.perf_counter()
+        asyncio.run(runner.aexecute(tasks, "Evaluate the creator"))
+        seconds = time.perf_counter() - start
+        print(
+            f"parallel, {max_parallel} in flight:     {seconds:6.2f} s  "
+            f"({sequential / seconds:4.1f}x, critical path {critical_path:.2f} s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
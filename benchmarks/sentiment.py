@@ -0,0 +1,68 @@
+"""
+Benchmark the batch sentiment engine against plain TextBlob and check that the
+scores are identical. Run from the repository root:
+
+    python -m benchmarks.sentiment --comments comments.json
+
+`comments.json` is either a list of strings or the output of fetch_comments
+(a list of dicts with a "text" field). Without --comments a synthetic set is used.
+"""
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+from textblob import TextBlob
+
+from src.tools.helper.sentiment import check_against_textblob, sentiment_distribution, sentiment_scores
+
+SYNTHETIC_WORDS = (
+    "great video love this so much really amazing bad terrible worst content ever i think "
+    "you are the best thanks for sharing lol haha awesome very good nice music song not"
+).split()
+
+
+def load_comments(path: str, size: int):
+    if path:
+        with open(path) as f:
+            data = json.load(f)
+        return [c["text"] if isinstance(c, dict) else c for c in data]
+
+    rng = random.Random(0)
+    return [
+        " ".join(rng.choice(SYNTHETIC_WORDS) for _ in range(rng.randint(3, 25))) + rng.choice(["", "!", " :)", "?"])
+        for _ in range(size)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--comments", help="JSON file with comments (default: synthetic comments)")
+    parser.add_argument("--size", type=int, default=10000, help="Number of synthetic comments")
+    args = parser.parse_args()
+
+    texts = load_comments(args.comments, args.size)
+    print(f"{len(texts)} comments\n")
+
+    start = time.perf_counter()
+    reference = np.array([TextBlob(text).sentiment.polarity for text in texts])
+    textblob_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = sentiment_scores(texts)
+    summary = sentiment_distribution(scores)
+    engine_seconds = time.perf_counter() - start
+
+    print(f"TextBlob list comprehension: {textblob_seconds:8.3f}s")
+    print(f"Batch engine + distribution: {engine_seconds:8.3f}s  ({textblob_seconds / engine_seconds:.1f}x)")
+    print(f"Mean polarity: {summary['mean']:.6f} (TextBlob: {reference.mean():.6f})")
+
+    check = check_against_textblob(texts)
+    print(f"Identical to TextBlob: {check['identical']} (max |diff| = {check['max_abs_diff']:.3g})")
+    for mismatch in check["mismatches"]:
+        print(f"  {mismatch}")
+
+
+if __name__ == "__main__":
+    main()
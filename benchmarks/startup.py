@@ -0,0 +1,123 @@
+"""
+Measure process startup of the Streamlit (app.py) and FastAPI (whatsapp.py) entry
+points, and profile what an import costs module by module. Run from the repository
+root:
+
+    python -m benchmarks.startup --repeat 3
+    python -m benchmarks.startup --profile youtube_agent_team --top 25
+
+Each run starts a fresh interpreter. "ready" is the time until the entry module is
+imported (the page can render / the server can accept requests), "team" the time
+until the agent team is built, and "deferred" the heavy modules (torch, whisper, cv2,
+yt_dlp, firecrawl, ...) that are only imported when a tool first needs them; an
+eager startup pays ready + team + deferred before serving anything.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ENTRY_POINTS = ("whatsapp", "app")
+
+STARTUP_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import {entry}
+ready = time.perf_counter()
+from src.tools.helper.team_loader import get_youtube_team
+get_youtube_team()
+team = time.perf_counter()
+from src.tools.helper.lazy import load_all
+deferred = load_all()
+print(json.dumps({{
+    "ready": ready - start,
+    "team": team - ready,
+    "deferred": time.perf_counter() - team,
+    "modules": deferred
+}}))
+"""
+
+PROFILE_SCRIPT = """
+import {module}
+if {deferred}:
+    from src.tools.helper.lazy import load_all
+    load_all()
+"""
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *flags, "-c", code], capture_output=True, text=True)
+
+
+def measure_startup(entry: str) -> Dict:
+    result = run_python(STARTUP_SCRIPT.format(entry=entry))
+    if result.returncode != 0:
+        raise RuntimeError(f"{entry} failed to start:\n{result.stderr.strip().splitlines()[-1]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def profile_imports(module: str, deferred: bool = False) -> List[Tuple[str, int, int]]:
+    """
+    (module, self µs, cumulative µs) for every module imported by `import module`, from
+    the interpreter's -X importtime report.
+    """
+    result = run_python(PROFILE_SCRIPT.format(module=module, deferred=deferred), "-X", "importtime")
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def print_profile(module: str, top: int, deferred: bool) -> None:
+    rows = profile_imports(module, deferred)
+    total = sum(self_us for _, self_us, _ in rows)
+    print(f"import {module}{' + deferred modules' if deferred else ''}: {len(rows)} modules, {total / 1e6:.2f} s\n")
+
+    packages: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        packages[name.split(".")[0]] += self_us
+    print(f"{'package':<40} {'seconds':>8} {'share':>7}")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"{package:<40} {self_us / 1e6:8.3f} {self_us / total:7.1%}")
+
+    print(f"\n{'module':<60} {'self s':>8} {'cumul. s':>9}")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: -row[2])[:top]:
+        print(f"{name:<60} {self_us / 1e6:8.3f} {cumulative_us / 1e6:9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entry", nargs="+", default=list(ENTRY_POINTS), help="entry modules to start")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--profile", metavar="MODULE", help="print the per-module import cost of MODULE instead")
+    parser.add_argument("--deferred", action="store_true", help="with --profile, also import the lazily loaded modules")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.profile:
+        print_profile(args.profile, args.top, args.deferred)
+        return
+
+    for entry in args.entry:
+        runs = [measure_startup(entry) for _ in range(args.repeat)]
+        ready = statistics.median(r["ready"] for r in runs)
+        team = statistics.median(r["team"] for r in runs)
+        deferred = statistics.median(r["deferred"] for r in runs)
+        print(
+            f"{entry:<10} ready {ready:6.2f} s  team {team:6.2f} s  deferred {deferred:6.2f} s  "
+            f"(eager startup {ready + team + deferred:6.2f} s, {(ready + team + deferred) / ready:4.1f}x)"
+        )
+        for module, seconds in sorted(runs[-1]["modules"].items(), key=lambda item: -item[1]):
+            print(f"{'':<10} {module:<24} {seconds:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
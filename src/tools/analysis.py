@@ -1,7 +1,7 @@
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from typing import Annotated
 from agno.tools import tool
-from src.tools.helper.helper import _predict_next_video_views
+from src.tools.helper.helper import _predict_next_video_views, _rank_channels_by_expected_views
 
 @tool(
     name="predict_next_video_views",
@@ -50,4 +50,59 @@ def predict_next_video_views(
     Raises:
         ValueError: if list is empty, contains non‑positive values, or invalid `interval_type`
     """
-    return _predict_next_video_views(historical_views, confidence_level, interval_type)
\ No newline at end of file
+    return _predict_next_video_views(historical_views, confidence_level, interval_type)
+
+@tool(
+    name="rank_channels_by_expected_views",
+    description="Rank several YouTube channels by the forecast view count of their next video.",
+    show_result=True,
+    cache_results=True,
+    cache_ttl=3600,
+    cache_dir="/tmp/agno_cache"
+)
+def rank_channels_by_expected_views(
+    channel_ids: Annotated[List[str], """
+        The channels to compare: channel IDs, @handles, channel URLs or channel names.
+        Example: ["@MrBeast", "UCX6OQ3DkcsbYNE6H8uQQuVA", "Veritasium"]
+    """],
+    max_results: Annotated[int, """
+        Number of recent videos per channel used for the forecast.
+        Default: 10
+    """] = 10,
+    months: Annotated[int, """
+        Only videos published within this many months are used.
+        Default: 6
+    """] = 6,
+    confidence_level: Annotated[float, """
+        Coverage of the two-sided prediction interval reported per channel.
+        Must be between 0 and 1. Default is 0.90 (90% confidence).
+    """] = 0.90,
+    half_life_days: Annotated[Optional[float], """
+        If set, recent videos weigh more: a video this many days older counts half as much.
+        Example: 30. Default: None (all videos weigh the same)
+    """] = None,
+    top_k: Annotated[int, """
+        Number of channels to return.
+        Default: 10
+    """] = 10
+) -> Dict[str, Any]:
+    """
+    Fetch recent video statistics for every channel, fit a log-normal model to each channel's
+    view counts in one vectorized pass and rank the channels by forecast median views.
+
+    Args:
+        channel_ids (List[str]): Channel IDs, handles, URLs or names
+        max_results (int): Recent videos per channel (default: 10)
+        months (int): Look-back window in months (default: 6)
+        confidence_level (float): Coverage of the prediction interval (default 0.90)
+        half_life_days (Optional[float]): Recency half-life in days (default: None)
+        top_k (int): Number of channels to return (default: 10)
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - ranking: Channels ordered by forecast views, each with channel_id, rank, videos,
+              median (expected views, the number to price on), expected (log-normal mean),
+              lower and upper (prediction interval bounds)
+            - skipped: Channels that could not be forecast, with the reason
+    """
+    return _rank_channels_by_expected_views(channel_ids, max_results, months, confidence_level, half_life_days, top_k)
@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Annotated
+from agno.tools import tool
+from src.tools.helper.helper import _channel_report_data
+from src.tools.helper.channel_reports import channel_report_markdown, summary_markdown
+from src.tools.document_output import ReportProcessor, collect_report_garbage, publish_report
+
+# Reports rendered and uploaded at once
+REPORT_WORKERS = int(os.getenv("REPORT_WORKERS", "8"))
+
+@tool(
+    name="generate_channel_reports",
+    description="Generate one .docx report per YouTube channel plus a combined comparison report for many channels at once, and return their URLs.",
+    show_result=True
+)
+def generate_channel_reports(
+    channel_ids: Annotated[List[str], """
+        The channels to report on: channel IDs, @handles, channel URLs or channel names.
+        Example: ["@MrBeast", "UCX6OQ3DkcsbYNE6H8uQQuVA"]
+    """],
+    max_results: Annotated[int, """
+        Number of recent videos (longer than 3 minutes) each report is based on.
+        Default: 10
+    """] = 10,
+    months: Annotated[int, """
+        Only videos published within this many months are used.
+        Default: 6
+    """] = 6,
+    confidence_level: Annotated[float, """
+        Coverage of the confidence bands and the views forecast interval.
+        Default: 0.90
+    """] = 0.90
+) -> Dict[str, Any]:
+    """
+    Build a comparison pack for a shortlist of creators in one call: channel data is fetched
+    in bulk, then every channel report and the combined summary are rendered and uploaded
+    concurrently.
+
+    Args:
+        channel_ids (List[str]): Channel IDs, @handles, URLs or names
+        max_results (int): Recent videos per channel (default: 10)
+        months (int): Look-back window in months (default: 6)
+        confidence_level (float): Coverage of the bands (default: 0.90)
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - summary: URL of the combined comparison report
+            - reports: List of channel_id, title and url for every channel report
+            - skipped: Channels that could not be reported on, with the reason
+    """
+    data = _channel_report_data(channel_ids, max_results, months, confidence_level)
+    channels = data["channels"]
+    documents = [summary_markdown(channels, data["skipped"])] + [channel_report_markdown(c) for c in channels]
+
+    processor = ReportProcessor()
+    collect_report_garbage(processor)
+    with ThreadPoolExecutor(max_workers=max(1, min(REPORT_WORKERS, len(documents)))) as executor:
+        urls = list(executor.map(lambda text: publish_report(text, processor=processor), documents))
+
+    return {
+        "summary": urls[0],
+        "reports": [
+            {"channel_id": c["info"]["id"], "title": c["info"]["title"], "url": url}
+            for c, url in zip(channels, urls[1:])
+        ],
+        "skipped": data["skipped"],
+    }
@@ -1,44 +1,49 @@
 import os
-from openai import OpenAI
+import ast
+import json
+import uuid
+import threading
+import unicodedata
+from io import BytesIO
+from urllib.parse import quote
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 from agno.tools import tool
 from typing import Annotated
 import re
 
+from src.tools.helper.clients import get_openai_client, get_s3_client
+from src.tools.helper.markdown_docx import is_structured, render_markdown, sanitize_text
+from src.tools.helper.report_store import get_report_manifest, report_digest
+
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+# Reports above 8 MB are uploaded in parallel multipart chunks
+UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True
+)
+
 class ReportProcessor:
     def __init__(self):
         load_dotenv()
-        self.api_key = os.getenv("OPENAI_API_KEY")
         self.s3_bucket = os.getenv("S3_BUCKET_NAME")
-        self.client = OpenAI(api_key=self.api_key)
-        self.s3 = boto3.client(
-            "s3",
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name="eu-north-1",
-            config=boto3.session.Config(
-                signature_version="s3v4",
-                region_name="eu-north-1"
-            )
-        )
+        # Process-wide clients: warm connection pools, credentials resolved once
+        self.client = get_openai_client()
+        self.s3 = get_s3_client()
+        self.manifest = get_report_manifest()
 
     def extract_structure(self, report_text):
-        # Sanitize the input text to remove non-XML compatible characters
-        def sanitize_text(text):
-            # Remove NULL bytes and control characters
-            text = ''.join(char for char in text if ord(char) >= 32 or char in "\n\r\t")
-            # Replace any remaining problematic characters with spaces
-            text = "".join(char if ord(char) < 0x10000 else " " for char in text)
-            return text
-
+        # LLM restructuring, only used for text without markdown structure
         sanitized_text = sanitize_text(report_text)
 
         system_prompt = """
         You are an expert at document structuring. Given an unstructured or semi-structured report,
-        extract the following in a dictionary format:
+        extract the following as a JSON object:
         {
           "title": "Document Title",
           "sections": [
@@ -52,7 +57,7 @@ class ReportProcessor:
             ...
           ]
         }
-        Keep the content concise and usable in a Word document.
+        Keep the content concise and usable in a Word document. Reply with the JSON object only.
         """
 
         response = self.client.chat.completions.create(
@@ -62,9 +67,9 @@ class ReportProcessor:
                 {"role": "user", "content": sanitized_text},
             ],
         )
-        return eval(response.choices[0].message.content)
+        return parse_structure(response.choices[0].message.content)
 
-    def create_document(self, structure_dict, output_path="structured_report.docx"):
+    def build_document(self, structure_dict):
         doc = Document()
 
         # Add title
@@ -79,20 +84,10 @@ class ReportProcessor:
                     content,
                     style="List Bullet" if content.startswith("*") else "Normal",
                 )
+        return doc
 
-        # Save locally
-        doc.save(output_path)
-
-        # Upload to S3
-        s3_key = os.path.basename(output_path)
-        self.s3.upload_file(output_path, self.s3_bucket, s3_key)
-
-        # Delete local file after successful upload
-        if os.path.exists(output_path):
-            os.remove(output_path)
-
-        # Generate presigned URL
-        url = self.s3.generate_presigned_url(
+    def presign(self, s3_key):
+        return self.s3.generate_presigned_url(
             "get_object",
             Params={
                 "Bucket": self.s3_bucket,
@@ -101,25 +96,115 @@ class ReportProcessor:
             ExpiresIn=3600,
         )
 
+    def reuse_report(self, digest):
+        # An identical report uploaded earlier only needs a fresh presigned URL
+        entry = self.manifest.get(digest)
+        if entry is None or entry["bucket"] != self.s3_bucket:
+            return None
+        try:
+            self.s3.head_object(Bucket=self.s3_bucket, Key=entry["s3_key"])
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                self.manifest.remove([digest])
+                return None
+            raise
+        self.manifest.touch(digest)
+        return self.presign(entry["s3_key"])
+
+    def upload_document(self, doc, filename="structured_report.docx", digest=None, title=None):
+        # Render in memory and stream to S3; nothing touches the local disk
+        buffer = BytesIO()
+        doc.save(buffer)
+        size = buffer.tell()
+        buffer.seek(0)
+
+        # Content-addressed keys let identical reports share one object; otherwise a unique
+        # prefix keeps simultaneous reports with the same title apart
+        s3_key = f"reports/{digest}/{filename}" if digest else f"{uuid.uuid4().hex}/{filename}"
+        self.s3.upload_fileobj(
+            buffer,
+            self.s3_bucket,
+            s3_key,
+            ExtraArgs={
+                "ContentType": DOCX_CONTENT_TYPE,
+                "ContentDisposition": content_disposition(filename),
+            },
+            Config=UPLOAD_CONFIG,
+        )
+        if digest:
+            self.manifest.record(digest, self.s3_bucket, s3_key, title, size)
+
+        return self.presign(s3_key)
+
+    def create_document(self, structure_dict, filename="structured_report.docx"):
+        return self.upload_document(self.build_document(structure_dict), filename)
+
+def parse_structure(content):
+    """
+    Parse the model's title/sections answer as JSON (or a Python literal), never executing it.
+    """
+    match = re.search(r"\{.*\}", content, re.DOTALL)
+    if not match:
+        raise ValueError("Document structure response contains no object")
+    try:
+        structure = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        structure = ast.literal_eval(match.group(0))
+    if not isinstance(structure, dict) or "title" not in structure or not isinstance(structure.get("sections"), list):
+        raise ValueError("Document structure response is missing title or sections")
+    return structure
+
+def content_disposition(filename):
+    # S3 metadata headers must be Latin-1: ASCII fallback plus the UTF-8 name (RFC 6266 / 5987)
+    stem, ext = os.path.splitext(filename)
+    ascii_stem = unicodedata.normalize("NFKD", stem).encode("ascii", "ignore").decode("ascii")
+    ascii_stem = re.sub(r'[^\w-]', '', ascii_stem).strip('-_') or 'report'
+    header = f'attachment; filename="{ascii_stem}{ext}"'
+    if f"{ascii_stem}{ext}" != filename:
+        header += f"; filename*=UTF-8''{quote(filename, safe='')}"
+    return header
+
+def safe_filename(title):
+    # Remove special characters and replace spaces with underscores
+    safe_title = re.sub(r'[^\w\s-]', '', title)
+    safe_title = re.sub(r'[-\s]+', '_', safe_title).strip('-_')
+    return f"{safe_title or 'report'}.docx"
+
+def publish_report(report_text, restructure=False, processor=None):
+    """
+    Render a report and return a presigned URL. Identical reports reuse the uploaded object.
+    """
+    processor = processor or ReportProcessor()
+    use_model = restructure or not is_structured(report_text)
+    digest = report_digest(report_text, "restructured" if use_model else "markdown")
+    url = processor.reuse_report(digest)
+    if url:
         return url
 
+    if use_model:
+        structured_data = processor.extract_structure(report_text)
+        title = structured_data["title"]
+        doc = processor.build_document(structured_data)
+    else:
+        # Well-formed markdown is laid out locally, without a model call
+        title, doc = render_markdown(report_text)
+
+    return processor.upload_document(doc, safe_filename(title), digest, title)
+
+def collect_report_garbage(processor):
+    # Expired reports are removed in the background, at most once an hour
+    threading.Thread(target=processor.manifest.collect_garbage, args=(processor.s3,), daemon=True).start()
+
 @tool(
     name="generate_structured_document",
     description="Generate a structured .docx document from user-provided content and return a URL to the file.",
-    show_result=True,
-    cache_results=True,
-    cache_ttl=1800
+    show_result=True
 )
-def Document_Output(report_text: Annotated[str, 'Provide the full content required to generate the document']):
+def Document_Output(
+    report_text: Annotated[str, 'Provide the full content required to generate the document, as markdown (# headings, - bullets, | tables |, **bold**)'],
+    restructure: Annotated[bool, 'Let the language model reorganise the content into sections first. Only needed for unstructured text; markdown is laid out as written.'] = False
+):
     processor = ReportProcessor()
-    structured_data = processor.extract_structure(report_text)
-    
-    # Generate filename from title
-    title = structured_data["title"]
-    # Remove special characters and replace spaces with underscores
-    safe_title = re.sub(r'[^\w\s-]', '', title)
-    safe_title = re.sub(r'[-\s]+', '_', safe_title).strip('-_')
-    filename = f"{safe_title}.docx"
-    
-    url = processor.create_document(structured_data, filename)
+    collect_report_garbage(processor)
+    url = publish_report(report_text, restructure, processor)
     return {'result': f"url of report -> {url}"}
\ No newline at end of file
@@ -0,0 +1,154 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# SQLite file holding crawled agency pages, their content hashes and extracted talents
+AGENCY_STORE_PATH = os.getenv("AGENCY_STORE_PATH", "/tmp/brandview/agencies.sqlite3")
+# Consecutive page-limited crawls a page may be missing from before it counts as removed
+AGENCY_PAGE_MAX_MISSES = int(os.getenv("AGENCY_PAGE_MAX_MISSES", "3"))
+
+
+def agency_key(agency_url: str) -> str:
+    """
+    Store key of an agency: its host without "www.", so http/https and path variants share one record.
+    """
+    host = urlsplit(agency_url if "//" in agency_url else f"https://{agency_url}").netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class AgencyStore:
+    """
+    Persistent per-agency page store, so a recrawl only re-extracts pages that changed.
+
+    Tables:
+        pages     (agency, url) → content hash, last time the page was seen, consecutive crawls
+                  that missed it and the roster extracted from it
+        rosters   agency → merged roster of the last crawl, the baseline for roster diffs
+    """
+
+    def __init__(self, path: str = AGENCY_STORE_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    agency TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    last_seen REAL NOT NULL,
+                    roster TEXT NOT NULL,
+                    missed INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (agency, url)
+                );
+                CREATE TABLE IF NOT EXISTS rosters (
+                    agency TEXT PRIMARY KEY,
+                    crawled_at REAL NOT NULL,
+                    roster TEXT NOT NULL
+                );
+            """)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(pages)")}
+            if "missed" not in columns:
+                self._conn.execute("ALTER TABLE pages ADD COLUMN missed INTEGER NOT NULL DEFAULT 0")
+
+    def page_records(self, agency: str) -> Dict[str, Tuple[str, Dict]]:
+        """
+        url → (content hash, roster) of every stored page of an agency.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, content_hash, roster FROM pages WHERE agency = ?", (agency,)
+            ).fetchall()
+        return {url: (digest, json.loads(roster)) for url, digest, roster in rows}
+
+    def update_pages(
+        self,
+        agency: str,
+        extracted: Dict[str, Tuple[str, Dict]],
+        seen: List[str],
+        drop_missing: bool = True,
+        exhaustive: bool = True,
+        max_misses: int = AGENCY_PAGE_MAX_MISSES
+    ) -> int:
+        """
+        Store the rosters of (re-)extracted pages, mark every seen page as current and drop
+        pages that are no longer on the site. Returns the number of dropped pages.
+
+        Pass drop_missing=False after an incomplete crawl, where unseen pages may simply not
+        have been reached. After a crawl that stopped at its page limit (exhaustive=False) the
+        crawl order decides which pages were reached, so an unseen page is only dropped once
+        `max_misses` consecutive crawls missed it.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages (agency, url, content_hash, last_seen, roster, missed) VALUES (?, ?, ?, ?, ?, 0)",
+                [(agency, url, digest, now, json.dumps(roster)) for url, (digest, roster) in extracted.items()]
+            )
+            self._conn.executemany(
+                "UPDATE pages SET last_seen = ?, missed = 0 WHERE agency = ? AND url = ?",
+                [(now, agency, url) for url in seen]
+            )
+            if not drop_missing:
+                return 0
+            # Every seen page now carries this crawl's timestamp; anything older was not reached
+            if exhaustive:
+                return self._conn.execute(
+                    "DELETE FROM pages WHERE agency = ? AND last_seen < ?", (agency, now)
+                ).rowcount
+            self._conn.execute(
+                "UPDATE pages SET missed = missed + 1 WHERE agency = ? AND last_seen < ?", (agency, now)
+            )
+            dropped = self._conn.execute(
+                "DELETE FROM pages WHERE agency = ? AND last_seen < ? AND missed >= ?", (agency, now, max_misses)
+            ).rowcount
+        return dropped
+
+    def page_rosters(self, agency: str) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT roster FROM pages WHERE agency = ? ORDER BY url", (agency,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def roster(self, agency: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT roster FROM rosters WHERE agency = ?", (agency,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_roster(self, agency: str, roster: Dict) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rosters (agency, crawled_at, roster) VALUES (?, ?, ?)",
+                (agency, time.time(), json.dumps(roster))
+            )
+
+
+_store: Optional[AgencyStore] = None
+_store_lock = threading.Lock()
+
+
+def get_agency_store() -> AgencyStore:
+    """
+    Return the process-wide agency store, opening the database on first use.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = AgencyStore()
+    return _store
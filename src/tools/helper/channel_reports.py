@@ -0,0 +1,108 @@
+from typing import Dict, List, Optional
+
+# Recent videos listed in a channel report
+REPORT_VIDEO_ROWS = 10
+
+
+def _number(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value:,.0f}"
+
+
+def _percent(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value * 100:.2f}%"
+
+
+def _cell(text: str) -> str:
+    return " ".join(str(text).split()).replace("|", "\\|")
+
+
+def videos_table(videos: List[Dict], rows: int = REPORT_VIDEO_ROWS) -> List[str]:
+    """
+    Markdown table lines of `_fetch_video_statistics` output, newest first.
+    """
+    lines = [
+        "| Published | Video | Views | Likes | Comments | Minutes |",
+        "|---|---|---:|---:|---:|---:|",
+    ]
+    for video in videos[:rows]:
+        lines.append(
+            f"| {video['publishedAt'][:10]} | https://youtu.be/{video['videoId']} | {_number(video['viewCount'])} "
+            f"| {_number(video['likeCount'])} | {_number(video['commentCount'])} | {video['durationMinutes']:.1f} |"
+        )
+    return lines
+
+
+def channel_report_markdown(channel: Dict) -> str:
+    """
+    Markdown report of one channel from `_channel_report_data`: overview, performance with
+    confidence bands and the recent videos.
+    """
+    info, metrics, forecast = channel["info"], channel["metrics"], channel["forecast"]
+    views, engagement = metrics["expected_views"], metrics["engagement_rate"]
+    confidence = f"{forecast['confidence_level'] * 100:.0f}%"
+    description = " ".join(info["description"].split())
+
+    lines = [
+        f"# Channel Report: {info['title']}",
+        "",
+        "## Overview",
+        "| Metric | Value |",
+        "|---|---|",
+        f"| Channel ID | {info['id']} |",
+        f"| Subscribers | {_number(info['subscriberCount'])} |",
+        f"| Total views | {_number(info['viewCount'])} |",
+        f"| Videos | {_number(info['videoCount'])} |",
+    ]
+    if description:
+        lines += ["", f"> {description[:400]}{'…' if len(description) > 400 else ''}"]
+
+    lines += [
+        "",
+        "## Performance",
+        f"Based on the last {metrics['videos']} videos longer than 3 minutes.",
+        "",
+        f"- **Median views per video:** {_number(views['value'])} ({confidence} band {_number(views['low'])} – {_number(views['high'])})",
+        f"- **Next video forecast:** {_number(forecast['median'])} views "
+        f"({confidence} interval {_number(forecast['lower'])} – {_number(forecast['upper'])})",
+        f"- **Median engagement rate:** {_percent(engagement['value'])} "
+        f"(band {_percent(engagement['low'])} – {_percent(engagement['high'])})",
+        f"- **Median likes / comments:** {_number(metrics['median_likes'])} / {_number(metrics['median_comments'])}",
+        "",
+        "## Recent Videos",
+        *videos_table(channel["videos"]),
+    ]
+    return "\n".join(lines)
+
+
+def summary_markdown(channels: List[Dict], skipped: Optional[Dict[str, str]] = None) -> str:
+    """
+    Combined comparison of all channels, ranked by forecast views of the next video.
+    """
+    ranked = sorted(channels, key=lambda c: c["forecast"]["median"], reverse=True)
+    lines = [
+        f"# Channel Comparison ({len(ranked)} channels)",
+        "",
+        "## Ranking",
+        "| # | Channel | Subscribers | Median views | Next video forecast | Engagement rate |",
+        "|---:|---|---:|---:|---|---:|",
+    ]
+    for rank, channel in enumerate(ranked, 1):
+        info, metrics, forecast = channel["info"], channel["metrics"], channel["forecast"]
+        lines.append(
+            f"| {rank} | {_cell(info['title'])} | {_number(info['subscriberCount'])} "
+            f"| {_number(metrics['expected_views']['value'])} "
+            f"| {_number(forecast['median'])} ({_number(forecast['lower'])} – {_number(forecast['upper'])}) "
+            f"| {_percent(metrics['engagement_rate']['value'])} |"
+        )
+    if ranked:
+        top_engagement = max(ranked, key=lambda c: c["metrics"]["engagement_rate"]["value"] or 0)
+        lines += [
+            "",
+            "## Highlights",
+            f"- **Highest forecast views:** {ranked[0]['info']['title']}",
+            f"- **Highest engagement rate:** {top_engagement['info']['title']}",
+        ]
+    if skipped:
+        lines += ["", "## Not Included"]
+        lines += [f"- **{identifier}:** {reason}" for identifier, reason in skipped.items()]
+    return "\n".join(lines)
@@ -0,0 +1,58 @@
+import os
+import logging
+import threading
+from typing import Optional
+
+import boto3
+from botocore.config import Config
+from dotenv import load_dotenv
+from openai import OpenAI
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+S3_REGION = "eu-north-1"
+# Connections kept open to S3; multipart uploads and concurrent reports share them
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "20"))
+
+_openai_client: Optional[OpenAI] = None
+_s3_client = None
+_clients_lock = threading.Lock()
+
+
+def get_openai_client() -> OpenAI:
+    """
+    Return the process-wide OpenAI client. Its HTTP connection pool is reused across calls.
+    """
+    global _openai_client
+    if _openai_client is None:
+        with _clients_lock:
+            if _openai_client is None:
+                load_dotenv()
+                _openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _openai_client
+
+
+def get_s3_client():
+    """
+    Return the process-wide S3 client. Credentials are resolved once and the client is
+    thread-safe, so every report and upload thread shares its connection pool.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _clients_lock:
+            if _s3_client is None:
+                load_dotenv()
+                _s3_client = boto3.client(
+                    "s3",
+                    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                    region_name=S3_REGION,
+                    config=Config(
+                        signature_version="s3v4",
+                        region_name=S3_REGION,
+                        max_pool_connections=S3_MAX_POOL_CONNECTIONS
+                    )
+                )
+    return _s3_client
@@ -0,0 +1,111 @@
+import os
+import logging
+import threading
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from src.tools.helper.lazy import lazy_import
+from src.tools.helper.models import CLIP_MODEL_NAME, get_clip, get_model
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+torch = lazy_import("torch")
+
+# Intra-op threads used by torch for CLIP inference (0 = one per CPU core)
+CLIP_NUM_THREADS = int(os.getenv("CLIP_NUM_THREADS", "0"))
+
+# Image-encoder backend: "torch" (fp32 eager), "int8" (dynamic quantization) or "onnx" (ONNX Runtime)
+CLIP_BACKEND = os.getenv("CLIP_BACKEND", "torch")
+
+_threads_configured = False
+_threads_lock = threading.Lock()
+
+
+def _configure_threads() -> None:
+    """
+    Pin torch to one intra-op thread per core and a single inter-op thread.
+    Runs once per process, before the first forward pass.
+    """
+    global _threads_configured
+    if _threads_configured:
+        return
+    with _threads_lock:
+        if _threads_configured:
+            return
+        num_threads = CLIP_NUM_THREADS or os.cpu_count() or 1
+        torch.set_num_threads(num_threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Inter-op pool is already running (e.g. another module used torch first)
+            pass
+        logger.info(f"CLIP inference using {num_threads} intra-op threads")
+        _threads_configured = True
+
+
+@lru_cache(maxsize=64)
+def _encode_prompt_set(prompts: Tuple[str, ...]) -> "torch.Tensor":
+    model, processor = get_clip()
+    _configure_threads()
+    with torch.inference_mode():
+        inputs = processor(text=list(prompts), return_tensors="pt", padding=True)
+        txt_feats = model.get_text_features(inputs["input_ids"], attention_mask=inputs["attention_mask"])
+        return txt_feats / txt_feats.norm(dim=-1, keepdim=True)
+
+
+def encode_prompts(prompts: Sequence[str]) -> "torch.Tensor":
+    """
+    Return L2-normalized text embeddings for a prompt set, shape (N_prompts, D).
+    Each distinct prompt set goes through the text tower only once per process.
+    """
+    if not prompts:
+        raise ValueError("Prompt list cannot be empty")
+    return _encode_prompt_set(tuple(prompts))
+
+
+def preprocess_images(images: List[Image.Image]) -> "torch.Tensor":
+    """
+    Resize, crop and normalize images into CLIP pixel values, shape (N_images, 3, H, W).
+    Pure CPU work that can run in a worker pool ahead of the forward pass.
+    """
+    _, processor = get_clip()
+    return processor(images=images, return_tensors="pt")["pixel_values"]
+
+
+def get_image_backend(name: Optional[str] = None):
+    """
+    Return the shared image-encoder backend `name` (default: CLIP_BACKEND), building it on first use.
+    """
+    name = name or CLIP_BACKEND
+
+    def _load():
+        from src.tools.helper.clip_backends import create_backend
+
+        model, _ = get_clip()
+        _configure_threads()
+        return create_backend(name, model)
+
+    return get_model(f"{CLIP_MODEL_NAME}:image:{name}", _load)
+
+
+def encode_pixel_values(pixel_values: "torch.Tensor", backend: Optional[str] = None) -> "torch.Tensor":
+    """
+    Return L2-normalized image embeddings for already preprocessed pixel values.
+    """
+    encoder = get_image_backend(backend)
+    _configure_threads()
+    with torch.inference_mode():
+        img_feats = encoder.encode(pixel_values)
+        return img_feats / img_feats.norm(dim=-1, keepdim=True)
+
+
+def encode_images(images: List[Image.Image], backend: Optional[str] = None) -> "torch.Tensor":
+    """
+    Return L2-normalized image embeddings, shape (N_images, D), from a single
+    image-tower pass under inference mode.
+    """
+    return encode_pixel_values(preprocess_images(images), backend)
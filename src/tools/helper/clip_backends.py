@@ -0,0 +1,115 @@
+import os
+import logging
+from typing import Any
+
+import torch
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Where the exported ONNX image encoder is cached between runs
+CLIP_ONNX_PATH = os.getenv("CLIP_ONNX_PATH", "/tmp/brandview/clip_vision.onnx")
+
+BACKENDS = ("torch", "int8", "onnx")
+
+
+class _ImageEncoder(torch.nn.Module):
+    """
+    The CLIP image tower plus projection, i.e. `CLIPModel.get_image_features` as a module.
+    """
+
+    def __init__(self, model: Any):
+        super().__init__()
+        self.vision_model = model.vision_model
+        self.visual_projection = model.visual_projection
+
+    def forward(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        pooled_output = self.vision_model(pixel_values=pixel_values).pooler_output
+        return self.visual_projection(pooled_output)
+
+
+class TorchBackend:
+    """
+    Eager fp32 PyTorch inference (the reference implementation).
+    """
+    name = "torch"
+
+    def __init__(self, model: Any):
+        self.encoder = _ImageEncoder(model).eval()
+
+    def encode(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        with torch.inference_mode():
+            return self.encoder(pixel_values)
+
+
+class QuantizedBackend(TorchBackend):
+    """
+    Dynamic int8 quantization of every Linear layer in the image tower.
+    Weights are quantized once at load time; activations are quantized on the fly.
+    """
+    name = "int8"
+
+    def __init__(self, model: Any):
+        encoder = _ImageEncoder(model).eval()
+        self.encoder = torch.ao.quantization.quantize_dynamic(encoder, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class OnnxBackend:
+    """
+    ONNX Runtime CPU inference on an exported image tower graph.
+    The graph is exported on first use and reused from CLIP_ONNX_PATH afterwards.
+    """
+    name = "onnx"
+
+    def __init__(self, model: Any, path: str = CLIP_ONNX_PATH):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ImportError("The onnx CLIP backend requires onnxruntime: pip install onnxruntime") from e
+
+        if not os.path.exists(path):
+            self._export(model, path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = torch.get_num_threads()
+        self.session = ort.InferenceSession(path, sess_options=options, providers=["CPUExecutionProvider"])
+
+    @staticmethod
+    def _export(model: Any, path: str) -> None:
+        logger.info(f"Exporting CLIP image encoder to {path}…")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        encoder = _ImageEncoder(model).eval()
+        size = model.config.vision_config.image_size
+        dummy = torch.zeros(1, 3, size, size)
+        tmp_path = f"{path}.tmp"
+        with torch.no_grad():
+            torch.onnx.export(
+                encoder,
+                (dummy,),
+                tmp_path,
+                input_names=["pixel_values"],
+                output_names=["image_embeds"],
+                dynamic_axes={"pixel_values": {0: "batch"}, "image_embeds": {0: "batch"}},
+                opset_version=17
+            )
+        # Rename at the end so a crashed export never leaves a truncated graph behind
+        os.replace(tmp_path, path)
+
+    def encode(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        outputs = self.session.run(None, {"pixel_values": pixel_values.numpy()})
+        return torch.from_numpy(outputs[0])
+
+
+def create_backend(name: str, model: Any):
+    """
+    Build the image-encoder backend called `name` ("torch", "int8" or "onnx") for a CLIP model.
+    """
+    if name == "torch":
+        return TorchBackend(model)
+    if name == "int8":
+        return QuantizedBackend(model)
+    if name == "onnx":
+        return OnnxBackend(model)
+    raise ValueError(f"Unknown CLIP backend '{name}'. Valid values are: {', '.join(BACKENDS)}")
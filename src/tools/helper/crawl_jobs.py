@@ -0,0 +1,278 @@
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from src.tools.helper.lazy import lazy_import
+from src.tools.helper.crawler import LocalCrawlJob
+from src.tools.helper.agency_store import agency_key, content_hash, get_agency_store
+from src.tools.helper.talent_extraction import merge_rosters, page_text, page_url, roster_diff
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+firecrawl = lazy_import("firecrawl")
+
+# "firecrawl" (hosted) or "local" (built-in asyncio crawler, no API key needed)
+CRAWLER_BACKEND = os.getenv("CRAWLER_BACKEND", "firecrawl")
+# Seconds between status polls of a running crawl
+CRAWL_POLL_SECONDS = float(os.getenv("CRAWL_POLL_SECONDS", "2"))
+# Crawls still running after this many seconds are cancelled and finished with the pages they have
+CRAWL_JOB_TIMEOUT = int(os.getenv("CRAWL_JOB_TIMEOUT", "600"))
+# Finished jobs stay available to status queries for this long
+CRAWL_JOB_RETENTION_SECONDS = 3600
+
+FINAL_STATUSES = ("completed", "failed", "cancelled", "timed_out")
+
+# Turns crawled pages into one roster per page (None where extraction failed)
+PageExtractor = Callable[[List[Any]], List[Optional[Dict]]]
+
+
+class FirecrawlJob:
+    """
+    A Firecrawl crawl behind the start/poll/cancel interface shared with LocalCrawlJob.
+    """
+
+    def __init__(self):
+        self.app = firecrawl.FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
+        self.job_id: Optional[str] = None
+
+    def start(self, url: str, limit: int) -> "FirecrawlJob":
+        response = self.app.async_crawl_url(
+            url,
+            limit=limit,
+            scrape_options=firecrawl.ScrapeOptions(
+                formats=['markdown', 'html'],
+                onlyMainContent=True,
+                excludeTags=['script', 'style', 'nav', 'footer', 'header']
+            )
+        )
+        if not getattr(response, "id", None):
+            raise Exception(f"Firecrawl did not accept the crawl of {url}")
+        self.job_id = response.id
+        return self
+
+    def poll(self) -> Tuple[str, Optional[int], List[Any]]:
+        """
+        (status, total pages if known, pages crawled so far). Every poll returns all pages so far.
+        """
+        crawl_status = self.app.check_crawl_status(self.job_id)
+        return (
+            getattr(crawl_status, "status", None) or "scraping",
+            getattr(crawl_status, "total", None),
+            getattr(crawl_status, "data", None) or [],
+        )
+
+    def cancel(self) -> None:
+        self.app.cancel_crawl(self.job_id)
+
+
+def open_crawl(url: str, limit: int, backend: str = CRAWLER_BACKEND) -> Union[FirecrawlJob, LocalCrawlJob]:
+    """
+    Start a crawl on the configured backend.
+    """
+    if backend == "firecrawl":
+        return FirecrawlJob().start(url, limit)
+    if backend == "local":
+        return LocalCrawlJob().start(url, limit)
+    raise ValueError(f"Unknown crawler backend: {backend} (expected 'firecrawl' or 'local')")
+
+
+class TalentCrawlJob:
+    """
+    One asynchronous crawl of an agency site. A background thread polls the crawl and
+    extracts every batch of newly crawled pages while the crawl continues, so partial rosters
+    are available long before the crawl finishes. Unchanged pages reuse their stored rosters.
+    """
+
+    def __init__(self, agency_url: str, limit: int, extract_pages: PageExtractor, backend: str = CRAWLER_BACKEND):
+        self.agency_url = agency_url
+        self.limit = limit
+        self.backend = backend
+        self.agency = agency_key(agency_url)
+        self.job_id: Optional[str] = None
+        self.status = "submitting"
+        self.error: Optional[str] = None
+        self.pages_total: Optional[int] = None
+        self.finished_at: Optional[float] = None
+
+        self._extract_pages = extract_pages
+        self._store = get_agency_store()
+        self._known = self._store.page_records(self.agency)
+        self._previous = self._store.roster(self.agency)
+        self._hashes: Dict[str, str] = {}                     # url → content hash of every crawled page
+        self._rosters: Dict[str, Dict] = {}                   # url → roster, extracted now or reused
+        self._extracted: Dict[str, Tuple[str, Dict]] = {}     # url → (hash, roster) to store
+        self._failed = 0
+        self._result: Optional[Dict] = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def start(self) -> "TalentCrawlJob":
+        crawl = open_crawl(self.agency_url, self.limit, self.backend)
+        self.job_id = crawl.job_id
+        self.status = "scraping"
+        threading.Thread(target=self._run, args=(crawl,), daemon=True, name=f"crawl-{self.agency}").start()
+        return self
+
+    # ─── Background work ──────────────────────────────────────────────────────
+    def _add_pages(self, pages: List[Any]) -> None:
+        new: Dict[str, Any] = {}
+        with self._lock:
+            for page in pages:
+                url = page_url(page) or self.agency_url
+                if url in self._hashes:
+                    continue
+                self._hashes[url] = content_hash(page_text(page))
+                known = self._known.get(url)
+                if known and known[0] == self._hashes[url]:
+                    self._rosters[url] = known[1]
+                else:
+                    new[url] = page
+        if not new:
+            return
+
+        rosters = self._extract_pages(list(new.values()))
+        with self._lock:
+            for url, roster in zip(new, rosters):
+                if roster is None:
+                    # Keep the previous version of the page; it is retried on the next crawl
+                    self._failed += 1
+                    if url in self._known:
+                        self._rosters[url] = self._known[url][1]
+                else:
+                    self._extracted[url] = (self._hashes[url], roster)
+                    self._rosters[url] = roster
+
+    def _run(self, crawl: Union[FirecrawlJob, LocalCrawlJob]) -> None:
+        deadline = time.monotonic() + CRAWL_JOB_TIMEOUT
+        try:
+            while True:
+                status, self.pages_total, pages = crawl.poll()
+                # Each poll returns every page crawled so far; pages already handled are skipped
+                self._add_pages(pages)
+                if status in FINAL_STATUSES:
+                    self.status = status
+                    break
+                if time.monotonic() > deadline:
+                    crawl.cancel()
+                    self.status = "timed_out"
+                    break
+                time.sleep(CRAWL_POLL_SECONDS)
+            self._finish()
+        except Exception as e:
+            logger.warning(f"Crawl of {self.agency_url} failed: {e}")
+            self.error = str(e)
+            self.status = "failed"
+        finally:
+            self.finished_at = time.time()
+            self._done.set()
+
+    def _finish(self) -> None:
+        with self._lock:
+            extracted = dict(self._extracted)
+            seen = list(self._hashes)
+            failed = self._failed
+        if failed and not self._rosters and not self._known:
+            raise ValueError("Failed to parse talent information from any page of the website")
+
+        complete = self.status == "completed"
+        # A crawl that stopped at its page limit reached an arbitrary subset of a larger site
+        exhaustive = len(seen) < self.limit
+        dropped = self._store.update_pages(self.agency, extracted, seen, drop_missing=complete, exhaustive=exhaustive)
+        talent_data = merge_rosters(self._store.page_rosters(self.agency))
+        if complete:
+            self._store.save_roster(self.agency, talent_data)
+        self._result = {
+            **talent_data,
+            **roster_diff(self._previous["talents"] if self._previous else [], talent_data["talents"]),
+            "first_crawl": self._previous is None,
+            "pages": len(seen),
+            "changed_pages": len(extracted),
+            "unchanged_pages": len(seen) - len(extracted) - failed,
+            "failed_pages": failed,
+            "removed_pages": dropped,
+        }
+
+    # ─── Results ──────────────────────────────────────────────────────────────
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def snapshot(self) -> Dict:
+        """
+        Progress plus the roster so far. Until the crawl finishes, talents come from the pages
+        handled so far and only additions (not removals) are reported.
+        """
+        progress = {
+            "job_id": self.job_id,
+            "agency_url": self.agency_url,
+            "status": self.status,
+            "done": self.done,
+        }
+        if self.error:
+            progress["error"] = self.error
+        if self._result is not None:
+            return {**progress, **self._result}
+
+        with self._lock:
+            rosters = list(self._rosters.values())
+            crawled, extracted, failed = len(self._hashes), len(self._extracted), self._failed
+        talent_data = merge_rosters(rosters)
+        previous = self._previous["talents"] if self._previous else []
+        return {
+            **progress,
+            **talent_data,
+            "added": roster_diff(previous, talent_data["talents"])["added"],
+            "pages": crawled,
+            "pages_total": self.pages_total,
+            "changed_pages": extracted,
+            "failed_pages": failed,
+        }
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the crawl is finished or `timeout` seconds passed; returns whether it finished.
+        """
+        return self._done.wait(timeout)
+
+    def wait(self, timeout: Optional[float] = None) -> Dict:
+        """
+        Block until the crawl is finished (or `timeout` seconds passed) and return the roster.
+        """
+        self.join(timeout)
+        if self.done and self._result is None:
+            raise Exception(self.error or "Crawl failed")
+        return self.snapshot()
+
+
+_jobs: Dict[str, TalentCrawlJob] = {}
+_jobs_lock = threading.Lock()
+
+
+def start_talent_crawl(
+    agency_url: str,
+    limit: int,
+    extract_pages: PageExtractor,
+    backend: str = CRAWLER_BACKEND
+) -> TalentCrawlJob:
+    """
+    Submit a crawl job and start streaming its pages into extraction in the background.
+    """
+    job = TalentCrawlJob(agency_url, limit, extract_pages, backend).start()
+    with _jobs_lock:
+        cutoff = time.time() - CRAWL_JOB_RETENTION_SECONDS
+        for job_id in [i for i, j in _jobs.items() if j.finished_at and j.finished_at < cutoff]:
+            del _jobs[job_id]
+        _jobs[job.job_id] = job
+    return job
+
+
+def get_crawl_job(job_id: str) -> TalentCrawlJob:
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    if job is None:
+        raise ValueError(f"Unknown or expired crawl job: {job_id}")
+    return job
@@ -0,0 +1,366 @@
+import os
+import re
+import html
+import hashlib
+import time
+import uuid
+import asyncio
+import logging
+import threading
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Requests in flight at once (all to the agency's host, over one keep-alive pool)
+CRAWLER_CONCURRENCY = int(os.getenv("CRAWLER_CONCURRENCY", "8"))
+# Minimum seconds between two request starts to the host; robots.txt Crawl-delay can raise it
+CRAWLER_DELAY = float(os.getenv("CRAWLER_DELAY", "0.25"))
+CRAWLER_TIMEOUT = float(os.getenv("CRAWLER_TIMEOUT", "15"))
+CRAWLER_USER_AGENT = os.getenv("CRAWLER_USER_AGENT", "BrandViewBot/1.0 (+talent discovery)")
+
+# Pages larger than this are skipped
+MAX_PAGE_BYTES = 2_000_000
+SKIP_EXTENSIONS = (
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".ico", ".pdf", ".zip", ".mp4", ".mov", ".mp3",
+    ".css", ".js", ".json", ".xml", ".woff", ".woff2", ".ttf", ".doc", ".docx", ".xls", ".xlsx",
+)
+# Elements dropped from page content (same set the Firecrawl path excludes, plus other chrome)
+BOILERPLATE_TAGS = {"head", "script", "style", "noscript", "template", "nav", "footer", "header", "aside", "form", "svg", "iframe"}
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+HEADING_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+BLOCK_TAGS = {"p", "div", "section", "article", "main", "ul", "ol", "table", "tr", "figure", "blockquote", "dl"}
+
+
+class CrawledPage:
+    """
+    One crawled page with the attributes the Firecrawl documents have (url, markdown, html, metadata).
+    """
+
+    def __init__(self, url: str, markdown: str, html: str, metadata: Dict):
+        self.url = url
+        self.markdown = markdown
+        self.html = html
+        self.metadata = metadata
+
+
+def normalize_url(url: str) -> Optional[str]:
+    """
+    Canonical form used for frontier deduplication: http(s) only, lower-case host, no fragment,
+    no tracking parameters. None for URLs that are not worth fetching.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return None
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    path = parts.path or "/"
+    if path.lower().endswith(SKIP_EXTENSIONS):
+        return None
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith(("utm_", "fbclid", "gclid"))])
+    return urlunsplit((parts.scheme, parts.netloc.lower(), path, query, ""))
+
+
+def site_host(url: str) -> str:
+    host = urlsplit(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class _PageConverter(HTMLParser):
+    """
+    Single pass over a page that collects every link (for the frontier) and renders the
+    non-boilerplate content both as cleaned HTML and as markdown.
+    """
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.links: List[str] = []
+        self.title = ""
+        self.html: List[str] = []
+        self.markdown: List[str] = []
+        self._skip: List[str] = []
+        self._in_title = False
+        self._href: List[Optional[str]] = []
+
+    def _block(self, prefix: str = "") -> None:
+        self.markdown.append("\n\n" + prefix)
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes = dict(attrs)
+        if tag == "base" and attributes.get("href"):
+            self.base_url = urljoin(self.base_url, attributes["href"])
+        if tag == "title":
+            self._in_title = True
+        href = urljoin(self.base_url, attributes["href"].strip()) if tag == "a" and attributes.get("href") else None
+        if href:
+            self.links.append(href)
+
+        if self._skip or tag in BOILERPLATE_TAGS:
+            if tag not in VOID_TAGS:
+                self._skip.append(tag)
+            return
+
+        # Cleaned HTML keeps the structure (link grouping needs it) with absolute link targets
+        if href:
+            self.html.append(f'<a href="{html.escape(href, quote=True)}">')
+        elif tag == "img":
+            alt = attributes.get("alt") or ""
+            self.html.append(f'<img alt="{html.escape(alt, quote=True)}">')
+        else:
+            self.html.append(self.get_starttag_text() or f"<{tag}>")
+
+        if tag in HEADING_LEVELS:
+            self._block("#" * HEADING_LEVELS[tag] + " ")
+        elif tag == "li":
+            self.markdown.append("\n- ")
+        elif tag in BLOCK_TAGS:
+            self._block()
+        elif tag == "br":
+            self.markdown.append("\n")
+        elif tag in ("strong", "b"):
+            self.markdown.append("**")
+        elif tag == "a":
+            self._href.append(href)
+            if href:
+                self.markdown.append("[")
+        elif tag == "img" and attributes.get("src"):
+            self.markdown.append(f"![{attributes.get('alt') or ''}]({urljoin(self.base_url, attributes['src'])})")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        if self._skip:
+            # Tolerate unclosed children inside a skipped element
+            if tag in self._skip:
+                while self._skip and self._skip.pop() != tag:
+                    pass
+            return
+        if tag in VOID_TAGS:
+            return
+        self.html.append(f"</{tag}>")
+        if tag in HEADING_LEVELS or tag in BLOCK_TAGS:
+            self._block()
+        elif tag in ("strong", "b"):
+            self.markdown.append("**")
+        elif tag == "a" and self._href:
+            href = self._href.pop()
+            if href:
+                self.markdown.append(f"]({href})")
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+        if self._skip:
+            return
+        self.html.append(html.escape(data, quote=False))
+        self.markdown.append(re.sub(r"\s+", " ", data))
+
+
+def convert_page(source: str, url: str) -> Tuple[str, str, str, List[str]]:
+    """
+    (markdown, cleaned html, title, links) of a page, with navigation, headers, footers,
+    scripts and other boilerplate removed from the content.
+    """
+    converter = _PageConverter(url)
+    try:
+        converter.feed(source)
+        converter.close()
+    except Exception as e:
+        logger.warning(f"Could not fully parse {url}: {e}")
+    markdown = "".join(converter.markdown)
+    markdown = re.sub(r"\*\*\s*\*\*", "", markdown)
+    markdown = re.sub(r"\[\s*\]\([^)]*\)", "", markdown)
+    lines = [line.strip() for line in markdown.splitlines()]
+    markdown = re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+    return markdown, "".join(converter.html), " ".join(converter.title.split()), converter.links
+
+
+class LocalCrawler:
+    """
+    Asynchronous same-site crawler: a keep-alive connection pool to the agency's host,
+    robots.txt rules and Crawl-delay, a deduplicated URL frontier and a minimum delay
+    between request starts. Produces the same page records as the Firecrawl backend.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = CRAWLER_CONCURRENCY,
+        delay: float = CRAWLER_DELAY,
+        timeout: float = CRAWLER_TIMEOUT,
+        user_agent: str = CRAWLER_USER_AGENT
+    ):
+        self.concurrency = max(concurrency, 1)
+        self.delay = delay
+        self.timeout = timeout
+        self.user_agent = user_agent
+
+    async def _robots(self, client: httpx.AsyncClient, start_url: str) -> RobotFileParser:
+        parts = urlsplit(start_url)
+        robots = RobotFileParser()
+        try:
+            response = await client.get(f"{parts.scheme}://{parts.netloc}/robots.txt")
+            if response.status_code in (401, 403):
+                robots.disallow_all = True
+            elif response.status_code == 200:
+                robots.parse(response.text.splitlines())
+            else:
+                robots.allow_all = True
+        except httpx.HTTPError:
+            robots.allow_all = True
+        return robots
+
+    async def crawl(
+        self,
+        start_url: str,
+        limit: int,
+        on_page: Optional[Callable[[CrawledPage], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> List[CrawledPage]:
+        """
+        Crawl up to `limit` HTML pages of the start URL's site, breadth first. `on_page` is
+        called with every page as soon as it is fetched; setting `stop` ends the crawl early.
+        """
+        start = normalize_url(start_url if "//" in start_url else f"https://{start_url}")
+        if start is None:
+            raise ValueError(f"Invalid start URL: {start_url}")
+        host = site_host(start)
+        pages: List[CrawledPage] = []
+        seen = {start}
+        # The same document under several URLs (/, /index.html, …) is only kept once
+        digests = set()
+        frontier: asyncio.Queue = asyncio.Queue()
+        frontier.put_nowait(start)
+        loop = asyncio.get_running_loop()
+        turn_lock = asyncio.Lock()
+        next_request = [loop.time()]
+
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        async with httpx.AsyncClient(
+            headers={"User-Agent": self.user_agent},
+            timeout=self.timeout,
+            limits=limits,
+            follow_redirects=True
+        ) as client:
+            robots = await self._robots(client, start)
+            delay = max(self.delay, float(robots.crawl_delay(self.user_agent) or 0))
+
+            async def wait_turn() -> None:
+                # Request starts to the host are spaced by `delay`, however many workers run
+                async with turn_lock:
+                    wait = next_request[0] - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    next_request[0] = loop.time() + delay
+
+            async def fetch(url: str) -> Optional[Tuple[CrawledPage, List[str]]]:
+                await wait_turn()
+                try:
+                    response = await client.get(url)
+                except httpx.HTTPError as e:
+                    logger.info(f"Crawler could not fetch {url}: {e}")
+                    return None
+                final_url = normalize_url(str(response.url)) or url
+                if (
+                    response.status_code != 200
+                    or "html" not in response.headers.get("content-type", "")
+                    or len(response.content) > MAX_PAGE_BYTES
+                    or site_host(final_url) != host
+                ):
+                    return None
+                markdown, cleaned, title, links = convert_page(response.text, final_url)
+                metadata = {"sourceURL": final_url, "url": final_url, "title": title, "statusCode": response.status_code}
+                return CrawledPage(final_url, markdown, cleaned, metadata), links
+
+            async def worker() -> None:
+                while True:
+                    url = await frontier.get()
+                    try:
+                        if len(pages) >= limit or (stop is not None and stop.is_set()):
+                            continue
+                        if not robots.can_fetch(self.user_agent, url):
+                            continue
+                        result = await fetch(url)
+                        if result is None or len(pages) >= limit:
+                            continue
+                        page, links = result
+                        if page.url != url and page.url in seen:
+                            continue  # redirected to a page that is already crawled or queued
+                        seen.add(page.url)
+                        digest = hashlib.sha1(page.markdown.encode("utf-8")).digest()
+                        if digest in digests:
+                            continue
+                        digests.add(digest)
+                        pages.append(page)
+                        if on_page is not None:
+                            on_page(page)
+                        for link in links:
+                            link = normalize_url(link)
+                            if link and link not in seen and site_host(link) == host:
+                                seen.add(link)
+                                frontier.put_nowait(link)
+                    except Exception as e:
+                        logger.warning(f"Crawler failed on {url}: {e}")
+                    finally:
+                        frontier.task_done()
+
+            workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+            try:
+                await frontier.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+        return pages
+
+
+class LocalCrawlJob:
+    """
+    Runs a LocalCrawler in a background thread behind the same start/poll/cancel interface
+    as a Firecrawl crawl job.
+    """
+
+    def __init__(self, crawler: Optional[LocalCrawler] = None):
+        self.crawler = crawler or LocalCrawler()
+        self.job_id = f"local-{uuid.uuid4().hex}"
+        self.status = "scraping"
+        self._pages: List[CrawledPage] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _add(self, page: CrawledPage) -> None:
+        with self._lock:
+            self._pages.append(page)
+
+    def _run(self, url: str, limit: int) -> None:
+        started = time.monotonic()
+        try:
+            asyncio.run(self.crawler.crawl(url, limit, on_page=self._add, stop=self._stop))
+            self.status = "cancelled" if self._stop.is_set() else "completed"
+        except Exception as e:
+            logger.warning(f"Local crawl of {url} failed: {e}")
+            self.status = "failed"
+        logger.info(f"Local crawl of {url}: {len(self._pages)} pages in {time.monotonic() - started:.1f}s")
+
+    def start(self, url: str, limit: int) -> "LocalCrawlJob":
+        threading.Thread(target=self._run, args=(url, limit), daemon=True, name=f"local-crawl-{site_host(url)}").start()
+        return self
+
+    def poll(self) -> Tuple[str, Optional[int], List[CrawledPage]]:
+        """
+        (status, total pages if known, pages crawled so far)
+        """
+        status = self.status
+        with self._lock:
+            pages = list(self._pages)
+        return status, len(pages) if status != "scraping" else None, pages
+
+    def cancel(self) -> None:
+        self._stop.set()
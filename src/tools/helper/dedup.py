@@ -0,0 +1,222 @@
+import os
+import re
+import html
+import zlib
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Estimated Jaccard similarity of character shingles above which two comments are one cluster
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.8"))
+# Character shingle length; short enough to work on one-line comments
+SHINGLE_SIZE = 5
+# MinHash signature length = LSH_BANDS * LSH_ROWS; 16 x 4 makes pairs at 0.8 similarity
+# candidates with probability > 0.999 while pairs at 0.3 almost never collide
+LSH_BANDS = 16
+LSH_ROWS = 4
+MINHASH_SEED = 42
+# Each comment counts 1 + LIKE_WEIGHT * likeCount in the representative's weight
+LIKE_WEIGHT = float(os.getenv("DEDUP_LIKE_WEIGHT", "1.0"))
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\w", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+_REPEAT_RE = re.compile(r"([^\w\s])\1+")
+# Typical bot / self-promotion comments
+SPAM_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r"\bsub\s*(4|for)\s*sub\b",
+        r"\bcheck\s+(out\s+)?my\s+(channel|profile|page)\b",
+        r"\b(whats\s*app|telegram)\b.*\+?\d[\d\s-]{7,}",
+        r"\b(earn|make)\s+\$?\d+[k]?\s+(a|per)\s+(day|week)\b",
+        r"\bt\.me/\w+",
+    )
+]
+
+
+def normalize_comment(text: str) -> str:
+    """
+    Plain lower-case comment text: HTML tags removed (textDisplay is HTML), entities
+    decoded, repeated punctuation ("!!!") and whitespace collapsed.
+    """
+    text = html.unescape(_TAG_RE.sub(" ", text))
+    return _SPACE_RE.sub(" ", _REPEAT_RE.sub(r"\1", text)).strip().lower()
+
+
+def is_emoji_only(text: str) -> bool:
+    """
+    True for comments without a single letter or digit (emoji, punctuation, symbols).
+    """
+    return _WORD_RE.search(text) is None
+
+
+def is_spam(text: str) -> bool:
+    return any(p.search(text) for p in SPAM_PATTERNS)
+
+
+class _MinHasher:
+    """
+    MinHash signatures over character shingles using universal hashing (a * x + b) mod p.
+    """
+
+    def __init__(self, num_perm: int = LSH_BANDS * LSH_ROWS, seed: int = MINHASH_SEED):
+        rng = np.random.default_rng(seed)
+        # a, b < 2^29 and x < 2^32 keep a * x + b below 2^61, so uint64 never overflows
+        self.a = rng.integers(1, 1 << 29, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, 1 << 29, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        if len(text) <= SHINGLE_SIZE:
+            shingles = {text}
+        else:
+            shingles = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=1)
+
+
+class CommentDeduplicator:
+    """
+    Streaming near-duplicate collapsing for comments.
+
+    Comments are fed in any number of batches with `add`. Each comment either starts a new
+    cluster or joins the cluster of a previously seen comment whose MinHash signature estimates
+    a Jaccard similarity of at least `threshold`. Emoji-only and spam comments are dropped
+    up front. Every cluster is represented by its most-liked member and weighted by the
+    summed weight (1 + like_weight * likeCount) of all its members.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEDUP_THRESHOLD,
+        like_weight: float = LIKE_WEIGHT,
+        drop_emoji_only: bool = True,
+        drop_spam: bool = True
+    ):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"Dedup threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.like_weight = like_weight
+        self.drop_emoji_only = drop_emoji_only
+        self.drop_spam = drop_spam
+
+        self._hasher = _MinHasher()
+        self._buckets: List[Dict[bytes, List[int]]] = [defaultdict(list) for _ in range(LSH_BANDS)]
+        self._signatures: List[np.ndarray] = []
+        self._exact: Dict[str, int] = {}
+        self.clusters: List[Dict] = []
+        self.seen = 0
+        self.dropped_emoji_only = 0
+        self.dropped_spam = 0
+
+    def _weight(self, comment: Dict) -> float:
+        return 1.0 + self.like_weight * max(int(comment.get("likeCount") or 0), 0)
+
+    def _match(self, signature: np.ndarray) -> Optional[int]:
+        candidates = set()
+        for band in range(LSH_BANDS):
+            key = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes()
+            candidates.update(self._buckets[band].get(key, ()))
+        best, best_similarity = None, self.threshold
+        for cluster in candidates:
+            similarity = float(np.mean(self._signatures[cluster] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = cluster, similarity
+        return best
+
+    def _join(self, cluster: int, comment: Dict, weight: float) -> None:
+        entry = self.clusters[cluster]
+        entry["duplicates"] += 1
+        entry["weight"] += weight
+        if (comment.get("likeCount") or 0) > (entry["comment"].get("likeCount") or 0):
+            entry["comment"] = comment
+
+    def _create(self, text: str, signature: np.ndarray, comment: Dict, weight: float) -> int:
+        cluster = len(self.clusters)
+        self.clusters.append({"comment": comment, "duplicates": 0, "weight": weight})
+        self._signatures.append(signature)
+        self._exact[text] = cluster
+        for band in range(LSH_BANDS):
+            key = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes()
+            self._buckets[band][key].append(cluster)
+        return cluster
+
+    def _add_one(self, comment: Dict) -> Tuple[str, Optional[int]]:
+        self.seen += 1
+        text = normalize_comment(comment.get("text") or "")
+        if self.drop_emoji_only and is_emoji_only(text):
+            self.dropped_emoji_only += 1
+            return "emoji_only", None
+        if self.drop_spam and is_spam(text):
+            self.dropped_spam += 1
+            return "spam", None
+
+        weight = self._weight(comment)
+        if text in self._exact:
+            self._join(self._exact[text], comment, weight)
+            return "duplicate", self._exact[text]
+        signature = self._hasher.signature(text)
+        cluster = self._match(signature)
+        if cluster is None:
+            return "unique", self._create(text, signature, comment, weight)
+        self._exact[text] = cluster
+        self._join(cluster, comment, weight)
+        return "duplicate", cluster
+
+    def add(self, comments: Iterable[Dict]) -> List[int]:
+        """
+        Feed a batch of comments. Returns the indices of clusters created by this batch;
+        existing clusters absorb their near-duplicates in place.
+        """
+        return [cluster for status, cluster in map(self._add_one, comments) if status == "unique"]
+
+    def add_with_status(self, comments: Iterable[Dict]) -> List[str]:
+        """
+        Feed a batch of comments like `add`, returning what happened to each one: "unique"
+        (started a cluster), "duplicate" (joined one), "emoji_only" or "spam" (dropped).
+        """
+        return [status for status, _ in map(self._add_one, comments)]
+
+    def representatives(self) -> List[Dict]:
+        """
+        One comment per cluster with its `duplicates` count and `weight` added.
+        """
+        return [
+            {**c["comment"], "duplicates": c["duplicates"], "weight": round(c["weight"], 4)}
+            for c in self.clusters
+        ]
+
+    def weights(self) -> np.ndarray:
+        return np.array([c["weight"] for c in self.clusters], dtype=np.float64)
+
+    def stats(self) -> Dict:
+        kept = len(self.clusters)
+        return {
+            "comments": self.seen,
+            "representatives": kept,
+            "dropped_emoji_only": self.dropped_emoji_only,
+            "dropped_spam": self.dropped_spam,
+            "duplicates_collapsed": self.seen - kept - self.dropped_emoji_only - self.dropped_spam,
+            "compression_ratio": round(self.seen / kept, 3) if kept else None,
+        }
+
+
+def collapse_comments(comments: List[Dict], **kwargs) -> Dict:
+    """
+    Deduplicate a complete comment list in one call.
+    Returns {"comments": representatives, "stats": compression statistics}.
+    """
+    dedup = CommentDeduplicator(**kwargs)
+    dedup.add(comments)
+    stats = dedup.stats()
+    logger.info(f"Collapsed {stats['comments']} comments into {stats['representatives']} representatives")
+    return {"comments": dedup.representatives(), "stats": stats}
@@ -0,0 +1,190 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Literal, Optional, Sequence
+
+import numpy as np
+from scipy.special import ndtri
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+IntervalType = Literal["lower", "upper", "two-sided"]
+INTERVAL_TYPES = ("lower", "upper", "two-sided")
+
+
+def _ragged(groups: Sequence[Sequence[float]]) -> tuple:
+    """
+    Flatten a list of per-channel lists into (values, group index per value, group lengths).
+    """
+    lengths = np.fromiter((len(g) for g in groups), dtype=np.int64, count=len(groups))
+    if lengths.size and (lengths == 0).any():
+        raise ValueError(f"Channel {int(np.argmin(lengths))} has no historical views")
+    values = np.concatenate([np.asarray(g, dtype=np.float64) for g in groups]) if groups else np.zeros(0)
+    return values, np.repeat(np.arange(len(groups)), lengths), lengths
+
+
+def recency_weights(ages_days: np.ndarray, half_life_days: float) -> np.ndarray:
+    """
+    Exponential decay weights: a video `half_life_days` older counts half as much.
+    """
+    if half_life_days <= 0:
+        raise ValueError("Recency half-life must be positive")
+    return np.exp2(-np.asarray(ages_days, dtype=np.float64) / half_life_days)
+
+
+def ages_in_days(published_at: Sequence[str], now: Optional[datetime] = None) -> np.ndarray:
+    """
+    Age in days of each ISO 8601 publish timestamp ("2024-05-01T12:00:00Z").
+    """
+    now = now or datetime.now(timezone.utc)
+    return np.array([
+        max((now - datetime.fromisoformat(ts.replace("Z", "+00:00"))).total_seconds() / 86400, 0.0)
+        for ts in published_at
+    ], dtype=np.float64)
+
+
+def fit_lognormal(
+    views: Sequence[Sequence[float]],
+    weights: Optional[Sequence[Sequence[float]]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Maximum-likelihood log-normal fit (location fixed at 0) for many channels at once.
+
+    With the location fixed the MLE is closed form: mu is the mean and sigma the (population)
+    standard deviation of log-views, which is what `scipy.stats.lognorm.fit(x, floc=0)` returns
+    as (sigma, 0, exp(mu)). With `weights`, both moments are weighted.
+
+    Args:
+        views: One list of view counts per channel (ragged)
+        weights: Optional per-video weights with the same shape as `views`
+
+    Returns:
+        Dict with arrays `mu`, `sigma` and `n` (videos per channel)
+    """
+    values, group, lengths = _ragged(views)
+    if values.size and np.any(values <= 0):
+        raise ValueError("All view counts must be positive to fit a log‑normal")
+
+    if weights is None:
+        w = np.ones_like(values)
+    else:
+        w, w_group, _ = _ragged(weights)
+        if w.shape != values.shape or np.any(w_group != group):
+            raise ValueError("Weights must have the same shape as views")
+        if np.any(w < 0):
+            raise ValueError("Weights cannot be negative")
+
+    n_groups = len(lengths)
+    logs = np.log(values)
+    total = np.bincount(group, weights=w, minlength=n_groups)
+    if np.any(total <= 0):
+        raise ValueError("Every channel needs a positive total weight")
+    mu = np.bincount(group, weights=w * logs, minlength=n_groups) / total
+    variance = np.bincount(group, weights=w * (logs - mu[group]) ** 2, minlength=n_groups) / total
+    return {"mu": mu, "sigma": np.sqrt(variance), "n": lengths}
+
+
+def lognormal_interval(
+    mu: np.ndarray,
+    sigma: np.ndarray,
+    confidence_level: float = 0.90,
+    interval_type: IntervalType = "two-sided"
+) -> tuple:
+    """
+    Vectorized log-normal prediction bounds via the inverse normal CDF:
+    quantile(q) = exp(mu + sigma * ndtri(q)).
+
+    Returns (lower, upper) arrays; the open side of one-sided intervals is -inf / inf,
+    matching `_predict_next_video_views`.
+    """
+    if not 0.0 < confidence_level < 1.0:
+        raise ValueError("confidence_level must be between 0 and 1")
+    alpha = 1.0 - confidence_level
+
+    if interval_type == "lower":
+        # one‑sided lower: P(X ≥ L) = confidence_level
+        return np.exp(mu + sigma * ndtri(alpha)), np.full_like(mu, np.inf)
+    if interval_type == "upper":
+        # one‑sided upper: P(X ≤ U) = confidence_level
+        return np.full_like(mu, -np.inf), np.exp(mu + sigma * ndtri(confidence_level))
+    if interval_type == "two-sided":
+        # central interval: cut off α/2 in each tail
+        return np.exp(mu + sigma * ndtri(alpha / 2)), np.exp(mu + sigma * ndtri(1 - alpha / 2))
+    raise ValueError(f"Invalid interval_type '{interval_type}'. Valid values are: {', '.join(INTERVAL_TYPES)}")
+
+
+def forecast_views(
+    views: Sequence[Sequence[float]],
+    confidence_level: float = 0.90,
+    interval_type: IntervalType = "two-sided",
+    ages_days: Optional[Sequence[Sequence[float]]] = None,
+    half_life_days: Optional[float] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Next-video view forecasts for many channels in one vectorized pass.
+
+    Args:
+        views: One list of historical view counts per channel
+        confidence_level: Coverage of the interval (default 0.90)
+        interval_type: "lower", "upper" or "two-sided"
+        ages_days: Optional age in days of every video (same shape as `views`);
+            together with `half_life_days` recent videos weigh more
+        half_life_days: Age at which a video counts half as much as a brand-new one
+
+    Returns:
+        Dict of arrays (one value per channel): median, expected (log-normal mean),
+        lower, upper, mu, sigma, n
+    """
+    weights = None
+    if half_life_days is not None:
+        if ages_days is None:
+            raise ValueError("ages_days is required for recency weighting")
+        weights = [recency_weights(a, half_life_days) for a in ages_days]
+
+    fit = fit_lognormal(views, weights)
+    lower, upper = lognormal_interval(fit["mu"], fit["sigma"], confidence_level, interval_type)
+    return {
+        "median": np.exp(fit["mu"]),
+        "expected": np.exp(fit["mu"] + fit["sigma"] ** 2 / 2),
+        "lower": lower,
+        "upper": upper,
+        **fit,
+    }
+
+
+def rank_channels(
+    channel_views: Dict[str, Sequence[float]],
+    confidence_level: float = 0.90,
+    interval_type: IntervalType = "two-sided",
+    channel_ages_days: Optional[Dict[str, Sequence[float]]] = None,
+    half_life_days: Optional[float] = None,
+    sort_by: Literal["median", "expected", "lower", "upper"] = "median",
+    top_k: Optional[int] = None
+) -> List[Dict]:
+    """
+    Rank channels by their forecast views for the next video (highest first).
+    """
+    if sort_by not in ("median", "expected", "lower", "upper"):
+        raise ValueError(f"Invalid sort_by '{sort_by}'")
+    channel_ids = list(channel_views)
+    ages = [channel_ages_days[c] for c in channel_ids] if channel_ages_days is not None else None
+    result = forecast_views(
+        [channel_views[c] for c in channel_ids], confidence_level, interval_type, ages, half_life_days
+    )
+
+    order = np.argsort(-result[sort_by], kind="stable")
+    if top_k is not None:
+        order = order[:top_k]
+    return [
+        {
+            "channel_id": channel_ids[i],
+            "rank": rank + 1,
+            "videos": int(result["n"][i]),
+            "median": float(result["median"][i]),
+            "expected": float(result["expected"][i]),
+            "lower": float(result["lower"][i]),
+            "upper": float(result["upper"][i]),
+        }
+        for rank, i in enumerate(order)
+    ]
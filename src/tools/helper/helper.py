@@ -1,40 +1,52 @@
 import os
-import yt_dlp
 import re
-from typing import Dict, List, Union, Tuple, Literal
+import heapq
+from typing import Dict, Iterable, Iterator, List, Optional, Union, Tuple, Literal
 from googleapiclient.errors import HttpError
-from googleapiclient.discovery import build
 from dotenv import load_dotenv
 import numpy as np
-from scipy import stats
-from textblob import TextBlob
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from io import BytesIO
 from PIL import Image
-import torch
-from transformers import CLIPProcessor, CLIPModel
 
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
 
-import whisper
 import tempfile
+import time
+import threading
+from types import SimpleNamespace
 
 from agno.tools import tool
 from typing import Annotated
 
-from firecrawl import FirecrawlApp, ScrapeOptions
+
+from src.tools.helper.lazy import lazy_import
+from src.tools.helper.models import get_model
+from src.tools.helper.clip import encode_prompts, encode_images, encode_pixel_values, preprocess_images
+from src.tools.helper.thumbnail_index import get_thumbnail_index, perceptual_hash
+from src.tools.helper.sentiment import sentiment_distribution
+from src.tools.helper.sentiment_store import get_sentiment_store
+from src.tools.helper.dedup import CommentDeduplicator
+from src.tools.helper.forecast import ages_in_days, forecast_views, rank_channels
+from src.tools.helper.metrics import influencer_metrics, max_price_for_cpm, stats_arrays
+from src.tools.helper.talent_extraction import extract_page_talents, merge_link_cards, page_text, page_url
+from src.tools.helper.crawl_jobs import get_crawl_job, start_talent_crawl
+from src.tools.helper.link_extraction import extract_page_links, residue_markdown, youtube_links
+from src.tools.helper.sponsor_scan import scan_description, summarize_scans
 
 # ─── Logging setup ─────────────────────────────────────────────────────────────
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize CLIP model and processor globally
-CLIP_MODEL_NAME = "openai/clip-vit-large-patch14"
-logger.info(f"Loading CLIP model {CLIP_MODEL_NAME}…")
-model = CLIPModel.from_pretrained(CLIP_MODEL_NAME)
-processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
+# Heavy modules, imported when a tool first uses them instead of at startup
+torch = lazy_import("torch")
+cv2 = lazy_import("cv2")
+whisper = lazy_import("whisper")
+yt_dlp = lazy_import("yt_dlp")
 
 # Global parameters for thumbnail analysis
 TEMPERATURE = 0.07
@@ -56,8 +68,39 @@ NEGATIVE_PROMPTS = [
     "cluttered layout"
 ]
 
+# Global parameters for visual sponsor detection
+VISUAL_SAMPLE_RATE = 0.2          # sampled frames per second of video
+VISUAL_MAX_FRAMES = 48            # hard frame budget per video
+VISUAL_BATCH_SIZE = 16            # frames per CLIP forward pass
+VISUAL_MAX_GAP = 30.0             # always keep a frame after this many seconds
+SCENE_CHANGE_THRESHOLD = 0.03     # mean abs. pixel difference that counts as a new scene
+VISUAL_HIT_THRESHOLD = 0.5        # min. prompt probability for a visual sponsor hit
+
+# Generic sponsor prompts, extended at runtime with brand-specific prompts
+SPONSOR_VISUAL_PROMPTS = [
+    "a brand logo overlay on a video",
+    "a product placement in a video",
+    "a promo code or discount banner",
+    "a sponsored advertisement segment"
+]
+BACKGROUND_VISUAL_PROMPTS = [
+    "a person talking to the camera",
+    "an ordinary video scene without logos",
+    "a screen recording",
+    "an outdoor scene"
+]
+
+# Global parameters for batch thumbnail scoring
+THUMBNAIL_MAX_BATCH = int(os.getenv("THUMBNAIL_MAX_BATCH", "16"))   # max images per forward pass
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", "8"))        # concurrent downloads/preprocessing
+
+# Pooled HTTP session shared by all image downloads
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=THUMBNAIL_WORKERS))
+_http_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=THUMBNAIL_WORKERS))
+
 def _download_image(url: str) -> Image.Image:
-    resp = requests.get(url, timeout=5)
+    resp = _http_session.get(url, timeout=5)
     resp.raise_for_status()
     return Image.open(BytesIO(resp.content)).convert("RGB")
 
@@ -72,49 +115,121 @@ def _sentiment_score(texts: Union[str, List[str]]) -> float:
     if not texts:
         raise ValueError("Input text or list of texts cannot be empty")
         
-    # Calculate sentiment polarity for each text
-    sentiments = [TextBlob(text).sentiment.polarity for text in texts]
+    # Calculate sentiment polarity for each text (identical to TextBlob polarity);
+    # texts scored before are served from the sentiment store
+    sentiments = get_sentiment_store().scores_for_texts(texts)
     
     # Compute and return the mean sentiment score
     return float(np.mean(sentiments))
 
-def _score_thumbnail(thumbnail_url: str) -> float:
+def _sentiment_distribution(texts: Union[str, List[str]]) -> Dict:
     """
-    Compute a 0–1 score for how "attractive" a thumbnail is.
+    Score all texts in one pass and return the mean together with the full distribution
+    (percentiles, histogram and share of negative/neutral/positive texts).
     """
-    try:
-        logger.info(f"Scoring thumbnail: {thumbnail_url}")
-        img = _download_image(thumbnail_url)
-
-        texts = POSITIVE_PROMPTS + NEGATIVE_PROMPTS
-        inputs = processor(
-            images=img,
-            text=texts,
-            return_tensors="pt",
-            padding=True
-        )
-        
-        # Get and normalize features
-        img_feats = model.get_image_features(inputs["pixel_values"])
-        txt_feats = model.get_text_features(inputs["input_ids"])
-        img_feats = img_feats / img_feats.norm(dim=-1, keepdim=True)
-        txt_feats = txt_feats / txt_feats.norm(dim=-1, keepdim=True)
+    if isinstance(texts, str):
+        texts = [texts]
+    if not texts:
+        raise ValueError("Input text or list of texts cannot be empty")
 
+    return sentiment_distribution(get_sentiment_store().scores_for_texts(texts))
+
+def set_thumbnail_prompts(
+    positive_prompts: Optional[List[str]] = None,
+    negative_prompts: Optional[List[str]] = None
+) -> None:
+    """
+    Replace the default thumbnail prompt sets at runtime.
+    Embeddings for the new sets are computed on the next scoring call and cached.
+    """
+    global POSITIVE_PROMPTS, NEGATIVE_PROMPTS
+    if positive_prompts is not None:
+        if not positive_prompts:
+            raise ValueError("Positive prompt list cannot be empty")
+        POSITIVE_PROMPTS = list(positive_prompts)
+    if negative_prompts is not None:
+        if not negative_prompts:
+            raise ValueError("Negative prompt list cannot be empty")
+        NEGATIVE_PROMPTS = list(negative_prompts)
+
+def _thumbnail_scores(
+    img_feats: "torch.Tensor",
+    positive_prompts: List[str],
+    negative_prompts: List[str]
+) -> List[float]:
+    """
+    Turn normalized image embeddings (N_images, D) into 0–1 attractiveness scores.
+    """
+    texts = positive_prompts + negative_prompts
+    txt_feats = encode_prompts(texts)
+
+    with torch.inference_mode():
         # similarity logits
-        logits = (img_feats @ txt_feats.T) / TEMPERATURE  # shape (1, N_prompts)
-        logits = logits.squeeze(0)  # shape (N_prompts,)
+        logits = (img_feats @ txt_feats.T) / TEMPERATURE  # shape (N_images, N_prompts)
 
         # Debug: log a few values
-        for p, score in zip(texts, logits.tolist()):
+        for p, score in zip(texts, logits[0].tolist()):
             logger.debug(f"  '{p}': {score:.3f}")
 
-        n_pos = len(POSITIVE_PROMPTS)
-        pos_mean = logits[:n_pos].mean()
-        neg_mean = logits[n_pos:].mean()
+        n_pos = len(positive_prompts)
+        pos_mean = logits[:, :n_pos].mean(dim=-1)
+        neg_mean = logits[:, n_pos:].mean(dim=-1)
         diff = pos_mean - neg_mean
 
         # sigmoid normalization
-        score = torch.sigmoid(diff * SCALE).item()
+        return torch.sigmoid(diff * SCALE).tolist()
+
+def _thumbnail_video_id(thumbnail_url: str) -> str:
+    """
+    Extract the video ID from an i.ytimg.com thumbnail URL (falls back to the URL itself).
+    """
+    match = re.search(r'/vi(?:_webp)?/([A-Za-z0-9_-]{11})/', thumbnail_url)
+    return match.group(1) if match else thumbnail_url
+
+def _prepare_thumbnail(thumbnail_url: str) -> Tuple[str, Optional[np.ndarray], Optional["torch.Tensor"]]:
+    """
+    Download a thumbnail and return (perceptual_hash, cached_embedding, pixel_values).
+    Images already in the thumbnail index come back with their stored embedding and no pixels.
+    """
+    img = _download_image(thumbnail_url)
+    phash = perceptual_hash(img)
+    cached = get_thumbnail_index().embedding_for_hash(phash)
+    if cached is not None:
+        return phash, cached, None
+    return phash, None, preprocess_images([img])[0]
+
+def _index_thumbnail(thumbnail_url: str, phash: str, embedding: np.ndarray, channel_id: Optional[str] = None) -> None:
+    try:
+        get_thumbnail_index().add(_thumbnail_video_id(thumbnail_url), phash, embedding, channel_id, thumbnail_url)
+    except Exception as e:
+        # The index is an optimization; never fail scoring because of it
+        logger.warning(f"Failed to index thumbnail {thumbnail_url}: {e}")
+
+def _score_thumbnail(
+    thumbnail_url: str,
+    positive_prompts: Optional[List[str]] = None,
+    negative_prompts: Optional[List[str]] = None
+) -> float:
+    """
+    Compute a 0–1 score for how "attractive" a thumbnail is.
+    Prompt embeddings are cached, so each call costs at most one image-encoder pass,
+    and none at all for images already in the thumbnail index.
+    """
+    try:
+        logger.info(f"Scoring thumbnail: {thumbnail_url}")
+        phash, cached, pixel_values = _prepare_thumbnail(thumbnail_url)
+
+        if cached is not None:
+            img_feats = torch.from_numpy(cached)[None, :]
+        else:
+            img_feats = encode_pixel_values(pixel_values[None, :])
+        _index_thumbnail(thumbnail_url, phash, img_feats[0].numpy())
+
+        score = _thumbnail_scores(
+            img_feats,
+            positive_prompts or POSITIVE_PROMPTS,
+            negative_prompts or NEGATIVE_PROMPTS
+        )[0]
         logger.info(f"Thumbnail score → {score:.4f}")
         return float(score)
 
@@ -122,6 +237,145 @@ def _score_thumbnail(thumbnail_url: str) -> float:
         logger.error(f"Failed to score thumbnail: {e}")
         raise Exception(f"Failed to score thumbnail: {str(e)}")
 
+def _score_thumbnails(
+    thumbnail_urls: List[str],
+    positive_prompts: Optional[List[str]] = None,
+    negative_prompts: Optional[List[str]] = None,
+    channel_id: Optional[str] = None
+) -> Dict:
+    """
+    Score many thumbnails at once. Downloads and preprocessing run concurrently in a
+    worker pool; whatever has arrived is scored together, up to THUMBNAIL_MAX_BATCH
+    images per forward pass. Images already in the thumbnail index skip the forward pass.
+    Returns per-thumbnail scores and channel-level aggregates.
+    """
+    if not thumbnail_urls:
+        raise ValueError("Thumbnail URL list cannot be empty")
+
+    positive_prompts = positive_prompts or POSITIVE_PROMPTS
+    negative_prompts = negative_prompts or NEGATIVE_PROMPTS
+    urls = list(dict.fromkeys(thumbnail_urls))  # drop duplicate URLs, keep order
+    scores: Dict[str, float] = {}
+    errors: Dict[str, str] = {}
+    cached_urls = set()
+
+    def _score_batch(batch: List[Tuple[str, str, torch.Tensor]]) -> None:
+        for (url, _, _), score in zip(batch, _thumbnail_scores(
+            torch.stack([feats for _, _, feats in batch]), positive_prompts, negative_prompts
+        )):
+            scores[url] = float(score)
+
+    with ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS) as executor:
+        pending = {executor.submit(_prepare_thumbnail, url): url for url in urls}
+        ready: List[Tuple[str, str, torch.Tensor]] = []
+        cached: List[Tuple[str, str, torch.Tensor]] = []
+
+        while pending or ready:
+            if pending:
+                # Block until at least one download is ready unless a batch is already waiting
+                done, _ = wait(pending, timeout=None if not ready else 0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+                    try:
+                        phash, embedding, pixels = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch thumbnail {url}: {e}")
+                        errors[url] = str(e)
+                        continue
+                    if embedding is not None:
+                        cached.append((url, phash, torch.from_numpy(embedding)))
+                        cached_urls.add(url)
+                    else:
+                        ready.append((url, phash, pixels))
+
+            if not ready:
+                continue
+
+            # Batch size follows arrival rate: everything ready, capped at THUMBNAIL_MAX_BATCH
+            batch, ready = ready[:THUMBNAIL_MAX_BATCH], ready[THUMBNAIL_MAX_BATCH:]
+            img_feats = encode_pixel_values(torch.stack([pixels for _, _, pixels in batch]))
+            encoded = [(url, phash, feats) for (url, phash, _), feats in zip(batch, img_feats)]
+            _score_batch(encoded)
+            for url, phash, feats in encoded:
+                _index_thumbnail(url, phash, feats.numpy(), channel_id)
+
+        # Deduplicated images: a single matmul against the cached prompt embeddings
+        if cached:
+            _score_batch(cached)
+            for url, phash, feats in cached:
+                _index_thumbnail(url, phash, feats.numpy(), channel_id)
+
+    results = [
+        {"url": url, "score": scores.get(url), "cached": url in cached_urls, "error": errors.get(url)}
+        for url in urls
+    ]
+
+    aggregates = {"count": len(urls), "scored": len(scores), "cached": len(cached_urls), "failed": len(errors)}
+    if scores:
+        values = np.array(list(scores.values()))
+        best = max(scores, key=scores.get)
+        worst = min(scores, key=scores.get)
+        aggregates.update({
+            "mean": float(values.mean()),
+            "median": float(np.median(values)),
+            "std": float(values.std()),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "p10": float(np.percentile(values, 10)),
+            "p90": float(np.percentile(values, 90)),
+            "share_above_0_5": float((values > 0.5).mean()),
+            "best": {"url": best, "score": scores[best]},
+            "worst": {"url": worst, "score": scores[worst]}
+        })
+
+    logger.info(f"Scored {len(scores)}/{len(urls)} thumbnails ({len(cached_urls)} from the index)")
+    return {"thumbnails": results, "aggregates": aggregates}
+
+def _resolve_thumbnail(query: str) -> Tuple[str, str, np.ndarray]:
+    """
+    Resolve a video ID or thumbnail URL to (video_id, perceptual_hash, embedding).
+    Indexed videos are answered from the index without downloading anything.
+    """
+    index = get_thumbnail_index()
+    if not query.startswith("http"):
+        found = index.lookup_video(query)
+        if found is not None:
+            entry, embedding = found
+            return query, entry["phash"], embedding
+        query = f"https://i.ytimg.com/vi/{query}/hqdefault.jpg"
+
+    found = index.lookup_video(_thumbnail_video_id(query))
+    if found is not None:
+        entry, embedding = found
+        return entry["video_id"], entry["phash"], embedding
+
+    phash, embedding, pixel_values = _prepare_thumbnail(query)
+    if embedding is None:
+        embedding = encode_pixel_values(pixel_values[None, :])[0].numpy()
+    _index_thumbnail(query, phash, embedding)
+    return _thumbnail_video_id(query), phash, embedding
+
+def _find_similar_thumbnails(query: str, k: int = 10) -> List[Dict]:
+    video_id, _, embedding = _resolve_thumbnail(query)
+    return get_thumbnail_index().search(embedding, k=k, exclude_video_ids=[video_id])
+
+def _find_similar_channels(query: str, k: int = 5) -> List[Dict]:
+    """
+    Channels whose thumbnail style resembles a channel (by channel ID) or a single thumbnail.
+    """
+    index = get_thumbnail_index()
+    if re.match(r'^UC[a-zA-Z0-9_-]{22}$', query):
+        centroid = index.channel_centroid(query)
+        if centroid is None:
+            raise ValueError(f"No thumbnails indexed for channel {query}; score its thumbnails with score_thumbnails first")
+        return index.similar_channels(centroid, k=k, exclude_channel_ids=[query])
+    _, _, embedding = _resolve_thumbnail(query)
+    return index.similar_channels(embedding, k=k)
+
+def _check_thumbnail_reuse(query: str) -> List[Dict]:
+    video_id, phash, _ = _resolve_thumbnail(query)
+    return [entry for entry in get_thumbnail_index().find_reuse(phash) if entry["video_id"] != video_id]
+
 def _predict_next_video_views(
     historical_views: List[int],
     confidence_level: float = 0.90,
@@ -133,30 +387,82 @@ def _predict_next_video_views(
     """
     if not historical_views:
         raise ValueError("Historical views list cannot be empty")
-    views = np.array(historical_views, dtype=float)
-    if np.any(views <= 0):
-        raise ValueError("All view counts must be positive to fit a log‑normal")
 
-    # Fit a log‑normal: returns (shape, loc, scale)
-    shape, loc, scale = stats.lognorm.fit(views, floc=0)
+    # Closed-form log-normal fit, identical to scipy's lognorm.fit(views, floc=0)
+    forecast = forecast_views([historical_views], confidence_level, interval_type)
+    return float(forecast["lower"][0]), float(forecast["upper"][0])
 
-    alpha = 1.0 - confidence_level
+def _rank_channels_by_expected_views(
+    channel_ids: List[str],
+    max_results: int = 10,
+    months: int = 6,
+    confidence_level: float = 0.90,
+    half_life_days: Optional[float] = None,
+    top_k: int = 10
+) -> Dict:
+    """
+    Fetch recent video statistics for every channel and rank the channels by the
+    forecast (median) views of their next video.
+    """
+    channel_views: Dict[str, List[int]] = {}
+    channel_ages: Dict[str, np.ndarray] = {}
+    skipped: Dict[str, str] = {}
+    for identifier in channel_ids:
+        try:
+            channel_id = _resolve_channel_id(identifier)
+            videos = [v for v in _fetch_video_statistics(channel_id, max_results, months) if v["viewCount"] > 0]
+            if not videos:
+                skipped[identifier] = "no recent videos with views"
+                continue
+            channel_views[channel_id] = [v["viewCount"] for v in videos]
+            channel_ages[channel_id] = ages_in_days([v["publishedAt"] for v in videos])
+        except Exception as e:
+            skipped[identifier] = str(e)
 
-    if interval_type == "lower":
-        # one‑sided lower: find the α‑quantile so P(X ≥ L)=confidence_level
-        L = stats.lognorm.ppf(alpha, shape, loc=loc, scale=scale)
-        return float(L), float("inf")
+    ranking = rank_channels(
+        channel_views,
+        confidence_level=confidence_level,
+        channel_ages_days=channel_ages if half_life_days else None,
+        half_life_days=half_life_days,
+        top_k=top_k
+    )
+    return {"ranking": ranking, "skipped": skipped}
 
-    elif interval_type == "upper":
-        # one‑sided upper: find the confidence_level‑quantile so P(X ≤ U)=confidence_level
-        U = stats.lognorm.ppf(confidence_level, shape, loc=loc, scale=scale)
-        return float("-inf"), float(U)
+def _influencer_metrics(
+    identifier: str,
+    price: Optional[float] = None,
+    conversions: Optional[float] = None,
+    target_cpm: Optional[float] = None,
+    max_results: int = 10,
+    months: int = 6,
+    confidence_level: float = 0.90
+) -> Dict:
+    """
+    Fetch a channel's recent video statistics and compute CPM, CPV, CPA, engagement rate and
+    median expected views with bootstrap confidence bands.
+    """
+    channel_id = _resolve_channel_id(identifier)
+    video_stats = _fetch_video_statistics(channel_id, max_results, months)
+    return {"channel_id": channel_id, **influencer_metrics(video_stats, price, conversions, target_cpm, confidence_level)}
 
-    elif interval_type == "two-sided":
-        # central interval: cut off α/2 in each tail
-        lower_q = stats.lognorm.ppf(alpha / 2, shape, loc=loc, scale=scale)
-        upper_q = stats.lognorm.ppf(1 - alpha / 2, shape, loc=loc, scale=scale)
-        return float(lower_q), float(upper_q)
+def _max_price_for_cpm(
+    identifier: str,
+    target_cpm: float,
+    max_results: int = 10,
+    months: int = 6,
+    confidence_level: float = 0.90
+) -> Dict:
+    """
+    Highest sponsorship price for a channel that keeps the CPM at or below `target_cpm`.
+    """
+    channel_id = _resolve_channel_id(identifier)
+    views = stats_arrays(_fetch_video_statistics(channel_id, max_results, months))["views"]
+    return {
+        "channel_id": channel_id,
+        "videos": int(views.size),
+        "expected_views": float(np.median(views)),
+        **max_price_for_cpm(views, target_cpm, confidence_level)
+    }
 
 # Load environment variables from .env file
 load_dotenv()
@@ -164,16 +470,28 @@ load_dotenv()
 class YouTubeAPI:
     def __init__(self):
         self.api_key = os.getenv("YOUTUBE_API_KEY")
-        if not self.api_key:
-            raise ValueError("YouTube API key not found in environment variables")
-        
-        self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+        self._local = threading.local()
         self.ydl_opts = {
             'quiet': True,
             'no_warnings': True,
             'extract_flat': True
         }
 
+    @property
+    def youtube(self):
+        """
+        The Data API client of the calling thread, built on first use: the discovery import and
+        client build stay off the startup path, and since googleapiclient clients are not
+        thread-safe, member agents running in parallel each get their own.
+        """
+        youtube = getattr(self._local, "youtube", None)
+        if youtube is None:
+            if not self.api_key:
+                raise ValueError("YouTube API key not found in environment variables")
+            from googleapiclient.discovery import build
+            youtube = self._local.youtube = build('youtube', 'v3', developerKey=self.api_key)
+        return youtube
+
 # Create a singleton instance
 youtube_api = YouTubeAPI()
 
@@ -319,7 +637,10 @@ def _fetch_channel_info(channel_id: str) -> Dict:
     except HttpError as e:
         raise Exception(f"Error fetching channel info: {str(e)}")
     
-def _fetch_videos(channel_id: str, max_results: int = 10) -> List[Dict]:
+def _fetch_upload_ids(channel_id: str, max_results: int = 10) -> List[str]:
+    """
+    IDs of the most recent uploads of a channel, newest first.
+    """
     try:
         # First get the uploads playlist ID
         request = youtube_api.youtube.channels().list(
@@ -340,25 +661,26 @@ def _fetch_videos(channel_id: str, max_results: int = 10) -> List[Dict]:
             maxResults=max_results
         )
         response = request.execute()
-        
-        videos = []
-        for item in response['items']:
-            video_id = item['contentDetails']['videoId']
-            video_details = _fetch_video_details(video_id)
-            videos.append(video_details)
-        
-        return videos
+
+        return [item['contentDetails']['videoId'] for item in response['items']]
     except HttpError as e:
         raise Exception(f"Error fetching videos: {str(e)}")
+
+def _fetch_videos(channel_id: str, max_results: int = 10) -> List[Dict]:
+    return [_fetch_video_details(video_id) for video_id in _fetch_upload_ids(channel_id, max_results)]
     
-def _fetch_comments(video_id: str, max_results: int = 25) -> List[Dict]:
-    comments: List[Dict] = []
+def _iter_comment_pages(video_id: str, max_results: int = 25) -> Iterator[Tuple[List[Dict], Optional[str]]]:
+    """
+    Yield the newest comments of a video one API page at a time, together with the
+    channel the video belongs to (if the API reported it).
+    """
+    fetched = 0
     next_page_token = None
 
     try:
-        while len(comments) < max_results:
+        while fetched < max_results:
             # fetch up to 100 per page (API limit), or however many you still need
-            batch_size = min(100, max_results - len(comments))
+            batch_size = min(100, max_results - fetched)
             request = youtube_api.youtube.commentThreads().list(
                 part="snippet",
                 videoId=video_id,
@@ -368,6 +690,8 @@ def _fetch_comments(video_id: str, max_results: int = 25) -> List[Dict]:
             )
             response = request.execute()
 
+            page: List[Dict] = []
+            channel_id = None
             for item in response.get('items', []):
                 top = item.get('snippet', {}).get('topLevelComment', {})
                 snip = top.get('snippet', {})
@@ -378,23 +702,154 @@ def _fetch_comments(video_id: str, max_results: int = 25) -> List[Dict]:
                 if not comment_id or text is None:
                     continue
 
-                comments.append({
+                page.append({
                     "id": comment_id,
                     "author": snip.get('authorDisplayName', 'Unknown'),
                     "text": text,
                     "likeCount": snip.get('likeCount', 0),
                     "publishedAt": snip.get('publishedAt')
                 })
+                channel_id = channel_id or item.get('snippet', {}).get('channelId')
+
+            fetched += len(page)
+            yield page, channel_id
 
             # prepare for next page (if any)
             next_page_token = response.get('nextPageToken')
             if not next_page_token:
                 break
 
-        return comments
-
     except HttpError as e:
         raise Exception(f"Error fetching comments: {e}")
+
+def _prefetch(iterator: Iterator) -> Iterator:
+    """
+    Iterate in the caller's thread while a background thread already fetches the next item,
+    so network waits overlap with whatever the caller does with the current one.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, iterator, None)
+        while True:
+            item = future.result()
+            if item is None:
+                return
+            future = executor.submit(next, iterator, None)
+            yield item
+
+def _fetch_comments(
+    video_id: str,
+    max_results: int = 25,
+    channel_id: Optional[str] = None,
+    collapse_duplicates: bool = False
+) -> List[Dict]:
+    comments: List[Dict] = []
+    for page, page_channel_id in _iter_comment_pages(video_id, max_results):
+        comments.extend(page)
+        channel_id = channel_id or page_channel_id
+
+    # Keep the per-video and per-channel sentiment aggregates up to date;
+    # only comments that are new or edited since the last fetch get scored
+    dedup = CommentDeduplicator()
+    _record_comments(comments, video_id, channel_id, dedup)
+
+    if collapse_duplicates:
+        return dedup.representatives()
+    return comments
+
+def _record_comments(comments: List[Dict], video_id: str, channel_id: Optional[str], dedup: CommentDeduplicator) -> None:
+    """
+    Run comments through the deduplicator, then store them. Emoji-only, spam and
+    near-duplicate comments are stored but not scored or counted in the aggregates.
+    """
+    statuses = dedup.add_with_status(comments)
+    excluded = {c["id"] for c, status in zip(comments, statuses) if status != "unique" and c.get("id")}
+    try:
+        get_sentiment_store().record_comments(comments, video_id, channel_id, excluded)
+    except Exception as e:
+        logger.warning(f"Could not update sentiment aggregates for video {video_id}: {e}")
+
+def _stream_comment_sentiment(
+    video_id: str,
+    max_comments: int = 500,
+    sample_size: int = 5,
+    collapse_duplicates: bool = True
+) -> Dict:
+    """
+    Fetch and score a video's comments as a pipeline: each page is scored while the next page
+    downloads. Only the sentiment distribution and a few of the most positive and most negative
+    comments are returned, never the full comment text.
+
+    Copy-paste, emoji-only and spam comments never reach the stored aggregates. With
+    `collapse_duplicates` they are also collapsed into like-weighted representatives for the
+    returned distribution; without it the distribution covers every fetched comment.
+    """
+    store = get_sentiment_store()
+    dedup = CommentDeduplicator()
+    comments: List[Dict] = []
+    channel_id = None
+    pages = 0
+
+    for page, page_channel_id in _prefetch(_iter_comment_pages(video_id, max_comments)):
+        pages += 1
+        channel_id = channel_id or page_channel_id
+        if not page:
+            continue
+
+        # Scores every new cluster of the page (memoized by text) and updates the running aggregates
+        _record_comments(page, video_id, channel_id, dedup)
+        if not collapse_duplicates:
+            comments.extend(page)
+
+    dedup_stats = dedup.stats() if collapse_duplicates else None
+    if collapse_duplicates:
+        comments = dedup.representatives()
+    if not comments:
+        return {"video_id": video_id, "count": 0, "pages": pages, "dedup": dedup_stats}
+
+    # Cluster founders were scored page by page above and are memo lookups; a representative
+    # replaced by a more-liked member, or a comment left uncollapsed, is scored here
+    scores = store.scores_for_texts([c["text"] for c in comments])
+    samples = [
+        {
+            "text": c["text"][:280],
+            "author": c["author"],
+            "likeCount": c["likeCount"],
+            "duplicates": c.get("duplicates", 0),
+            "sentiment": score
+        }
+        for c, score in zip(comments, scores.tolist())
+    ]
+
+    return {
+        "video_id": video_id,
+        "pages": pages,
+        **sentiment_distribution(scores, dedup.weights() if collapse_duplicates else None),
+        "dedup": dedup_stats,
+        "most_positive": heapq.nlargest(sample_size, samples, key=lambda c: c["sentiment"]),
+        "most_negative": heapq.nsmallest(sample_size, samples, key=lambda c: c["sentiment"]),
+    }
+
+def _video_sentiment(video_id: str, max_comments: int = 100) -> Dict:
+    """
+    Fetch the newest comments of a video and return its running sentiment aggregate.
+    Comments scored on earlier calls are not scored again.
+    """
+    _fetch_comments(video_id, max_comments)
+    return get_sentiment_store().aggregate("video", video_id)
+
+def _channel_sentiment(identifier: str, max_videos: int = 10, max_comments: int = 100) -> Dict:
+    """
+    Fetch the newest comments on a channel's recent uploads and return the channel's running
+    sentiment aggregate, which covers every comment recorded for the channel so far.
+    """
+    channel_id = _resolve_channel_id(identifier)
+    for video_id in _fetch_upload_ids(channel_id, max_videos):
+        try:
+            _fetch_comments(video_id, max_comments, channel_id=channel_id)
+        except Exception as e:
+            # Videos with comments disabled return 403; the rest of the channel still counts
+            logger.warning(f"Skipping comments for video {video_id}: {e}")
+    return get_sentiment_store().aggregate("channel", channel_id)
     
 def _introspect_channel(identifier: str, max_videos: int = 10) -> Dict:
     try:
@@ -494,19 +949,26 @@ def _search_youtube_channels(query: str, max_results: int = 5, min_subscribers:
     except Exception as e:
         return [{"error": str(e)}]
     
-def _fetch_video_statistics(channel_id: str, max_results: int = 10, months: int = 6, min_duration_minutes: int = 3) -> List[Dict]:
+def _fetch_video_statistics(
+    channel_id: str,
+    max_results: int = 10,
+    months: int = 6,
+    min_duration_minutes: int = 3,
+    uploads_playlist_id: Optional[str] = None
+) -> List[Dict]:
     try:
-        # First get the uploads playlist ID
-        request = youtube_api.youtube.channels().list(
-            part="contentDetails",
-            id=channel_id
-        )
-        response = request.execute()
-        
-        if not response['items']:
-            raise ValueError(f"Channel not found: {channel_id}")
-        
-        uploads_playlist_id = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+        # First get the uploads playlist ID (unless a bulk channel lookup already returned it)
+        if uploads_playlist_id is None:
+            request = youtube_api.youtube.channels().list(
+                part="contentDetails",
+                id=channel_id
+            )
+            response = request.execute()
+
+            if not response['items']:
+                raise ValueError(f"Channel not found: {channel_id}")
+
+            uploads_playlist_id = response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
         
         # Then get the videos from the uploads playlist
         request = youtube_api.youtube.playlistItems().list(
@@ -600,6 +1062,134 @@ def _fetch_video_statistics(channel_id: str, max_results: int = 10, months: int
     except HttpError as e:
         raise Exception(f"Error fetching video statistics: {str(e)}")
 
+def _fetch_channels_bulk(channel_ids: List[str]) -> Dict[str, Dict]:
+    """
+    Channel info (as in _fetch_channel_info) plus the uploads playlist ID for many channels,
+    with one channels.list call per 50 channels.
+    """
+    channels: Dict[str, Dict] = {}
+    ids = list(dict.fromkeys(channel_ids))
+    try:
+        for i in range(0, len(ids), 50):
+            response = youtube_api.youtube.channels().list(
+                part="snippet,statistics,contentDetails",
+                id=",".join(ids[i:i + 50]),
+                maxResults=50
+            ).execute()
+            for channel in response.get('items', []):
+                statistics = channel.get('statistics', {})
+                channels[channel['id']] = {
+                    "id": channel['id'],
+                    "title": channel['snippet']['title'],
+                    "description": channel['snippet']['description'],
+                    "subscriberCount": int(statistics.get('subscriberCount', 0)),
+                    "viewCount": int(statistics.get('viewCount', 0)),
+                    "videoCount": int(statistics.get('videoCount', 0)),
+                    "thumbnails": channel['snippet']['thumbnails'],
+                    "uploadsPlaylistId": channel['contentDetails']['relatedPlaylists']['uploads'],
+                }
+    except HttpError as e:
+        raise Exception(f"Error fetching channel info: {str(e)}")
+    return channels
+
+def _channel_report_data(
+    identifiers: List[str],
+    max_results: int = 10,
+    months: int = 6,
+    confidence_level: float = 0.90
+) -> Dict:
+    """
+    Everything a channel report needs, for many channels: channel info from one bulk lookup,
+    recent video statistics, engagement metrics and the next-video views forecast.
+
+    Returns:
+        Dict: channels (info, videos, metrics, forecast per channel) and skipped (identifier → reason)
+    """
+    skipped: Dict[str, str] = {}
+    resolved: Dict[str, str] = {}
+    for identifier in dict.fromkeys(identifiers):
+        try:
+            resolved[identifier] = _resolve_channel_id(identifier)
+        except Exception as e:
+            skipped[identifier] = str(e)
+
+    info = _fetch_channels_bulk(list(resolved.values()))
+    channels = []
+    for identifier, channel_id in resolved.items():
+        if channel_id not in info or any(c["info"]["id"] == channel_id for c in channels):
+            skipped.setdefault(identifier, "channel not found" if channel_id not in info else "duplicate")
+            continue
+        try:
+            videos = _fetch_video_statistics(
+                channel_id, max_results, months, uploads_playlist_id=info[channel_id]["uploadsPlaylistId"]
+            )
+            if not videos:
+                skipped[identifier] = "no recent videos"
+                continue
+            views = [max(v["viewCount"], 1) for v in videos]
+            forecast = forecast_views([views], confidence_level)
+            channels.append({
+                "info": info[channel_id],
+                "videos": videos,
+                "metrics": influencer_metrics(videos, confidence_level=confidence_level),
+                "forecast": {
+                    "median": float(forecast["median"][0]),
+                    "lower": float(forecast["lower"][0]),
+                    "upper": float(forecast["upper"][0]),
+                    "confidence_level": confidence_level,
+                },
+            })
+        except Exception as e:
+            skipped[identifier] = str(e)
+    return {"channels": channels, "skipped": skipped}
+
+def _fetch_video_snippets(video_ids: List[str]) -> List[Dict]:
+    """
+    Title, description and publish date of many videos, with one videos.list call per 50 IDs.
+    """
+    videos = []
+    try:
+        for i in range(0, len(video_ids), 50):
+            response = youtube_api.youtube.videos().list(
+                part="snippet",
+                id=",".join(video_ids[i:i + 50]),
+                maxResults=50
+            ).execute()
+            for video in response.get('items', []):
+                videos.append({
+                    "videoId": video['id'],
+                    "title": video['snippet']['title'],
+                    "description": video['snippet'].get('description', ''),
+                    "publishedAt": video['snippet']['publishedAt'],
+                    "channelTitle": video['snippet'].get('channelTitle', ''),
+                })
+    except HttpError as e:
+        raise Exception(f"Error fetching videos: {str(e)}")
+    return videos
+
+def _scan_channel_sponsors(identifier: str, max_videos: int = 10) -> Dict:
+    """
+    Quick sponsorship check of a channel from the descriptions of its recent uploads: named
+    sponsors, discount codes and disclosure markers per video, without downloading any video.
+    """
+    channel_id = _resolve_channel_id(identifier)
+    videos = _fetch_video_snippets(_fetch_upload_ids(channel_id, max_videos))
+    for video in videos:
+        video["scan"] = scan_description(video.pop("description"))
+    return {
+        "channel_id": channel_id,
+        "title": videos[0]["channelTitle"] if videos else channel_id,
+        **summarize_scans(videos),
+        "videos": videos,
+    }
+
+def _scan_video_sponsors(video_id: str) -> Dict:
+    """
+    Quick sponsorship check of one video from its description.
+    """
+    video = _fetch_video_details(video_id)
+    return {"videoId": video["id"], "title": video["title"], "scan": scan_description(video["description"])}
+
 def _search_and_introspect_channel(query: str, video_count: int = 5) -> Dict:
         try:
             # Step 1: Search channels
@@ -632,9 +1222,9 @@ def _search_and_introspect_channel(query: str, video_count: int = 5) -> Dict:
             return {"error": str(e)}
 
 def _video_to_text(video_id: str) -> str:
-    # Initialize Whisper model
+    # Whisper model, loaded once per process and shared by later transcriptions
     model_size = "base"
-    whisper_model = whisper.load_model(model_size)
+    whisper_model = get_model(f"whisper:{model_size}", lambda: whisper.load_model(model_size))
     
     # Download video with more reliable format options
     ydl_opts = {
@@ -664,15 +1254,165 @@ def _video_to_text(video_id: str) -> str:
             os.remove(video_path)
         raise e
     
-def _analyze_video_content(video_id: str) -> Dict:
+def _sample_keyframes(
+    video_path: str,
+    sample_rate: float = VISUAL_SAMPLE_RATE,
+    max_frames: int = VISUAL_MAX_FRAMES
+) -> Tuple[List[Tuple[float, Image.Image]], float]:
+    """
+    Sample frames from a video by seeking to fixed timestamps instead of decoding
+    every frame. Frames that look the same as the last kept frame are dropped, so
+    only scene changes (or one frame per VISUAL_MAX_GAP seconds) reach CLIP.
+    Returns at most `max_frames` (timestamp_seconds, image) pairs and the sampling
+    interval in seconds, which is wider than 1 / sample_rate for long videos.
+    """
+    if sample_rate <= 0:
+        raise ValueError("Sample rate must be positive")
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video: {video_path}")
+
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0.0
+        duration = frame_count / fps if fps > 0 and frame_count > 0 else 0.0
+
+        # Widen the sampling interval for long videos so the budget covers the whole video
+        interval = 1.0 / sample_rate
+        if duration:
+            interval = max(interval, duration / max_frames)
+
+        frames: List[Tuple[float, Image.Image]] = []
+        prev_small = None
+        last_kept = None
+        t = 0.0
+        while len(frames) < max_frames and (not duration or t < duration):
+            # Seeking lets the demuxer jump to the nearest keyframe instead of decoding everything
+            cap.set(cv2.CAP_PROP_POS_MSEC, t * 1000)
+            ok, frame = cap.read()
+            if not ok:
+                break
+
+            small = cv2.cvtColor(cv2.resize(frame, (64, 36)), cv2.COLOR_BGR2GRAY)
+            changed = (
+                prev_small is None
+                or float(np.mean(cv2.absdiff(small, prev_small))) / 255.0 >= SCENE_CHANGE_THRESHOLD
+            )
+            if changed or last_kept is None or t - last_kept >= VISUAL_MAX_GAP:
+                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                frames.append((round(t, 2), Image.fromarray(rgb)))
+                prev_small = small
+                last_kept = t
+
+            t += interval
+
+        logger.info(f"Sampled {len(frames)} frames from {video_path} (interval {interval:.1f}s)")
+        return frames, interval
+    finally:
+        cap.release()
+
+def _detect_visual_sponsors(
+    frames: List[Tuple[float, Image.Image]],
+    brands: List[str],
+    batch_size: int = VISUAL_BATCH_SIZE
+) -> List[Dict]:
+    """
+    Score sampled frames against brand/logo prompts with the thumbnail CLIP model.
+    Returns one hit per frame whose best prompt is a sponsor prompt above
+    VISUAL_HIT_THRESHOLD.
+    """
+    if not frames:
+        return []
+
+    # Each prompt maps to a sponsor label; background prompts map to None
+    prompts: List[str] = []
+    labels: List[Union[str, None]] = []
+    for brand in brands:
+        prompts += [f"the {brand} logo", f"a {brand} product"]
+        labels += [brand, brand]
+    prompts += SPONSOR_VISUAL_PROMPTS
+    labels += ["unknown sponsor"] * len(SPONSOR_VISUAL_PROMPTS)
+    prompts += BACKGROUND_VISUAL_PROMPTS
+    labels += [None] * len(BACKGROUND_VISUAL_PROMPTS)
+
+    hits = []
+    txt_feats = encode_prompts(prompts)
+    for i in range(0, len(frames), batch_size):
+        batch = frames[i:i + batch_size]
+        img_feats = encode_images([img for _, img in batch])
+
+        with torch.inference_mode():
+            probs = ((img_feats @ txt_feats.T) / TEMPERATURE).softmax(dim=-1)
+        for (timestamp, _), frame_probs in zip(batch, probs):
+            best = int(frame_probs.argmax())
+            confidence = float(frame_probs[best])
+            if labels[best] is not None and confidence >= VISUAL_HIT_THRESHOLD:
+                hits.append({
+                    "time": timestamp,
+                    "sponsor": labels[best],
+                    "prompt": prompts[best],
+                    "confidence": round(confidence, 3)
+                })
+
+    return hits
+
+def _merge_sponsor_timeline(scenes: List[Dict], visual_hits: List[Dict], hit_duration: float) -> List[Dict]:
+    """
+    Merge transcript sponsor scenes and visual hits into one sorted timeline.
+    Overlapping or adjacent segments of the same sponsor are collapsed into one.
+    """
+    events = [
+        {"start": s["start"], "end": s["end"], "sponsor": str(s["sponsor"]), "sources": ["transcript"]}
+        for s in scenes if s.get("sponsor")
+    ]
+    events += [
+        {
+            "start": h["time"],
+            "end": h["time"] + hit_duration,
+            "sponsor": h["sponsor"],
+            "sources": ["visual"],
+            "confidence": h["confidence"]
+        }
+        for h in visual_hits
+    ]
+    events.sort(key=lambda e: (e["start"], e["end"]))
+
+    timeline: List[Dict] = []
+    for event in events:
+        last = timeline[-1] if timeline else None
+        if (
+            last is not None
+            and last["sponsor"].lower() == event["sponsor"].lower()
+            and event["start"] <= last["end"]
+        ):
+            last["end"] = max(last["end"], event["end"])
+            last["sources"] = sorted(set(last["sources"]) | set(event["sources"]))
+            if "confidence" in event:
+                last["confidence"] = max(last.get("confidence", 0.0), event["confidence"])
+        else:
+            timeline.append(dict(event))
+
+    return timeline
+
+def _analyze_video_content(
+    video_id: str,
+    sample_rate: float = VISUAL_SAMPLE_RATE,
+    max_frames: int = VISUAL_MAX_FRAMES
+) -> Dict:
+    # Validate before paying for the transcription and the download
+    if sample_rate <= 0:
+        raise ValueError(f"sample_rate must be positive, got {sample_rate}")
+    if max_frames < 1:
+        raise ValueError(f"max_frames must be at least 1, got {max_frames}")
     try:
         # Get video transcription
         transcription = _video_to_text(video_id)
         
-        # Download video for metadata with the same format settings that work
+        # Download a low-resolution video-only stream for metadata and keyframe sampling
         ydl_opts = {
-            'format': 'bestaudio/best',  # Using the same format that works in _video_to_text
-            'outtmpl': f'{tempfile.gettempdir()}/%(id)s.%(ext)s',
+            'format': 'bestvideo[height<=360]/best[height<=360]/worst',
+            'outtmpl': f'{tempfile.gettempdir()}/%(id)s.visual.%(ext)s',
             'quiet': False,
             'no_warnings': False,
             'progress': True
@@ -681,7 +1421,7 @@ def _analyze_video_content(video_id: str) -> Dict:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             url = f"https://www.youtube.com/watch?v={video_id}"
             info = ydl.extract_info(url, download=True)
-            video_path = f"{tempfile.gettempdir()}/{video_id}.{info['ext']}"
+            video_path = ydl.prepare_filename(info)
             description = info.get('description', '')
             title = info.get('title', '')
         
@@ -749,9 +1489,22 @@ def _analyze_video_content(video_id: str) -> Dict:
                 sponsor_names = sponsor_response.content.strip().split(',')
                 sponsors = [{'name': name.strip()} for name in sponsor_names if name.strip()]
             
+            # Visual track: look for the known sponsors (and generic overlays) in sampled keyframes
+            brands = {s['name'] for s in sponsors}
+            brands |= {str(scene['sponsor']).strip() for scene in scenes if scene['sponsor']}
+            visual_hits = []
+            interval = 0.0  # set by _sample_keyframes; only visual hits use it, and they need sampled frames
+            try:
+                frames, interval = _sample_keyframes(video_path, sample_rate, max_frames)
+                visual_hits = _detect_visual_sponsors(frames, sorted(b for b in brands if b))
+            except Exception as e:
+                logger.warning(f"Visual sponsor detection failed for {video_id}: {e}")
+            
             return {
                 "scenes": scenes,
                 "sponsors": sponsors,
+                "visual_hits": visual_hits,
+                "timeline": _merge_sponsor_timeline(scenes, visual_hits, interval),
                 "metadata": {
                     "title": title,
                     "description": description
@@ -838,6 +1591,72 @@ def predict_next_video_views(
     """
     return _predict_next_video_views(historical_views, confidence_level, interval_type)
 
+# Resolved YouTube profile URLs, shared across crawls
+_youtube_link_cache: Dict[str, Optional[Dict]] = {}
+
+def _resolve_youtube_links(urls: Iterable[str]) -> Dict[str, Dict]:
+    """
+    Resolve YouTube profile URLs (/@handle, /channel/ID, /user/name, /c/name) to channel IDs.
+    Handles and usernames cost one channels.list call each, legacy /c/ URLs fall back to
+    search, and all IDs are verified (with their titles) in bulk calls of 50.
+    """
+    urls = list(urls)
+    pending = {url for url in urls if url not in _youtube_link_cache}
+    candidate_ids: Dict[str, str] = {}
+    for url in pending:
+        path = url.split("youtube.com/", 1)[-1]
+        try:
+            if path.startswith("channel/"):
+                candidate_ids[url] = path.split("/")[1]
+                continue
+            if path.startswith("@"):
+                response = youtube_api.youtube.channels().list(part="id", forHandle=path).execute()
+            elif path.startswith("user/"):
+                response = youtube_api.youtube.channels().list(part="id", forUsername=path.split("/")[1]).execute()
+            else:
+                candidate_ids[url] = _resolve_channel_id(url)
+                continue
+            if response.get('items'):
+                candidate_ids[url] = response['items'][0]['id']
+        except Exception as e:
+            logger.warning(f"Could not resolve YouTube link {url}: {e}")
+
+    ids = sorted(set(candidate_ids.values()))
+    titles: Dict[str, str] = {}
+    for i in range(0, len(ids), 50):
+        try:
+            response = youtube_api.youtube.channels().list(part="snippet", id=",".join(ids[i:i + 50])).execute()
+            titles.update((item['id'], item['snippet']['title']) for item in response.get('items', []))
+        except HttpError as e:
+            logger.warning(f"Could not verify YouTube channel IDs: {e}")
+
+    for url in pending:
+        channel_id = candidate_ids.get(url)
+        _youtube_link_cache[url] = (
+            {"channel_id": channel_id, "title": titles[channel_id]} if channel_id in titles else None
+        )
+    return {url: _youtube_link_cache[url] for url in urls if _youtube_link_cache.get(url)}
+
+def _extract_page_rosters(pages: List) -> List[Optional[Dict]]:
+    """
+    Roster of every crawled page (None where extraction failed). Social profiles and contact
+    details are harvested from the markup first; the LLM only reads what is left (names, bios,
+    categories).
+    """
+    harvested = [
+        extract_page_links(getattr(page, "html", None), getattr(page, "markdown", None), page_url(page))
+        for page in pages
+    ]
+    residue = [
+        SimpleNamespace(url=page_url(page), markdown=residue_markdown(page_text(page)))
+        for page in pages
+    ]
+    youtube_ids = _resolve_youtube_links(youtube_links(harvested))
+    return [
+        merge_link_cards(roster, [links], youtube_ids) if roster is not None else None
+        for roster, links in zip(extract_page_talents(residue), harvested)
+    ]
+
 def _crawl_talent_agency(agency_url: str, limit: int = 20) -> Dict:
     """
     Crawl a talent agency website to extract information about their talents/influencers.
@@ -849,81 +1668,54 @@ def _crawl_talent_agency(agency_url: str, limit: int = 20) -> Dict:
     Returns:
         Dict: A dictionary containing:
             - agency_name: Name of the talent agency
-            - talents: List of talent information including:
+            - agency_contact: Dictionary with email, phone and address
+            - talents: List of talent information (deduplicated by name and social handle) including:
                 - name: Talent's name
                 - social_links: Dictionary of social media links
                 - bio: Short biography
-                - categories: List of talent categories
-                - stats: Dictionary of social media statistics
+                - categories: Content niches
+                - email: Talent's own contact e-mail, when listed on the site
+                - youtube_channel_id: Verified channel ID of the talent's YouTube profile
+            - unassigned_links: Profile links found on the site that could not be tied to a named talent
+            - added, removed: Talents that joined or left the roster since the previous crawl
+              (every talent counts as added on the first crawl)
+            - first_crawl: Whether the agency had not been crawled before
+            - pages, changed_pages, unchanged_pages, failed_pages, removed_pages: Page counts of this
+              crawl; unchanged pages reuse the talents stored at the previous crawl
     """
     try:
-        
-        # Initialize Firecrawl
-        app = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
-        
-        # Configure scraping options
-        scrape_options = ScrapeOptions(
-            formats=['markdown', 'html'],
-            onlyMainContent=True,
-            excludeTags=['script', 'style', 'nav', 'footer', 'header']
-        )
-        
-        # Crawl the website
-        crawl_result = app.crawl_url(
-            agency_url,
-            limit=limit,
-            scrape_options=scrape_options
-        )
-        
-        # Create an agent to parse the crawled content
-        parser_agent = Agent(
-            name="Talent Parser",
-            role="Parse talent agency website content to extract talent information",
-            model=OpenAIChat(id="gpt-4.1-mini"),
-            instructions=[
-                "Extract the following information from the website content:",
-                "1. Agency name",
-                "2. Agency contact information (email, phone, address)",
-                "3. List of talents with:",
-                "   - Name",
-                "   - Social media links (YouTube, Instagram, etc.)",
-                "   - Brief bio (1-2 sentences)",
-                "Return the data in this JSON format:",
-                "{",
-                "  'agency_name': 'string',",
-                "  'agency_contact': {",
-                "    'email': 'string',",
-                "    'phone': 'string',",
-                "    'address': 'string'",
-                "  },",
-                "  'talents': [",
-                "    {",
-                "      'name': 'string',",
-                "      'social_links': {",
-                "        'youtube': 'string',",
-                "        'instagram': 'string',",
-                "        'other': 'string'",
-                "      },",
-                "      'bio': 'string'",
-                "    }",
-                "  ]",
-                "}"
-            ]
-        )
-        
-        # Parse the crawled content
-        parsed_content = parser_agent.run(f"Website content: {crawl_result}")
-        
-        try:
-            # Convert string response to dictionary
-            talent_data = eval(parsed_content.content)
-            return talent_data
-        except:
-            # Fallback in case of parsing error
-            return {
-                "error": "Failed to parse talent information",
-                "raw_content": crawl_result
-            }
-            
+        # Extraction runs while the crawl is still in progress
+        return start_talent_crawl(agency_url, limit, _extract_page_rosters).wait()
     except Exception as e:
-        raise Exception(f"Error crawling talent agency: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Error crawling talent agency: {str(e)}")
+
+def _start_talent_crawls(agency_urls: List[str], limit: int = 20) -> Dict:
+    """
+    Submit crawl jobs for several agencies at once. Each job crawls in the background and
+    extracts pages as they arrive; poll them with _talent_crawl_status.
+
+    Returns:
+        Dict: jobs (job_id, agency_url, status) and errors for agencies that could not be submitted
+    """
+    jobs, errors = [], []
+    for agency_url in dict.fromkeys(agency_urls):
+        try:
+            job = start_talent_crawl(agency_url, limit, _extract_page_rosters)
+            jobs.append({"job_id": job.job_id, "agency_url": agency_url, "status": job.status})
+        except Exception as e:
+            errors.append({"agency_url": agency_url, "error": str(e)})
+    return {"jobs": jobs, "errors": errors}
+
+def _talent_crawl_status(job_ids: List[str], wait_seconds: float = 10) -> Dict:
+    """
+    Progress and rosters of crawl jobs, waiting up to `wait_seconds` for all of them to finish.
+    Unfinished jobs report the talents found on the pages handled so far.
+
+    Returns:
+        Dict: jobs (one snapshot per job) and all_done
+    """
+    jobs = [get_crawl_job(job_id) for job_id in job_ids]
+    deadline = time.monotonic() + max(wait_seconds, 0)
+    for job in jobs:
+        job.join(max(deadline - time.monotonic(), 0))
+    return {"jobs": [job.snapshot() for job in jobs], "all_done": all(job.done for job in jobs)}
\ No newline at end of file
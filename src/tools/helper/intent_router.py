@@ -0,0 +1,275 @@
+import os
+import re
+import time
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.tools.helper.lazy import lazy_import
+from src.tools.helper.metrics import influencer_metrics
+from src.tools.helper.channel_reports import _percent, videos_table
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Set INTENT_ROUTER=0 to send every message through the agent team
+INTENT_ROUTER = os.getenv("INTENT_ROUTER", "1").lower() not in ("0", "false", "no")
+# Videos looked at when a question does not say how many
+ROUTER_DEFAULT_VIDEOS = 10
+ROUTER_MAX_VIDEOS = 50
+# Same window the video statistics tools use by default
+ROUTER_MONTHS = 6
+
+# The YouTube helpers (and their API client) load with the first routed question
+helper = lazy_import("src.tools.helper.helper")
+
+# ─── Message patterns ──────────────────────────────────────────────────────────
+# Explicit channel identifiers: @handle, channel ID or channel URL
+_EXPLICIT = r"@[\w.-]+|UC[\w-]{22}|https?://(?:www\.|m\.)?youtube\.com/\S+"
+_CHANNEL = rf"(?P<channel>{_EXPLICIT}|[\w][\w .&'’-]{{0,48}}?)"
+_EXPLICIT_CHANNEL = rf"(?P<channel>{_EXPLICIT})"
+# A video URL, or a bare 11-character ID right after the word "video"
+_VIDEO = r"(?:the )?(?:video )?(?P<video>https?://(?:www\.|m\.)?(?:youtube\.com/(?:watch\?v=|shorts/)|youtu\.be/)[\w-]{11}\S*|(?<=video )[\w-]{11})"
+_COUNT = r"(?P<count>\d{1,2})"
+_LAST_N = rf"(?: (?:over|for|across|in|from) (?:the|its|their|his|her) (?:last|latest|recent) {_COUNT} videos)?"
+_GET = r"(?:what(?:'s|’s| is| are) |get |show(?: me)? |give me |fetch |list |check |calculate |compute )?(?:the )?"
+_TAIL = r"(?: on youtube)?(?: (?:right )?now| currently| today| at the moment| recently| lately)?"
+
+_PREFIX_RE = re.compile(
+    r"^(?:(?:hey|hi|hello|please|pls|quick question|ok|okay)\b[,!:]?\s*)*"
+    r"(?:(?:can|could|would) you (?:please )?(?:tell me|check|look up|find out|get|show me|give me)\s+|"
+    r"(?:please )?(?:tell me|i want to know|i'd like to know|do you know)\s+)?",
+    re.IGNORECASE
+)
+_SUFFIX_RE = re.compile(r"(?:[\s,]+please)?[\s?.!]*$", re.IGNORECASE)
+
+# Channel "names" that are really references to something else (left to the team and its memory)
+_NOT_CHANNELS = {
+    "a", "an", "the", "this", "that", "these", "those", "my", "your", "his", "her", "their", "its", "our",
+    "he", "she", "they", "it", "him", "them", "each", "every", "some", "any", "all", "which", "what", "who",
+    "top", "best", "most", "average", "typical", "channels", "creators", "influencers", "youtubers",
+}
+
+
+def _number(value: float) -> str:
+    return f"{value:,.0f}"
+
+
+def _channel(match: re.Match) -> Optional[str]:
+    """
+    The channel identifier of a match, or None when it looks like a reference, a list of
+    channels or a description rather than one channel.
+    """
+    channel = match.group("channel").strip(" \"'“”")
+    if re.fullmatch(_EXPLICIT, channel):
+        return channel
+    channel = re.sub(r"(?:'s|’s)?\s+(?:youtube\s+)?channel$", "", channel, flags=re.IGNORECASE).strip()
+    words = channel.lower().split()
+    if not words or words[0] in _NOT_CHANNELS or re.search(r",| and | vs\.? | or |\bvideos?\b", channel.lower()):
+        return None
+    return channel
+
+
+def _count(match: re.Match) -> int:
+    count = match.groupdict().get("count")
+    return min(int(count), ROUTER_MAX_VIDEOS) if count else ROUTER_DEFAULT_VIDEOS
+
+
+def _video_id(match: re.Match) -> str:
+    video = match.group("video")
+    found = re.search(r"(?:v=|youtu\.be/|shorts/)([\w-]{11})", video)
+    return found.group(1) if found else video
+
+
+# ─── Intent handlers ───────────────────────────────────────────────────────────
+# Each handler takes the message match and returns (markdown answer, raw data)
+
+def _channel_lookup(match: re.Match) -> Tuple[str, Dict]:
+    channel_id = helper._resolve_channel_id(_channel(match))
+    info = {k: v for k, v in helper._fetch_channel_info(channel_id).items() if k != "thumbnails"}
+    subscribers, views, videos = _number(info["subscriberCount"]), _number(info["viewCount"]), _number(info["videoCount"])
+    if match.group("metric").lower().startswith("view"):
+        content = f"**{info['title']}** has **{views}** total views across {videos} videos ({subscribers} subscribers)."
+    else:
+        content = f"**{info['title']}** has **{subscribers}** subscribers ({views} total views across {videos} videos)."
+    return f"{content}\n\nChannel ID: `{channel_id}`", info
+
+
+def _channel_videos(match: re.Match) -> Tuple[Dict, List[Dict]]:
+    channel_id = helper._resolve_channel_id(_channel(match))
+    info = helper._fetch_channels_bulk([channel_id]).get(channel_id)
+    if info is None:
+        raise ValueError(f"Channel not found: {channel_id}")
+    videos = helper._fetch_video_statistics(
+        channel_id, _count(match), ROUTER_MONTHS, uploads_playlist_id=info["uploadsPlaylistId"]
+    )
+    if not videos:
+        raise ValueError(f"No videos longer than 3 minutes in the last {ROUTER_MONTHS} months")
+    return info, videos
+
+
+def _recent_video_stats(match: re.Match) -> Tuple[str, Dict]:
+    info, videos = _channel_videos(match)
+    metrics = influencer_metrics(videos)
+    lines = [
+        f"### Last {len(videos)} videos of {info['title']}",
+        "",
+        *videos_table(videos, len(videos)),
+        "",
+        f"Median views **{_number(metrics['expected_views']['value'])}**, mean views {_number(metrics['mean_views'])}, "
+        f"median engagement rate {_percent(metrics['engagement_rate']['value'])}.",
+        f"_Videos longer than 3 minutes published in the last {ROUTER_MONTHS} months._",
+    ]
+    return "\n".join(lines), {"channel_id": info["id"], "videos": videos, "metrics": metrics}
+
+
+def _median_views(match: re.Match) -> Tuple[str, Dict]:
+    info, videos = _channel_videos(match)
+    metrics = influencer_metrics(videos)
+    views = metrics["expected_views"]
+    content = (
+        f"Median views of **{info['title']}** over the last {metrics['videos']} videos: **{_number(views['value'])}** "
+        f"({metrics['confidence_level'] * 100:.0f}% band {_number(views['low'])} – {_number(views['high'])}; "
+        f"mean {_number(metrics['mean_views'])}).\n\n"
+        f"_Videos longer than 3 minutes published in the last {ROUTER_MONTHS} months._"
+    )
+    return content, {"channel_id": info["id"], "videos": videos, "metrics": metrics}
+
+
+def _sponsor_signals(scan: Dict) -> str:
+    signals = scan["brands"] + [f"code {code}" for code in scan["codes"]]
+    signals += [marker for marker in scan["markers"] if marker not in ("sponsor mention", "promo code")]
+    return ", ".join(signals) or "sponsor mention"
+
+
+def _channel_sponsors(match: re.Match) -> Tuple[str, Dict]:
+    result = helper._scan_channel_sponsors(_channel(match), _count(match))
+    lines = [
+        f"**{result['title']}**: {result['sponsored_videos']} of the last {result['videos_checked']} videos "
+        f"carry sponsorship signals in their descriptions."
+    ]
+    if result["brands"]:
+        lines += ["", "Sponsors: " + ", ".join(f"**{b['name']}** ({b['videos']})" for b in result["brands"])]
+    sponsored = [v for v in result["videos"] if v["scan"]["sponsored"]]
+    if sponsored:
+        lines += ["", "| Published | Video | Signals |", "|---|---|---|"]
+        lines += [
+            f"| {v['publishedAt'][:10]} | [{v['title'].replace('|', '/')}](https://youtu.be/{v['videoId']}) "
+            f"| {_sponsor_signals(v['scan'])} |"
+            for v in sponsored
+        ]
+    lines += ["", "_Checked from video descriptions; ask for a full video analysis to find spoken or on-screen sponsors._"]
+    return "\n".join(lines), result
+
+
+def _video_sponsors(match: re.Match) -> Tuple[str, Dict]:
+    result = helper._scan_video_sponsors(_video_id(match))
+    if result["scan"]["sponsored"]:
+        content = f"**{result['title']}** shows sponsorship signals in its description: {_sponsor_signals(result['scan'])}."
+    else:
+        content = f"No sponsorship signals in the description of **{result['title']}**."
+    content += "\n\n_Checked from the description; ask for a full video analysis to find spoken or on-screen sponsors._"
+    return content, result
+
+
+class Intent:
+    """
+    A common question the router answers without the agent team: message patterns and the
+    helper calls that answer it.
+    """
+
+    def __init__(self, name: str, patterns: List[str], handler: Callable[[re.Match], Tuple[str, Dict]]):
+        self.name = name
+        self.patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        self.handler = handler
+
+
+# Checked in order; the first full match wins
+INTENTS = [
+    Intent("video_sponsors", [
+        rf"is {_VIDEO} sponsored{_TAIL}",
+        rf"(?:does|did) {_VIDEO} (?:have|contain|include|mention) (?:a |any )?(?:sponsors?|sponsorships?|ads?|paid promotion)",
+        rf"(?:check|scan|find|list|show(?: me)?)(?: the)? (?:sponsors?|sponsorships?|ads)(?: of| for| on| in) {_VIDEO}",
+    ], _video_sponsors),
+    Intent("channel_sponsors", [
+        rf"(?:does|has|is|did) {_CHANNEL} (?:have|had|do|done|doing|run|ran|running|use|using|got) (?:any )?"
+        rf"(?:sponsors|sponsorships|sponsored videos|sponsored content|sponsor deals|brand deals){_TAIL}{_LAST_N}",
+        rf"(?:who|which brands?|what brands?|which companies|what companies) (?:sponsors?|sponsored|(?:has|have) sponsored|works? with|worked with) {_CHANNEL}{_TAIL}",
+        rf"(?:check|scan|find|list|show(?: me)?)(?: the)? (?:sponsors|sponsorships|sponsored videos|brand deals)(?: of| for| on| in| by) {_CHANNEL}{_LAST_N}",
+        rf"{_EXPLICIT_CHANNEL}(?:'s|’s)? (?:sponsors|sponsorships|brand deals){_LAST_N}",
+    ], _channel_sponsors),
+    Intent("median_views", [
+        rf"{_GET}median (?:views|view count)(?: per video)? (?:of|for|on) {_CHANNEL}{_LAST_N}{_TAIL}",
+        rf"{_EXPLICIT_CHANNEL}(?:'s|’s)? median views{_LAST_N}",
+        rf"how many views does {_CHANNEL} (?:usually |typically |normally )?get (?:per|on an average|on a typical|on each) video",
+    ], _median_views),
+    Intent("recent_video_stats", [
+        rf"{_GET}(?:stats|statistics|numbers|performance|views)(?: for| of| on)? (?:the )?(?:last|latest|recent|most recent) "
+        rf"{_COUNT} (?:videos|uploads) (?:of|from|by|on) {_CHANNEL}{_TAIL}",
+        rf"{_GET}(?:last|latest|most recent) {_COUNT} (?:videos|uploads) (?:of|from|by|on) {_CHANNEL}(?: stats| statistics)?{_TAIL}",
+        rf"how (?:are|did|have) (?:the )?(?:last|latest) {_COUNT} (?:videos|uploads) (?:of|from|by) {_CHANNEL} (?:doing|done|performed|performing)",
+        rf"{_EXPLICIT_CHANNEL}(?:'s|’s)? (?:last|latest) {_COUNT} (?:videos|uploads)(?: stats| statistics)?",
+    ], _recent_video_stats),
+    Intent("channel_lookup", [
+        rf"how many (?P<metric>subscribers|subs|views) (?:does|do) {_CHANNEL} have{_TAIL}",
+        rf"how many (?P<metric>subscribers|subs|views) (?:has|have) {_CHANNEL} got{_TAIL}",
+        rf"{_GET}(?:current )?(?:total )?(?P<metric>subscriber|sub|view)s? count (?:of|for|on) {_CHANNEL}{_TAIL}",
+        rf"{_EXPLICIT_CHANNEL}(?:'s|’s)? (?:current )?(?:total )?(?P<metric>subscriber|sub|view)s?(?: count)?{_TAIL}",
+        rf"{_GET}(?P<metric>subscribers|views) (?:of|for|on) {_EXPLICIT_CHANNEL}{_TAIL}",
+    ], _channel_lookup),
+]
+
+
+def normalize_message(message: str) -> str:
+    message = " ".join(message.split())
+    return _SUFFIX_RE.sub("", _PREFIX_RE.sub("", message, count=1))
+
+
+def match_intent(message: str) -> Optional[Tuple[Intent, re.Match]]:
+    """
+    The intent a message asks for and its pattern match, or None for anything open-ended.
+    """
+    text = normalize_message(message)
+    for intent in INTENTS:
+        for pattern in intent.patterns:
+            match = pattern.fullmatch(text)
+            if match and ("channel" not in match.groupdict() or _channel(match)):
+                return intent, match
+    return None
+
+
+class RoutedResponse:
+    """
+    Answer produced by the router, with the `content` attribute of a team run response.
+    """
+
+    def __init__(self, content: str, intent: str, data: Dict, seconds: float):
+        self.content = content
+        self.intent = intent
+        self.data = data
+        self.seconds = seconds
+
+
+def route_message(message: str) -> Optional[RoutedResponse]:
+    """
+    Answer a common question (subscriber / view counts, last-N video stats, median views,
+    sponsor checks) by calling the YouTube helpers directly, skipping the coordinator and
+    member LLM calls. Returns None when the message is open-ended or the direct answer
+    fails, in which case the caller runs the agent team.
+    """
+    if not INTENT_ROUTER or not message:
+        return None
+    matched = match_intent(message)
+    if matched is None:
+        return None
+
+    intent, match = matched
+    start = time.perf_counter()
+    try:
+        content, data = intent.handler(match)
+    except Exception as e:
+        logger.warning(f"Intent {intent.name} could not be answered directly, using the team: {e}")
+        return None
+    seconds = time.perf_counter() - start
+    logger.info(f"Answered {intent.name} directly in {seconds:.2f} s")
+    return RoutedResponse(content, intent.name, data, seconds)
@@ -0,0 +1,290 @@
+import os
+import re
+import json
+import time
+import queue
+import atexit
+import base64
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Pre-started kernels kept ready for new sessions
+PYTHON_KERNEL_SPARES = int(os.getenv("PYTHON_KERNEL_SPARES", "1"))
+# Upper bound on live session kernels; the least recently used one is shut down beyond it
+PYTHON_KERNEL_MAX = int(os.getenv("PYTHON_KERNEL_MAX", "8"))
+# Session kernels idle for longer than this are shut down
+PYTHON_KERNEL_IDLE_SECONDS = int(os.getenv("PYTHON_KERNEL_IDLE_SECONDS", "1800"))
+# Maximum run time of a single code execution
+PYTHON_KERNEL_TIMEOUT = int(os.getenv("PYTHON_KERNEL_TIMEOUT", "120"))
+# Working directory of the kernels (same place PythonTools wrote its scripts)
+PYTHON_KERNEL_DIR = Path("tmp/python")
+
+# Run once in every kernel before it is handed to a session
+KERNEL_STARTUP_CODE = """
+import json, math, statistics
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+_startup_names = set(globals())
+"""
+
+# Lists the variables a session defined or had injected
+KERNEL_VARIABLES_CODE = """
+for _name, _value in list(globals().items()):
+    if not _name.startswith('_') and _name not in _startup_names:
+        print(_name, type(_value).__name__, getattr(_value, 'shape', ''))
+"""
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Conversation whose kernel the calculation tools use; set by the entry points around a team run
+_current_session: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("kernel_session", default=None)
+
+
+@contextmanager
+def kernel_session(session_id: str) -> Iterator[None]:
+    """
+    Run the enclosed team run with `session_id` as the kernel session. Tools called by any
+    agent of the run (in this thread or in asyncio tasks started from it) use that kernel.
+    """
+    token = _current_session.set(session_id)
+    try:
+        yield
+    finally:
+        _current_session.reset(token)
+
+
+def current_kernel_session() -> Optional[str]:
+    return _current_session.get()
+
+
+class WarmKernel:
+    """
+    One IPython kernel with the scientific stack already imported.
+    State (variables, imports, loaded data) persists between executions.
+    """
+
+    def __init__(self, cwd: Path = PYTHON_KERNEL_DIR):
+        from jupyter_client.manager import KernelManager
+
+        cwd.mkdir(parents=True, exist_ok=True)
+        self.manager = KernelManager(kernel_name="python3")
+        self.manager.start_kernel(cwd=str(cwd))
+        self.client = self.manager.client()
+        self.client.start_channels()
+        self.client.wait_for_ready(timeout=60)
+        self._lock = threading.Lock()
+        self.last_used = time.monotonic()
+
+        result = self.execute(KERNEL_STARTUP_CODE)
+        if result["error"]:
+            logger.warning(f"Kernel startup code failed: {result['error']}")
+
+    def execute(self, code: str, timeout: int = PYTHON_KERNEL_TIMEOUT) -> Dict[str, Any]:
+        """
+        Run code and collect its stdout, stderr, displayed results and error (if any).
+        """
+        with self._lock:
+            self.last_used = time.monotonic()
+            msg_id = self.client.execute(code, store_history=False, allow_stdin=False)
+            stdout: List[str] = []
+            stderr: List[str] = []
+            results: List[str] = []
+            error: Optional[str] = None
+            deadline = time.monotonic() + timeout
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.manager.interrupt_kernel()
+                    error = f"Execution timed out after {timeout} seconds and was interrupted"
+                    break
+                try:
+                    msg = self.client.get_iopub_msg(timeout=remaining)
+                except queue.Empty:
+                    continue
+                # Output of earlier (e.g. interrupted) executions is ignored
+                if msg.get("parent_header", {}).get("msg_id") != msg_id:
+                    continue
+
+                msg_type, content = msg["msg_type"], msg["content"]
+                if msg_type == "stream":
+                    (stdout if content["name"] == "stdout" else stderr).append(content["text"])
+                elif msg_type in ("execute_result", "display_data"):
+                    data = content.get("data", {})
+                    if "text/plain" in data:
+                        results.append(data["text/plain"])
+                    elif "image/png" in data:
+                        results.append("<image: save figures with plt.savefig(...) to keep them>")
+                elif msg_type == "error":
+                    error = _ANSI_RE.sub("", "\n".join(content.get("traceback", []))) or \
+                        f"{content.get('ename')}: {content.get('evalue')}"
+                elif msg_type == "status" and content.get("execution_state") == "idle":
+                    break
+
+            self.last_used = time.monotonic()
+            return {"stdout": "".join(stdout), "stderr": "".join(stderr), "results": results, "error": error}
+
+    def set_variables(self, variables: Dict[str, Any]) -> None:
+        """
+        Inject JSON-serializable values as globals. Every list of dicts additionally
+        becomes a pandas DataFrame called `<name>_df`.
+        """
+        for name in variables:
+            if not name.isidentifier():
+                raise ValueError(f"Invalid variable name: {name}")
+        payload = base64.b64encode(json.dumps(variables, default=str).encode("utf-8")).decode("ascii")
+        frames = [
+            f"{name}_df = pd.DataFrame({name})"
+            for name, value in variables.items()
+            if isinstance(value, list) and value and all(isinstance(v, dict) for v in value)
+        ]
+        code = "\n".join([
+            "import base64 as _b64",
+            f"globals().update(json.loads(_b64.b64decode('{payload}').decode('utf-8')))",
+            *frames,
+        ])
+        result = self.execute(code)
+        if result["error"]:
+            raise Exception(f"Could not inject variables into kernel: {result['error']}")
+
+    def variables(self) -> str:
+        """
+        Names, types and shapes of the user variables defined in the kernel.
+        """
+        result = self.execute(KERNEL_VARIABLES_CODE)
+        return result["error"] or result["stdout"]
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def shutdown(self) -> None:
+        try:
+            self.client.stop_channels()
+            self.manager.shutdown_kernel(now=True)
+        except Exception as e:
+            logger.warning(f"Error shutting down kernel: {e}")
+
+
+class KernelPool:
+    """
+    Hands every agent session its own warm kernel. Spare kernels are started in the
+    background so a new session does not wait for kernel start-up and library imports;
+    idle and least-recently-used session kernels are shut down.
+    """
+
+    def __init__(
+        self,
+        spares: int = PYTHON_KERNEL_SPARES,
+        max_kernels: int = PYTHON_KERNEL_MAX,
+        idle_seconds: int = PYTHON_KERNEL_IDLE_SECONDS
+    ):
+        self.spares = spares
+        self.max_kernels = max_kernels
+        self.idle_seconds = idle_seconds
+        self._sessions: Dict[str, WarmKernel] = {}
+        self._spare_kernels: List[WarmKernel] = []
+        self._starting = 0
+        self._lock = threading.Lock()
+
+    def _start_spare(self) -> None:
+        try:
+            kernel = WarmKernel()
+        except Exception as e:
+            logger.warning(f"Could not start spare kernel: {e}")
+            kernel = None
+        with self._lock:
+            self._starting -= 1
+            if kernel is not None:
+                self._spare_kernels.append(kernel)
+
+    def _refill(self) -> None:
+        with self._lock:
+            missing = self.spares - len(self._spare_kernels) - self._starting
+            self._starting += max(missing, 0)
+        for _ in range(max(missing, 0)):
+            threading.Thread(target=self._start_spare, daemon=True).start()
+
+    def _evict(self) -> List[WarmKernel]:
+        """
+        Remove idle sessions, then the least recently used ones above the limit. Kernels in the
+        middle of an execution are never evicted, so the pool can briefly exceed `max_kernels`.
+        Must be called with the lock held; returns the kernels to shut down.
+        """
+        now = time.monotonic()
+        candidates = [s for s, k in self._sessions.items() if not k.busy]
+        evicted = [s for s in candidates if now - self._sessions[s].last_used > self.idle_seconds]
+        by_age = sorted((s for s in candidates if s not in evicted), key=lambda s: self._sessions[s].last_used)
+        over_limit = len(self._sessions) - len(evicted) - self.max_kernels + 1
+        evicted += by_age[:max(over_limit, 0)]
+        return [self._sessions.pop(s) for s in evicted]
+
+    def get(self, session_id: str) -> WarmKernel:
+        """
+        Return the kernel of a session, assigning a warm one on first use.
+        """
+        with self._lock:
+            kernel = self._sessions.get(session_id)
+            if kernel is not None:
+                # Counts as use, so the kernel is not evicted before the caller runs code on it
+                kernel.last_used = time.monotonic()
+                return kernel
+            stale = self._evict()
+            kernel = self._spare_kernels.pop() if self._spare_kernels else None
+
+        for old in stale:
+            old.shutdown()
+        if kernel is None:
+            logger.info("No warm kernel available, starting one")
+            kernel = WarmKernel()
+
+        with self._lock:
+            # Another thread may have assigned a kernel to this session meanwhile
+            kernel.last_used = time.monotonic()
+            existing = self._sessions.setdefault(session_id, kernel)
+        if existing is not kernel:
+            kernel.shutdown()
+        self._refill()
+        return existing
+
+    def warm_up(self) -> None:
+        """
+        Start the spare kernels in the background.
+        """
+        self._refill()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            kernels = list(self._sessions.values()) + self._spare_kernels
+            self._sessions.clear()
+            self._spare_kernels.clear()
+        for kernel in kernels:
+            kernel.shutdown()
+
+
+_pool: Optional[KernelPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_kernel_pool() -> KernelPool:
+    """
+    Return the process-wide kernel pool; kernels are shut down at interpreter exit.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = KernelPool()
+                atexit.register(_pool.shutdown)
+    return _pool
@@ -0,0 +1,73 @@
+import time
+import logging
+import importlib
+import threading
+from types import ModuleType
+from typing import Dict
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Proxies by module name, so every caller shares one import
+_modules: Dict[str, "LazyModule"] = {}
+_registry_lock = threading.Lock()
+
+
+class LazyModule(ModuleType):
+    """
+    Stand-in for a heavy module (torch, whisper, cv2, yt_dlp, ...) that imports it on the
+    first attribute access, i.e. when a tool first uses it rather than at process startup.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            with self.__dict__["_lock"]:
+                module = self.__dict__["_module"]
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_module"] = module
+                    logger.info(f"Imported {self.__name__} in {time.perf_counter() - start:.2f} s")
+        return module
+
+    @property
+    def loaded(self) -> bool:
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Return a proxy for module `name` that is imported on first use.
+    """
+    with _registry_lock:
+        if name not in _modules:
+            _modules[name] = LazyModule(name)
+        return _modules[name]
+
+
+def load_all() -> Dict[str, float]:
+    """
+    Import every module registered with `lazy_import` that is not loaded yet, e.g. to warm
+    up a worker ahead of traffic. Returns the seconds spent per module.
+    """
+    with _registry_lock:
+        pending = [module for module in _modules.values() if not module.loaded]
+    timings = {}
+    for module in pending:
+        start = time.perf_counter()
+        module._load()
+        timings[module.__name__] = time.perf_counter() - start
+    return timings
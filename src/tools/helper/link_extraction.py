@@ -0,0 +1,410 @@
+import re
+import logging
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Host (without www./m.) → platform
+SOCIAL_HOSTS = {
+    "youtube.com": "youtube",
+    "youtu.be": "youtube",
+    "instagram.com": "instagram",
+    "tiktok.com": "tiktok",
+    "twitter.com": "twitter",
+    "x.com": "twitter",
+    "twitch.tv": "twitch",
+    "facebook.com": "facebook",
+}
+# First path segments that are content or share pages, not profiles
+NON_PROFILE_SEGMENTS = {
+    "share", "sharer", "sharer.php", "intent", "home", "watch", "embed", "shorts", "playlist", "results",
+    "p", "reel", "reels", "tv", "stories", "explore", "hashtag", "tag", "search", "i", "login", "signup",
+    "video", "videos", "feed", "privacy", "terms", "about", "help", "legal", "policies",
+}
+
+# Containers that can hold one talent card (or a grid of them)
+BLOCK_TAGS = {"body", "main", "section", "article", "div", "ul", "ol", "li", "figure", "table", "tr", "td", "p"}
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+# Elements without an end tag; they hold no text, so they never start a name capture
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr",
+}
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+# Phone numbers only where a label makes them unambiguous (plain digit runs are too often IDs or dates)
+PHONE_RE = re.compile(r"(?:phone|tel|call|mobile|whatsapp)\s*[:.]?\s*(\+?\d[\d\s().-]{6,}\d)", re.IGNORECASE)
+URL_RE = re.compile(r"https?://[^\s)\]>\"']+")
+MD_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+MD_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+# Separators between page name and site name in a <title>, e.g. "Roster | Acme Talent"
+TITLE_SEPARATOR_RE = re.compile(r"\s+[|\-–—·]\s+")
+# Pages with at least this many cards are listings (rosters); a card named after their heading is the page's own
+LISTING_MIN_CARDS = 3
+# Second-level labels of two-part public suffixes (agency.co.uk → agency)
+_SECOND_LEVEL_LABELS = {"co", "com", "org", "net", "ac", "gov", "edu"}
+
+
+def normalize_social_url(url: str) -> Optional[Tuple[str, str, str]]:
+    """
+    (platform, canonical profile URL, handle) for a social profile link, or None for
+    anything that is not a profile (posts, share buttons, other sites).
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return None
+    host = parts.netloc.lower().split(":")[0]
+    for prefix in ("www.", "m.", "mobile."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    platform = SOCIAL_HOSTS.get(host)
+    if platform is None:
+        return None
+
+    segments = [s for s in unquote(parts.path).split("/") if s]
+    if not segments or segments[0].lower() in NON_PROFILE_SEGMENTS:
+        return None
+
+    if platform == "youtube":
+        if host == "youtu.be":
+            return None  # video short link
+        first = segments[0]
+        if first.startswith("@"):
+            handle = first
+        elif first in ("channel", "c", "user") and len(segments) > 1:
+            handle = f"{first}/{segments[1]}"
+        else:
+            return None
+        return platform, f"https://www.youtube.com/{handle}", handle.lower()
+
+    handle = segments[0]
+    if platform == "tiktok" and not handle.startswith("@"):
+        return None
+    if platform == "facebook" and handle.lower() in ("pages", "groups", "events") and len(segments) > 1:
+        handle = f"{handle}/{segments[1]}"
+    canonical_host = {"twitter": "x.com", "tiktok": "www.tiktok.com"}.get(platform, f"www.{host}")
+    return platform, f"https://{canonical_host}/{handle}", handle.lower().lstrip("@")
+
+
+def normalize_phone(phone: str) -> str:
+    return re.sub(r"[^\d+]", "", phone)
+
+
+def _compact(text: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", text.lower())
+
+
+def site_label(url: Optional[str]) -> Optional[str]:
+    """
+    Registrable name of a site's domain, e.g. "acmetalent" for https://www.acme-talent.co.uk/roster.
+    """
+    if not url:
+        return None
+    try:
+        labels = urlsplit(url).netloc.lower().split(":")[0].split(".")
+    except ValueError:
+        return None
+    labels = [label for label in labels if label and label != "www"]
+    if all(label.isdigit() for label in labels):
+        return None  # IP address
+    if len(labels) >= 3 and labels[-2] in _SECOND_LEVEL_LABELS:
+        labels = labels[:-1]
+    return _compact(labels[-2]) if len(labels) >= 2 else None
+
+
+class _CardParser(HTMLParser):
+    """
+    Collects social links, e-mail/phone links and candidate names together with the block
+    element that contains them, so links can later be grouped into talent cards.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # node: parent index, names (document order, text), image alt texts
+        self.parents: List[Optional[int]] = [None]
+        self.names: List[List[Tuple[int, str]]] = [[]]
+        self.alts: List[List[Tuple[int, str]]] = [[]]
+        self.links: List[Tuple[int, str, str, str]] = []  # (node, platform, url, handle)
+        self.emails: List[Tuple[int, str]] = []
+        self.phones: List[Tuple[int, str]] = []
+        self.text: List[str] = []
+        self.title: List[str] = []
+        self.h1: Optional[str] = None
+        self.site_name: Optional[str] = None
+        self._in_title = False
+        self._stack: List[Tuple[str, int]] = [("#root", 0)]
+        # (tag, text parts, stack depth of the block the capture started in)
+        self._capture: Optional[Tuple[str, List[str], int]] = None
+        self._order = 0
+
+    @property
+    def _node(self) -> int:
+        return self._stack[-1][1]
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attrs = dict(attrs)
+        if tag in BLOCK_TAGS:
+            self.parents.append(self._node)
+            self.names.append([])
+            self.alts.append([])
+            self._stack.append((tag, len(self.parents) - 1))
+
+        if tag == "a" and attrs.get("href"):
+            href = attrs["href"].strip()
+            if href.lower().startswith("mailto:"):
+                email = unquote(href[7:].split("?")[0]).strip()
+                if EMAIL_RE.fullmatch(email):
+                    self.emails.append((self._node, email.lower()))
+            elif href.lower().startswith("tel:"):
+                self.phones.append((self._node, normalize_phone(unquote(href[4:]))))
+            else:
+                social = normalize_social_url(href)
+                if social:
+                    self.links.append((self._node, *social))
+        elif tag == "img" and attrs.get("alt"):
+            self._order += 1
+            self.alts[self._node].append((self._order, attrs["alt"].strip()))
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "meta" and attrs.get("property") == "og:site_name" and attrs.get("content"):
+            self.site_name = attrs["content"].strip()
+
+        css_class = (attrs.get("class") or "") + " " + (attrs.get("itemprop") or "")
+        if (
+            self._capture is None
+            and tag not in VOID_TAGS
+            and (tag in HEADING_TAGS or re.search(r"\b\w*name\w*\b", css_class, re.IGNORECASE))
+        ):
+            self._capture = (tag, [], len(self._stack))
+
+    def _finish_capture(self) -> None:
+        tag, parts, _ = self._capture
+        name = " ".join("".join(parts).split())
+        if 1 < len(name) <= 80:
+            self._order += 1
+            self.names[self._node].append((self._order, name))
+            if tag == "h1" and self.h1 is None:
+                self.h1 = name
+        self._capture = None
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._capture and self._capture[0] == tag:
+            self._finish_capture()
+        if tag == "title":
+            self._in_title = False
+        if tag in BLOCK_TAGS:
+            # Tolerate unclosed children: pop up to the matching block
+            for i in range(len(self._stack) - 1, 0, -1):
+                if self._stack[i][0] == tag:
+                    # A name element left open ends with the block around it
+                    if self._capture and self._capture[2] > i:
+                        self._finish_capture()
+                    del self._stack[i:]
+                    break
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title.append(data)
+            return
+        self.text.append(data)
+        if self._capture:
+            self._capture[1].append(data)
+
+
+def _subtree_handles(parser: _CardParser) -> List[Dict[str, Set[str]]]:
+    handles: List[Dict[str, Set[str]]] = [dict() for _ in parser.parents]
+    for node, platform, _, handle in parser.links:
+        handles[node].setdefault(platform, set()).add(handle)
+    # Children are always created after their parents, so one reverse pass aggregates subtrees
+    for node in range(len(parser.parents) - 1, 0, -1):
+        parent = parser.parents[node]
+        for platform, values in handles[node].items():
+            handles[parent].setdefault(platform, set()).update(values)
+    return handles
+
+
+def _first_in_subtree(parser: _CardParser, values: List[List[Tuple[int, str]]]) -> List[Optional[Tuple[int, str]]]:
+    first: List[Optional[Tuple[int, str]]] = [min(v) if v else None for v in values]
+    for node in range(len(parser.parents) - 1, 0, -1):
+        parent = parser.parents[node]
+        if first[node] and (first[parent] is None or first[node] < first[parent]):
+            first[parent] = first[node]
+    return first
+
+
+def _card_of(node: int, parser: _CardParser, handles: List[Dict[str, Set[str]]]) -> int:
+    """
+    The largest block around `node` that holds at most one profile per platform,
+    i.e. the talent card the link belongs to.
+    """
+    while True:
+        parent = parser.parents[node]
+        if parent is None or any(len(v) > 1 for v in handles[parent].values()):
+            return node
+        node = parent
+
+
+class _AgencyIdentity:
+    """
+    What identifies the agency itself on one of its pages: its domain, its site name and the
+    page's own heading. Used to keep the agency's social and contact links out of the talents.
+    """
+
+    def __init__(self, url: Optional[str], title: str = "", h1: Optional[str] = None, site_name: Optional[str] = None):
+        # "Roster | Acme Talent": the first part names the page, the rest the site
+        parts = [part.strip() for part in TITLE_SEPARATOR_RE.split(title) if part.strip()]
+        site_names = [site_name] if site_name else []
+        site_names += parts[1:]
+        self.site_names = {_compact(name) for name in site_names if _compact(name)}
+        self.page_names = {_compact(name) for name in [h1, *parts[:1]] if name and _compact(name)}
+        self.handles = set(self.site_names)
+        label = site_label(url)
+        if label:
+            self.handles.add(label)
+
+    def owns_handle(self, handle: str) -> bool:
+        # "channel/UC…" style handles never match a name; "@acmetalent" and "acme_talent" do
+        return _compact(handle.split("/")[-1]) in self.handles
+
+    def owns_card(self, card: Dict, listing: bool) -> bool:
+        name = _compact(card["name"] or "")
+        # On a roster the page heading names the page, not a talent; on a profile page it is the talent
+        return bool(name) and (name in self.site_names or (listing and name in self.page_names))
+
+
+def extract_page_links(html: Optional[str] = None, markdown: Optional[str] = None, url: Optional[str] = None) -> Dict:
+    """
+    Deterministically harvest social profiles, e-mails and phone numbers from one crawled page.
+
+    With HTML, links are grouped into talent cards (the largest element holding at most one
+    profile per platform) named after the card's first heading or name-like element. Pages
+    with only markdown yield a single group for the whole page.
+
+    Cards that belong to the agency itself are left out: cards whose profiles are the agency's
+    own handles (matching its domain or site name), cards named after the site, and on listing
+    pages cards named after the page heading ("Roster"). Their links are reported as
+    agency_links and their e-mails and phones as page-level contact details.
+
+    Returns:
+        Dict with url, cards (name, social_links, emails, phones), agency_links, and emails and
+        phones not inside any talent card (typically the agency's own contact details)
+    """
+    cards: Dict[int, Dict] = {}
+    page_emails: List[str] = []
+    page_phones: List[str] = []
+    agency_links: Dict[str, str] = {}
+
+    if html:
+        parser = _CardParser()
+        try:
+            parser.feed(html)
+            parser.close()
+        except Exception as e:
+            logger.warning(f"Could not parse HTML of {url}: {e}")
+        handles = _subtree_handles(parser)
+        names = _first_in_subtree(parser, parser.names)
+        alts = _first_in_subtree(parser, parser.alts)
+
+        agency = _AgencyIdentity(url, " ".join("".join(parser.title).split()), parser.h1, parser.site_name)
+
+        for node, platform, profile_url, handle in parser.links:
+            if agency.owns_handle(handle):
+                agency_links.setdefault(platform, profile_url)
+                continue
+            card = _card_of(node, parser, handles)
+            if card not in cards:
+                label = names[card] or alts[card]
+                cards[card] = {"name": label[1] if label else None, "social_links": {}, "emails": [], "phones": []}
+            cards[card]["social_links"].setdefault(platform, profile_url)
+
+        def owning_card(node: int) -> Optional[int]:
+            while node is not None:
+                if node in cards:
+                    return node
+                node = parser.parents[node]
+            return None
+
+        for key, found, page_level in (("emails", parser.emails, page_emails), ("phones", parser.phones, page_phones)):
+            for node, value in found:
+                card = owning_card(node)
+                target = cards[card][key] if card is not None else page_level
+                if value not in target:
+                    target.append(value)
+
+        listing = len(cards) >= LISTING_MIN_CARDS
+        for card in [c for c in cards if agency.owns_card(cards[c], listing)]:
+            own = cards.pop(card)
+            logger.info(f"Treating links of '{own['name']}' on {url} as the agency's own")
+            for platform, profile_url in own["social_links"].items():
+                agency_links.setdefault(platform, profile_url)
+            for key, page_level in (("emails", page_emails), ("phones", page_phones)):
+                page_level.extend(value for value in own[key] if value not in page_level)
+        text = " ".join(parser.text)
+    else:
+        text = markdown or ""
+        agency = _AgencyIdentity(url)
+        links = {}
+        for found in URL_RE.findall(text):
+            social = normalize_social_url(found)
+            if not social:
+                continue
+            if agency.owns_handle(social[2]):
+                agency_links.setdefault(social[0], social[1])
+            else:
+                links.setdefault(social[0], social[1])
+        if links:
+            cards[0] = {"name": None, "social_links": links, "emails": [], "phones": []}
+
+    # Plain-text contact details not already found as links
+    known_emails = set(page_emails) | {e for c in cards.values() for e in c["emails"]}
+    for email in EMAIL_RE.findall(text):
+        if email.lower() not in known_emails and not email.lower().endswith((".png", ".jpg", ".webp")):
+            known_emails.add(email.lower())
+            page_emails.append(email.lower())
+    known_phones = set(page_phones) | {p for c in cards.values() for p in c["phones"]}
+    for phone in PHONE_RE.findall(text):
+        phone = normalize_phone(phone)
+        if phone not in known_phones:
+            known_phones.add(phone)
+            page_phones.append(phone)
+
+    return {
+        "url": url,
+        "cards": list(cards.values()),
+        "agency_links": agency_links,
+        "emails": page_emails,
+        "phones": page_phones,
+    }
+
+
+def residue_markdown(markdown: str) -> str:
+    """
+    Page markdown with everything the deterministic stage already captured removed:
+    images, link targets, bare URLs, e-mail addresses and phone numbers. What remains
+    (names, bios, categories) is what the LLM still has to read.
+    """
+    text = MD_IMAGE_RE.sub("", markdown)
+    text = MD_LINK_RE.sub(r"\1", text)
+    text = URL_RE.sub("", text)
+    text = EMAIL_RE.sub("", text)
+    text = PHONE_RE.sub("", text)
+    lines = [line.rstrip() for line in text.splitlines()]
+    # Drop lines left with nothing but punctuation / list markers
+    lines = [line for line in lines if re.search(r"\w", line)]
+    return "\n".join(lines)
+
+
+def youtube_links(pages: List[Dict]) -> Set[str]:
+    """
+    All YouTube profile URLs harvested from `extract_page_links` results.
+    """
+    return {
+        card["social_links"]["youtube"]
+        for page in pages
+        for card in page["cards"]
+        if card["social_links"].get("youtube")
+    }
@@ -0,0 +1,204 @@
+import re
+import logging
+from typing import List, Optional, Tuple
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+LIST_RE = re.compile(r"^(\s*)([-*+•]|\d+[.)])\s+(.*)$")
+RULE_RE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+TABLE_SEPARATOR_RE = re.compile(r"^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+QUOTE_RE = re.compile(r"^\s*>\s?(.*)$")
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+# Bold, italic, inline code and links, in that order of precedence
+INLINE_RE = re.compile(
+    r"(\*\*|__)(?P<bold>.+?)\1"
+    r"|\*(?P<italic>[^\s*](?:.*?[^\s*])?)\*"
+    r"|(?<!\w)_(?P<italic_u>[^\s_](?:.*?[^\s_])?)_(?!\w)"
+    r"|`(?P<code>[^`]+)`"
+    r"|!?\[(?P<link_text>[^\]]*)\]\((?P<link_url>[^)\s]+)[^)]*\)"
+)
+
+BULLET_STYLES = ("List Bullet", "List Bullet 2", "List Bullet 3")
+NUMBER_STYLES = ("List Number", "List Number 2", "List Number 3")
+
+
+def sanitize_text(text: str) -> str:
+    """
+    Remove characters python-docx cannot store in XML: NULL bytes, control characters and
+    characters outside the Basic Multilingual Plane.
+    """
+    text = "".join(char for char in text if ord(char) >= 32 or char in "\n\r\t")
+    return "".join(char if ord(char) < 0x10000 else " " for char in text)
+
+
+def strip_inline(text: str) -> str:
+    """
+    Plain text of a line with markdown emphasis, code and link markup removed.
+    """
+    def plain(match: re.Match) -> str:
+        for group in ("bold", "italic", "italic_u", "code", "link_text"):
+            if match.group(group) is not None:
+                return strip_inline(match.group(group))
+        return match.group(0)
+    return INLINE_RE.sub(plain, text).strip()
+
+
+def is_structured(text: str) -> bool:
+    """
+    Whether text is markdown the local renderer can lay out: at least one heading, or
+    several list items / table rows.
+    """
+    headings = structural = 0
+    for line in text.splitlines():
+        if HEADING_RE.match(line):
+            headings += 1
+        elif LIST_RE.match(line) or line.strip().startswith("|"):
+            structural += 1
+    return headings > 0 or structural >= 3
+
+
+def add_inline(paragraph, text: str, bold: bool = False, italic: bool = False) -> None:
+    """
+    Add text to a paragraph as runs, turning **bold**, *italic*, `code` and [links](url) into formatting.
+    """
+    position = 0
+    for match in INLINE_RE.finditer(text):
+        if match.start() > position:
+            run = paragraph.add_run(text[position:match.start()])
+            run.bold, run.italic = bold or None, italic or None
+        if match.group("bold") is not None:
+            add_inline(paragraph, match.group("bold"), True, italic)
+        elif match.group("italic") is not None or match.group("italic_u") is not None:
+            add_inline(paragraph, match.group("italic") or match.group("italic_u"), bold, True)
+        elif match.group("code") is not None:
+            run = paragraph.add_run(match.group("code"))
+            run.font.name = "Courier New"
+            run.bold, run.italic = bold or None, italic or None
+        else:
+            label, url = match.group("link_text"), match.group("link_url")
+            add_inline(paragraph, f"{label} ({url})" if label and label != url else url, bold, italic)
+        position = match.end()
+    if position < len(text):
+        run = paragraph.add_run(text[position:])
+        run.bold, run.italic = bold or None, italic or None
+
+
+def _table_cells(line: str) -> List[str]:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", line)]
+
+
+def _add_table(doc, rows: List[List[str]]) -> None:
+    columns = max(len(row) for row in rows)
+    table = doc.add_table(rows=len(rows), cols=columns)
+    table.style = "Table Grid"
+    for r, row in enumerate(rows):
+        for c in range(columns):
+            cell = table.cell(r, c)
+            add_inline(cell.paragraphs[0], row[c] if c < len(row) else "", bold=r == 0)
+
+
+def _add_code(doc, lines: List[str]) -> None:
+    paragraph = doc.add_paragraph(style="No Spacing")
+    for i, line in enumerate(lines):
+        run = paragraph.add_run(line)
+        run.font.name = "Courier New"
+        run.font.size = Pt(9)
+        if i < len(lines) - 1:
+            run.add_break()
+
+
+def render_markdown(text: str) -> Tuple[str, Document]:
+    """
+    Lay out markdown (headings, nested bullet and numbered lists, pipe tables, block quotes,
+    code blocks, bold/italic/code/link spans) as a Word document.
+
+    A leading level-1 heading becomes the centred document title and the remaining headings
+    move up one level. Returns the title (for the filename) and the document.
+    """
+    lines = sanitize_text(text).replace("\r\n", "\n").split("\n")
+    doc = Document()
+
+    first = next((line for line in lines if line.strip()), "")
+    match = HEADING_RE.match(first)
+    title: Optional[str] = None
+    shift = 0
+    if match and len(match.group(1)) == 1:
+        title = strip_inline(match.group(2))
+        doc.add_heading(title, level=0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+        lines = lines[lines.index(first) + 1:]
+        shift = 1
+
+    paragraph_lines: List[str] = []
+
+    def flush_paragraph() -> None:
+        if paragraph_lines:
+            paragraph = doc.add_paragraph()
+            for i, line in enumerate(paragraph_lines):
+                add_inline(paragraph, line)
+                if i < len(paragraph_lines) - 1:
+                    paragraph.add_run().add_break()
+            paragraph_lines.clear()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if FENCE_RE.match(line):
+            flush_paragraph()
+            fence = FENCE_RE.match(line).group(1)
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith(fence):
+                code.append(lines[i])
+                i += 1
+            _add_code(doc, code)
+        elif not stripped:
+            flush_paragraph()
+        elif HEADING_RE.match(line):
+            flush_paragraph()
+            heading = HEADING_RE.match(line)
+            level = max(len(heading.group(1)) - shift, 1)
+            heading_text = strip_inline(heading.group(2))
+            title = title or heading_text
+            doc.add_heading(heading_text, level=min(level, 9))
+        elif RULE_RE.match(line):
+            flush_paragraph()
+        elif "|" in stripped and i + 1 < len(lines) and TABLE_SEPARATOR_RE.match(lines[i + 1]) and "|" in lines[i + 1]:
+            flush_paragraph()
+            rows = [_table_cells(line)]
+            i += 2
+            while i < len(lines) and "|" in lines[i] and lines[i].strip():
+                rows.append(_table_cells(lines[i]))
+                i += 1
+            _add_table(doc, rows)
+            continue
+        elif LIST_RE.match(line):
+            flush_paragraph()
+            item = LIST_RE.match(line)
+            depth = min(len(item.group(1).expandtabs(4)) // 2, 2)
+            styles = NUMBER_STYLES if item.group(2)[0].isdigit() else BULLET_STYLES
+            add_inline(doc.add_paragraph(style=styles[depth]), item.group(3))
+        elif QUOTE_RE.match(line):
+            flush_paragraph()
+            add_inline(doc.add_paragraph(style="Quote"), QUOTE_RE.match(line).group(1))
+        else:
+            paragraph_lines.append(stripped)
+        i += 1
+    flush_paragraph()
+
+    if not title:
+        title = strip_inline(first)[:60] or "Report"
+    return title, doc
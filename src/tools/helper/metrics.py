@@ -0,0 +1,150 @@
+import logging
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bootstrap resamples for confidence bands; fixed seed so repeated answers agree
+BOOTSTRAP_RESAMPLES = 2000
+BOOTSTRAP_SEED = 0
+
+
+def stats_arrays(video_stats: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Column arrays (views, likes, comments) from `_fetch_video_statistics` output.
+    """
+    if not video_stats:
+        raise ValueError("No video statistics to compute metrics from")
+    return {
+        key: np.array([v.get(field, 0) for v in video_stats], dtype=np.float64)
+        for key, field in (("views", "viewCount"), ("likes", "likeCount"), ("comments", "commentCount"))
+    }
+
+
+def engagement_rates(views: np.ndarray, likes: np.ndarray, comments: np.ndarray) -> np.ndarray:
+    """
+    Per-video engagement rate (likes + comments) / views; videos without views are NaN.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(views > 0, (likes + comments) / views, np.nan)
+
+
+def bootstrap_ci(
+    values: Sequence[float],
+    statistic: Callable = np.median,
+    confidence_level: float = 0.90,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = BOOTSTRAP_SEED
+) -> Tuple[float, float]:
+    """
+    Percentile bootstrap confidence band of `statistic`, with all resamples drawn and
+    reduced in one vectorized call (`statistic` must accept `axis=1`). NaN and infinite
+    values are left out of the sample.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        raise ValueError("Cannot bootstrap an empty sample")
+    if not 0.0 < confidence_level < 1.0:
+        raise ValueError("confidence_level must be between 0 and 1")
+
+    rng = np.random.default_rng(seed)
+    samples = values[rng.integers(0, values.size, size=(n_resamples, values.size))]
+    estimates = statistic(samples, axis=1)
+    alpha = 1.0 - confidence_level
+    low, high = np.quantile(estimates, [alpha / 2, 1 - alpha / 2])
+    return float(low), float(high)
+
+
+def _band(point: float, low: float, high: float, digits: int = 2) -> Dict[str, float]:
+    return {"value": round(point, digits), "low": round(low, digits), "high": round(high, digits)}
+
+
+def _median_band(values: np.ndarray, confidence_level: float, digits: int = 2) -> Dict[str, Optional[float]]:
+    """
+    Median of the finite values with its bootstrap band; all None when no value is finite
+    (e.g. engagement rates of a channel whose videos have no views yet).
+    """
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return {"value": None, "low": None, "high": None}
+    low, high = bootstrap_ci(finite, np.median, confidence_level)
+    return _band(float(np.median(finite)), low, high, digits)
+
+
+def influencer_metrics(
+    video_stats: List[Dict],
+    price: Optional[float] = None,
+    conversions: Optional[float] = None,
+    target_cpm: Optional[float] = None,
+    confidence_level: float = 0.90
+) -> Dict:
+    """
+    Pricing and engagement metrics for one sponsored video on a channel.
+
+    Expected views are the MEDIAN views of the recent videos; every derived metric comes
+    with a bootstrap band, and cost metrics invert the band of the views (more views → lower cost).
+
+    Args:
+        video_stats: Output of `_fetch_video_statistics`
+        price: Price of the sponsorship, enables CPM, CPV and (with `conversions`) CPA
+        conversions: Expected conversions (sign-ups, sales) from the video
+        target_cpm: CPM the brand is willing to pay, enables the maximum price
+        confidence_level: Coverage of the bootstrap bands (default 0.90)
+    """
+    cols = stats_arrays(video_stats)
+    views, likes, comments = cols["views"], cols["likes"], cols["comments"]
+
+    median_views = float(np.median(views))
+    views_low, views_high = bootstrap_ci(views, np.median, confidence_level)
+    rates = engagement_rates(views, likes, comments)
+
+    result: Dict = {
+        "videos": int(views.size),
+        "confidence_level": confidence_level,
+        "expected_views": _band(median_views, views_low, views_high, 0),
+        "mean_views": round(float(views.mean()), 0),
+        "median_likes": float(np.median(likes)),
+        "median_comments": float(np.median(comments)),
+        "engagement_rate": _median_band(rates, confidence_level, 5),
+        "overall_engagement_rate": round(float((likes.sum() + comments.sum()) / views.sum()), 5) if views.sum() else None,
+    }
+
+    if price is not None:
+        if price < 0:
+            raise ValueError("Price cannot be negative")
+        if median_views <= 0:
+            raise ValueError("Channel has no views to price against")
+        result["cpm"] = _band(price / median_views * 1000, price / views_high * 1000, price / max(views_low, 1) * 1000)
+        result["cpv"] = _band(price / median_views, price / views_high, price / max(views_low, 1), 5)
+        if conversions is not None:
+            if conversions <= 0:
+                raise ValueError("Conversions must be positive to compute CPA")
+            result["cpa"] = round(price / conversions, 2)
+            result["conversion_rate"] = round(conversions / median_views, 5)
+
+    if target_cpm is not None:
+        result.update(max_price_for_cpm(views, target_cpm, confidence_level))
+
+    return result
+
+
+def max_price_for_cpm(views: Sequence[float], target_cpm: float, confidence_level: float = 0.90) -> Dict:
+    """
+    Highest price that keeps the CPM at or below `target_cpm` for the median expected views,
+    plus a conservative price that still meets the target at the low end of the views band.
+    """
+    if target_cpm <= 0:
+        raise ValueError("Target CPM must be positive")
+    views = np.asarray(views, dtype=np.float64)
+    median_views = float(np.median(views))
+    views_low, views_high = bootstrap_ci(views, np.median, confidence_level)
+    return {
+        "target_cpm": target_cpm,
+        "max_price": round(target_cpm * median_views / 1000, 2),
+        "max_price_conservative": round(target_cpm * views_low / 1000, 2),
+        "max_price_optimistic": round(target_cpm * views_high / 1000, 2),
+    }
@@ -0,0 +1,74 @@
+import os
+import logging
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CLIP_MODEL_NAME = "openai/clip-vit-large-patch14"
+
+# Loaded models by name, shared by every tool in the process
+_models: Dict[str, Any] = {}
+_locks: Dict[str, threading.Lock] = {}
+_registry_lock = threading.Lock()
+_warm_up_thread = None
+
+
+def get_model(name: str, loader: Callable[[], Any]) -> Any:
+    """
+    Return the model registered under `name`, loading it with `loader` on first use.
+    Concurrent callers wait for the same load instead of loading a second copy.
+    """
+    if name in _models:
+        return _models[name]
+
+    with _registry_lock:
+        lock = _locks.setdefault(name, threading.Lock())
+
+    with lock:
+        if name not in _models:
+            logger.info(f"Loading model {name}…")
+            _models[name] = loader()
+            logger.info(f"Model {name} loaded")
+    return _models[name]
+
+
+def _load_clip() -> Tuple[Any, Any]:
+    from transformers import CLIPProcessor, CLIPModel
+
+    model = CLIPModel.from_pretrained(CLIP_MODEL_NAME)
+    model.eval()
+    processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
+    return model, processor
+
+
+def get_clip() -> Tuple[Any, Any]:
+    """
+    Return the shared (model, processor) pair for CLIP.
+    """
+    return get_model(CLIP_MODEL_NAME, _load_clip)
+
+
+def warm_up(background: bool = True) -> None:
+    """
+    Load the CLIP model ahead of the first request.
+    With `background=True` the load runs in a daemon thread so process startup is not blocked.
+    """
+    global _warm_up_thread
+    if background:
+        with _registry_lock:
+            if _warm_up_thread is None:
+                _warm_up_thread = threading.Thread(target=get_clip, name="clip-warm-up", daemon=True)
+                _warm_up_thread.start()
+    else:
+        get_clip()
+
+
+def warm_up_from_env() -> None:
+    """
+    Start a background warm-up when WARM_UP_MODELS is set to a truthy value.
+    """
+    if os.getenv("WARM_UP_MODELS", "").lower() in ("1", "true", "yes"):
+        warm_up(background=True)
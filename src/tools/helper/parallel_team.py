@@ -0,0 +1,297 @@
+import os
+import re
+import time
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Member tasks running at once for one request
+TEAM_MAX_PARALLEL_TASKS = int(os.getenv("TEAM_MAX_PARALLEL_TASKS", "6"))
+# Upper bound on the tasks a plan may contain
+TEAM_MAX_PLAN_TASKS = 8
+TEAM_PLANNER_MODEL = "gpt-4.1-mini"
+# Characters of a finished task's output handed to each task that depends on it
+CONTEXT_CHARS_PER_TASK = 8000
+# Characters of conversation memory shown to the planner and the synthesis step
+MEMORY_CHARS = 4000
+
+# Team instructions about the coordinator's own tools, which the planner does not have
+_COORDINATOR_ONLY = ("transfer_task_to_member", "set_shared_context")
+
+
+# ─── Plan schema ───────────────────────────────────────────────────────────────
+class PlannedTask(BaseModel):
+    id: str = Field(..., description="Short unique ID, e.g. 'channel', 'risk', 'report'")
+    member: str = Field(..., description="Name of the team member that runs the task")
+    task: str = Field(..., description="Self-contained instruction with every identifier the member needs")
+    depends_on: List[str] = Field(default_factory=list, description="IDs of tasks whose output this task needs")
+
+
+class TaskPlan(BaseModel):
+    tasks: List[PlannedTask] = Field(default_factory=list)
+
+
+def parse_plan(content: Any) -> TaskPlan:
+    """
+    Validate a planner response against the TaskPlan schema.
+    """
+    if isinstance(content, TaskPlan):
+        return content
+    if isinstance(content, BaseModel):
+        return TaskPlan.model_validate(content.model_dump())
+    if isinstance(content, dict):
+        return TaskPlan.model_validate(content)
+    if isinstance(content, str):
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        if match:
+            return TaskPlan.model_validate_json(match.group(0))
+    raise ValueError(f"Unexpected plan output of type {type(content).__name__}")
+
+
+def dependency_levels(tasks: List[PlannedTask]) -> List[List[str]]:
+    """
+    Task IDs grouped by depth in the dependency graph (level 0 needs nothing, level 1 needs
+    level 0, ...). Raises ValueError on duplicate IDs or cycles.
+    """
+    ids = [task.id for task in tasks]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Plan contains duplicate task IDs")
+    remaining = {task.id: set(task.depends_on) for task in tasks}
+    levels: List[List[str]] = []
+    done: set = set()
+    while remaining:
+        level = [task_id for task_id, deps in remaining.items() if deps <= done]
+        if not level:
+            raise ValueError(f"Plan has a dependency cycle between {', '.join(sorted(remaining))}")
+        levels.append(level)
+        done.update(level)
+        for task_id in level:
+            del remaining[task_id]
+    return levels
+
+
+def validate_plan(plan: TaskPlan, members: Dict[str, Any]) -> List[PlannedTask]:
+    """
+    Tasks of a plan that can run: known members only, dependencies limited to tasks in the
+    plan, at most TEAM_MAX_PLAN_TASKS. Raises ValueError for empty or cyclic plans.
+    """
+    tasks = [task for task in plan.tasks if task.member in members and task.task.strip()]
+    for task in plan.tasks:
+        if task.member not in members:
+            logger.warning(f"Dropping planned task {task.id} for unknown member {task.member}")
+    tasks = tasks[:TEAM_MAX_PLAN_TASKS]
+    known = {task.id for task in tasks}
+    for task in tasks:
+        task.depends_on = [dep for dep in dict.fromkeys(task.depends_on) if dep in known and dep != task.id]
+    if not tasks:
+        raise ValueError("Plan contains no runnable tasks")
+    dependency_levels(tasks)
+    return tasks
+
+
+# ─── Results ───────────────────────────────────────────────────────────────────
+class MemberResult:
+    """
+    Outcome of one planned task: the member's answer (or the error) and how long it took.
+    """
+
+    def __init__(self, task: PlannedTask, content: str = "", seconds: float = 0.0, error: Optional[str] = None):
+        self.task = task
+        self.content = content if error is None else f"Failed: {error}"
+        self.seconds = seconds
+        self.error = error
+
+
+class PlanRunResponse:
+    """
+    Answer of a planned run, with the `content` and `members_responses` attributes the entry
+    points read from a team run response.
+    """
+
+    def __init__(self, content: str, tasks: List[PlannedTask], results: Dict[str, MemberResult], seconds: float):
+        self.content = content
+        self.tasks = tasks
+        self.results = results
+        self.seconds = seconds
+        self.members_responses = {f"{r.task.member} ({task_id})": r for task_id, r in results.items()}
+
+
+# ─── Runner ────────────────────────────────────────────────────────────────────
+class ParallelTeamRunner:
+    """
+    Plan-and-execute alternative to the team's coordinate mode. One planner call turns the
+    request into a dependency graph of member tasks. Every task starts as soon as the tasks
+    it depends on have finished, so independent branches (channel data, video stats, risk
+    and sentiment, sponsor scan) run concurrently and latency follows the longest branch.
+    Finished outputs go into a shared context that dependent tasks and the final synthesis
+    step read.
+    """
+
+    def __init__(self, team: Any, max_parallel: int = TEAM_MAX_PARALLEL_TASKS):
+        self.team = team
+        self.max_parallel = max(1, max_parallel)
+        self.members = {member.name: member for member in team.members}
+
+    def _memory(self) -> str:
+        context = getattr(self.team, "context", None)
+        return str(context)[:MEMORY_CHARS] if context else ""
+
+    def _model(self) -> OpenAIChat:
+        return OpenAIChat(id=getattr(self.team.model, "id", None) or TEAM_PLANNER_MODEL)
+
+    def _planner(self) -> Agent:
+        # One agent per call: agents keep run state and are not safe to share between requests
+        team_rules = [
+            line for line in (self.team.instructions or [])
+            if not any(tool_name in line for tool_name in _COORDINATOR_ONLY)
+        ]
+        return Agent(
+            name="Team Planner",
+            role="Split a request into member tasks and their dependencies",
+            model=self._model(),
+            response_model=TaskPlan,
+            instructions=[
+                "You plan how a team of YouTube analysis agents answers a request. The members are:",
+                *[f"- {name}: {member.role}" for name, member in self.members.items()],
+                "Team rules:",
+                *[f"- {rule}" for rule in team_rules],
+                "Split the request into tasks, one member per task, and write each task as a self-contained "
+                "instruction that repeats every identifier it needs (channel handle, video ID, budget, brand).",
+                "Tasks run in parallel. Add depends_on only when a task needs another task's output, e.g. "
+                "document_generator needs the results it reports on and python_script_executor needs fetched data.",
+                "Members resolve channel handles themselves, so do not add a separate resolving step for them.",
+                f"Use the fewest tasks that answer the request completely, at most {TEAM_MAX_PLAN_TASKS}.",
+                "Use only the member names listed above."
+            ]
+        )
+
+    async def aplan(self, request: str) -> List[PlannedTask]:
+        memory = self._memory()
+        prompt = f"Request: {request}" + (f"\n\nConversation memory:\n{memory}" if memory else "")
+        response = await self._planner().arun(prompt)
+        return validate_plan(parse_plan(response.content), self.members)
+
+    def _task_prompt(self, task: PlannedTask, request: str, context: Dict[str, MemberResult]) -> str:
+        parts = [task.task, f"(Part of the request: {request})"]
+        if task.depends_on:
+            parts.append("Results of earlier steps to use:")
+            for dep in task.depends_on:
+                result = context[dep]
+                parts.append(f"### {dep} ({result.task.member})\n{result.content[:CONTEXT_CHARS_PER_TASK]}")
+        return "\n\n".join(parts)
+
+    async def _run_task(
+        self,
+        task: PlannedTask,
+        request: str,
+        context: Dict[str, MemberResult],
+        semaphore: asyncio.Semaphore,
+        session_id: Optional[str] = None
+    ) -> MemberResult:
+        failed = [dep for dep in task.depends_on if context[dep].error]
+        if failed:
+            return MemberResult(task, error=f"skipped because {', '.join(failed)} failed")
+
+        async with semaphore:
+            # Members keep run state, so concurrent tasks (even for the same member) each use a copy
+            member = self.members[task.member].deep_copy()
+            member.team_session_id = session_id or getattr(self.team, "session_id", None)
+            start = time.perf_counter()
+            try:
+                response = await member.arun(self._task_prompt(task, request, context))
+                content = response.content if isinstance(response.content, str) else str(response.content)
+                result = MemberResult(task, content or "", time.perf_counter() - start)
+            except Exception as e:
+                logger.warning(f"Task {task.id} ({task.member}) failed: {e}")
+                result = MemberResult(task, seconds=time.perf_counter() - start, error=str(e))
+        logger.info(f"Task {task.id} ({task.member}) finished in {result.seconds:.1f} s")
+        return result
+
+    async def aexecute(
+        self,
+        tasks: List[PlannedTask],
+        request: str,
+        session_id: Optional[str] = None
+    ) -> Dict[str, MemberResult]:
+        """
+        Run the task graph: a task starts when all its dependencies are in the shared context,
+        with at most `max_parallel` member runs in flight.
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        context: Dict[str, MemberResult] = {}
+        pending = {task.id: task for task in tasks}
+        running: Dict[asyncio.Task, PlannedTask] = {}
+
+        while pending or running:
+            ready = [task for task in pending.values() if all(dep in context for dep in task.depends_on)]
+            for task in ready:
+                del pending[task.id]
+                running[asyncio.ensure_future(self._run_task(task, request, context, semaphore, session_id))] = task
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                context[task.id] = future.result()
+
+        return {task.id: context[task.id] for task in tasks}
+
+    async def _asynthesize(self, request: str, results: Dict[str, MemberResult]) -> str:
+        memory = self._memory()
+        sections = [f"## {task_id} ({r.task.member}): {r.task.task}\n\n{r.content}" for task_id, r in results.items()]
+        synthesizer = Agent(
+            name="Team Synthesizer",
+            role="Combine the team members' results into one answer",
+            model=self._model(),
+            instructions=[
+                "Answer the request using only the results of the team members below.",
+                "Keep numbers, tables, links and document URLs exactly as the members reported them.",
+                "If a task failed, say which part of the request could not be answered.",
+                self.team.expected_output or "Present all data in a clear, organized format using markdown."
+            ],
+            markdown=True
+        )
+        prompt = f"Request: {request}\n\n" + (f"Conversation memory:\n{memory}\n\n" if memory else "")
+        response = await synthesizer.arun(prompt + "# Member results\n\n" + "\n\n".join(sections))
+        return response.content
+
+    async def arun(self, request: str, session_id: Optional[str] = None) -> Any:
+        """
+        Answer a request with plan → parallel execution → synthesis. Falls back to the team's
+        coordinate mode when no valid plan comes back. `session_id` names the conversation,
+        as in `Team.arun`.
+        """
+        start = time.perf_counter()
+        try:
+            tasks = await self.aplan(request)
+        except (ValidationError, ValueError) as e:
+            logger.warning(f"No usable plan, falling back to coordinate mode: {e}")
+            return await self.team.arun(request, session_id=session_id)
+
+        levels = dependency_levels(tasks)
+        logger.info(f"Planned {len(tasks)} tasks in {len(levels)} dependency levels: {levels}")
+        results = await self.aexecute(tasks, request, session_id)
+
+        if len(results) == 1:
+            content = next(iter(results.values())).content
+        else:
+            content = await self._asynthesize(request, results)
+        seconds = time.perf_counter() - start
+        logger.info(
+            f"Planned run finished in {seconds:.1f} s "
+            f"(member time {sum(r.seconds for r in results.values()):.1f} s across {len(results)} tasks)"
+        )
+        return PlanRunResponse(content, tasks, results, seconds)
+
+    def run(self, request: str, session_id: Optional[str] = None) -> Any:
+        """
+        Synchronous wrapper around `arun` for callers without an event loop (Streamlit).
+        """
+        return asyncio.run(self.arun(request, session_id))
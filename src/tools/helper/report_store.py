@@ -0,0 +1,151 @@
+import os
+import re
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+import unicodedata
+from typing import Dict, List, Optional
+
+from src.tools.helper.markdown_docx import sanitize_text
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# SQLite manifest of the reports uploaded to S3
+REPORT_MANIFEST_PATH = os.getenv("REPORT_MANIFEST_PATH", "/tmp/brandview/reports.sqlite3")
+# Reports not requested for this many days are deleted from S3
+REPORT_MAX_AGE_DAYS = float(os.getenv("REPORT_MAX_AGE_DAYS", "30"))
+# Garbage collection runs at most this often
+REPORT_GC_INTERVAL_SECONDS = 3600
+# Bump when the document layout changes, so old renderings are not reused
+REPORT_LAYOUT_VERSION = "1"
+
+# S3 DeleteObjects accepts at most 1000 keys per call
+_DELETE_BATCH = 1000
+
+
+def normalize_report_text(text: str) -> str:
+    """
+    Report text reduced to what affects the rendered document: unicode NFC, no control
+    characters, no trailing whitespace and at most one blank line in a row.
+    """
+    text = unicodedata.normalize("NFC", sanitize_text(text)).replace("\r\n", "\n").replace("\r", "\n")
+    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def report_digest(text: str, *options: str) -> str:
+    """
+    Content address of a report: a hash of its normalized text, the render options and the layout version.
+    """
+    payload = "\x00".join([REPORT_LAYOUT_VERSION, *options, normalize_report_text(text)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReportManifest:
+    """
+    Local record of uploaded reports: digest → S3 key, size and creation / last-use times.
+    """
+
+    def __init__(self, path: str = REPORT_MANIFEST_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._last_gc = 0.0
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS reports (
+                    digest TEXT PRIMARY KEY,
+                    bucket TEXT NOT NULL,
+                    s3_key TEXT NOT NULL,
+                    title TEXT,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS reports_last_used ON reports (last_used_at);
+            """)
+
+    def get(self, digest: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, bucket, s3_key, title, size, created_at, last_used_at FROM reports WHERE digest = ?",
+                (digest,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("digest", "bucket", "s3_key", "title", "size", "created_at", "last_used_at"), row))
+
+    def record(self, digest: str, bucket: str, s3_key: str, title: str, size: int) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (digest, bucket, s3_key, title, size, now, now)
+            )
+
+    def touch(self, digest: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE reports SET last_used_at = ? WHERE digest = ?", (time.time(), digest))
+
+    def remove(self, digests: List[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM reports WHERE digest = ?", [(d,) for d in digests])
+
+    def collect_garbage(self, s3, max_age_days: float = REPORT_MAX_AGE_DAYS, force: bool = False) -> int:
+        """
+        Delete reports unused for `max_age_days` from S3 and the manifest. Runs at most once
+        per REPORT_GC_INTERVAL_SECONDS unless forced; returns the number of deleted reports.
+        """
+        now = time.time()
+        with self._lock:
+            if not force and now - self._last_gc < REPORT_GC_INTERVAL_SECONDS:
+                return 0
+            self._last_gc = now
+            rows = self._conn.execute(
+                "SELECT digest, bucket, s3_key FROM reports WHERE last_used_at < ?",
+                (now - max_age_days * 86400,)
+            ).fetchall()
+
+        by_bucket: Dict[str, List[tuple]] = {}
+        for digest, bucket, key in rows:
+            by_bucket.setdefault(bucket, []).append((digest, key))
+
+        deleted: List[str] = []
+        for bucket, items in by_bucket.items():
+            for i in range(0, len(items), _DELETE_BATCH):
+                batch = items[i:i + _DELETE_BATCH]
+                try:
+                    response = s3.delete_objects(
+                        Bucket=bucket,
+                        Delete={"Objects": [{"Key": key} for _, key in batch], "Quiet": True}
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not delete expired reports from {bucket}: {e}")
+                    continue
+                failed = {error["Key"] for error in response.get("Errors", [])}
+                deleted.extend(digest for digest, key in batch if key not in failed)
+
+        self.remove(deleted)
+        if deleted:
+            logger.info(f"Deleted {len(deleted)} reports unused for {max_age_days:g} days")
+        return len(deleted)
+
+
+_manifest: Optional[ReportManifest] = None
+_manifest_lock = threading.Lock()
+
+
+def get_report_manifest() -> ReportManifest:
+    """
+    Return the process-wide report manifest, opening the database on first use.
+    """
+    global _manifest
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                _manifest = ReportManifest()
+    return _manifest
@@ -0,0 +1,245 @@
+import os
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.tools.helper.lazy import lazy_import
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# TextBlob pulls in NLTK, so it is imported with the first scored comment
+textblob = lazy_import("textblob")
+textblob_text = lazy_import("textblob._text")
+textblob_en = lazy_import("textblob.en")
+
+# Worker processes for large comment sets (0 = one per CPU core)
+SENTIMENT_WORKERS = int(os.getenv("SENTIMENT_WORKERS", "0"))
+# Comments per process-pool task
+SENTIMENT_CHUNK_SIZE = 2000
+# Below this many texts the process pool costs more than it saves
+SENTIMENT_PARALLEL_THRESHOLD = 5000
+# Equal-width histogram bins over [-1, 1]
+SENTIMENT_HISTOGRAM_BINS = 10
+
+
+class _Lexicon:
+    """
+    The TextBlob (pattern) sentiment lexicon as flat arrays indexed by token ID.
+    """
+
+    def __init__(self):
+        pattern_sentiment = textblob_en.sentiment
+        words = list(pattern_sentiment.keys())  # triggers TextBlob's lazy lexicon load
+        self.ids = {w: i for i, w in enumerate(words)}
+        self.polarity = np.array([pattern_sentiment[w][None][0] for w in words], dtype=np.float64)
+        self.intensity = np.array([pattern_sentiment[w][None][2] for w in words], dtype=np.float64)
+        self.modifier = np.array(
+            [any(pos in pattern_sentiment[w] for pos in pattern_sentiment.modifiers) for w in words],
+            dtype=bool
+        )
+
+        # Tokens whose rules (negation, sarcasm, emoticon entries) are left to TextBlob itself
+        self.fallback_tokens = set(pattern_sentiment.negations) | {"(!)"}
+        for _, emoticons in textblob_text.EMOTICONS.items():
+            self.fallback_tokens.update(
+                e.lower() for e in emoticons
+                if e.lower() not in self.ids and len(e) <= 5 and e.lower() not in textblob_text.PUNCTUATION
+            )
+
+
+_lexicon_instance: Optional[_Lexicon] = None
+_lexicon_lock = threading.Lock()
+
+
+def _lexicon() -> _Lexicon:
+    global _lexicon_instance
+    if _lexicon_instance is None:
+        with _lexicon_lock:
+            if _lexicon_instance is None:
+                _lexicon_instance = _Lexicon()
+    return _lexicon_instance
+
+
+def _tokenize(texts: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    Tokenize texts exactly like TextBlob and flatten them into parallel token arrays.
+    """
+    lex = _lexicon()
+    token_ids: List[int] = []
+    long_unknown: List[bool] = []
+    exclamation: List[bool] = []
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    fallback = np.zeros(len(texts), dtype=bool)
+
+    for d, text in enumerate(texts):
+        tokens = " ".join(textblob_en.sentiment.tokenizer(text)).split()
+        for token in tokens:
+            w = token.lower()
+            token_id = lex.ids.get(w, -1)
+            token_ids.append(token_id)
+            long_unknown.append(token_id < 0 and len(w) > 2)
+            exclamation.append(w == "!")
+            if w in lex.fallback_tokens:
+                fallback[d] = True
+        offsets[d + 1] = len(token_ids)
+
+    return {
+        "token_ids": np.array(token_ids, dtype=np.int64),
+        "long_unknown": np.array(long_unknown, dtype=bool),
+        "exclamation": np.array(exclamation, dtype=bool),
+        "offsets": offsets,
+        "fallback": fallback,
+    }
+
+
+def _lexicon_scores(tokens: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Vectorized TextBlob polarity over pre-tokenized arrays.
+
+    Implements the pattern assessment rules for known words, modifier chains
+    ("really good") and exclamation boosts; texts flagged in `tokens["fallback"]`
+    must be rescored with TextBlob.
+    """
+    lex = _lexicon()
+    offsets = tokens["offsets"]
+    n_docs = len(offsets) - 1
+    token_ids = tokens["token_ids"]
+    if n_docs == 0 or token_ids.size == 0:
+        return np.zeros(n_docs, dtype=np.float64)
+
+    doc = np.repeat(np.arange(n_docs), np.diff(offsets))
+    known_pos = np.nonzero(token_ids >= 0)[0]
+    if known_pos.size == 0:
+        return np.zeros(n_docs, dtype=np.float64)
+    kid = token_ids[known_pos]
+    kdoc = doc[known_pos]
+
+    # A known word merges into the previous entry when that entry ended in a modifier
+    # and no unknown word longer than two characters sits between them
+    cum_long = np.cumsum(tokens["long_unknown"])
+    link = np.zeros(known_pos.size, dtype=bool)
+    link[1:] = (
+        (kdoc[1:] == kdoc[:-1])
+        & lex.modifier[kid[:-1]]
+        & (cum_long[known_pos[1:]] == cum_long[known_pos[:-1]])
+    )
+    is_end = np.ones(known_pos.size, dtype=bool)
+    is_end[:-1] = ~link[1:]
+
+    values = lex.polarity[kid].copy()
+    merged = np.nonzero(link)[0]
+    values[merged] = np.clip(lex.polarity[kid[merged]] * lex.intensity[kid[merged - 1]], -1.0, 1.0)
+
+    # Exclamation marks after an entry's last word boost that entry, one factor of 1.25 each
+    ends = np.nonzero(is_end)[0]
+    cum_excl = np.cumsum(tokens["exclamation"])
+    has_next = np.zeros(known_pos.size, dtype=bool)
+    has_next[:-1] = kdoc[1:] == kdoc[:-1]
+    upper = np.where(has_next, np.append(known_pos[1:], 0), offsets[kdoc + 1])[ends]
+    boosts = cum_excl[upper - 1] - cum_excl[known_pos[ends]]
+    end_values = values[ends]
+    for k in range(int(boosts.max()) if boosts.size else 0):
+        boosted = boosts > k
+        end_values[boosted] = np.clip(end_values[boosted] * 1.25, -1.0, 1.0)
+
+    # bincount adds in token order, matching TextBlob's running sum bit for bit
+    sums = np.bincount(kdoc[ends], weights=end_values, minlength=n_docs)
+    counts = np.bincount(kdoc[ends], minlength=n_docs)
+    return sums / np.maximum(counts, 1)
+
+
+def _score_chunk(texts: Sequence[str]) -> np.ndarray:
+    tokens = _tokenize(texts)
+    scores = _lexicon_scores(tokens)
+    for d in np.nonzero(tokens["fallback"])[0]:
+        scores[d] = textblob.TextBlob(texts[d]).sentiment.polarity
+    return scores
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=SENTIMENT_WORKERS or os.cpu_count() or 1)
+    return _pool
+
+
+def sentiment_scores(texts: Sequence[str]) -> np.ndarray:
+    """
+    TextBlob polarity for every text, identical to `TextBlob(text).sentiment.polarity`.
+    Large inputs are split into chunks and scored in a process pool.
+    """
+    texts = list(texts)
+    if len(texts) < SENTIMENT_PARALLEL_THRESHOLD:
+        return _score_chunk(texts)
+
+    chunks = [texts[i:i + SENTIMENT_CHUNK_SIZE] for i in range(0, len(texts), SENTIMENT_CHUNK_SIZE)]
+    return np.concatenate(list(_process_pool().map(_score_chunk, chunks)))
+
+
+def sentiment_distribution(scores: np.ndarray, weights: Optional[np.ndarray] = None) -> Dict:
+    """
+    Summarize polarity scores: mean, spread, percentiles, histogram and sentiment shares.
+    Optional `weights` (e.g. comment like counts) weight every statistic.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.size == 0:
+        raise ValueError("Cannot summarize an empty set of scores")
+    weights = np.ones_like(scores) if weights is None else np.asarray(weights, dtype=np.float64)
+    total = weights.sum()
+
+    mean = float(np.average(scores, weights=weights))
+    std = float(np.sqrt(np.average((scores - mean) ** 2, weights=weights)))
+
+    # Weighted percentiles from the cumulative weight curve (reduces to np.percentile's
+    # "inverted_cdf" method for unit weights)
+    order = np.argsort(scores, kind="stable")
+    cumulative = np.cumsum(weights[order]) / total
+    percentiles = {
+        f"p{q}": float(scores[order][min(np.searchsorted(cumulative, q / 100), scores.size - 1)])
+        for q in (5, 25, 50, 75, 95)
+    }
+
+    counts, edges = np.histogram(scores, bins=SENTIMENT_HISTOGRAM_BINS, range=(-1.0, 1.0), weights=weights)
+    return {
+        "count": int(scores.size),
+        "mean": mean,
+        "std": std,
+        **percentiles,
+        "share_negative": float(weights[scores < 0].sum() / total),
+        "share_neutral": float(weights[scores == 0].sum() / total),
+        "share_positive": float(weights[scores > 0].sum() / total),
+        "histogram": {
+            "edges": [round(float(e), 2) for e in edges],
+            "counts": [round(float(c), 4) for c in counts],
+        },
+    }
+
+
+def check_against_textblob(texts: Sequence[str]) -> Dict:
+    """
+    Regression check: score `texts` with the engine and with plain TextBlob and compare.
+    """
+    texts = list(texts)
+    engine = sentiment_scores(texts)
+    reference = np.array([textblob.TextBlob(text).sentiment.polarity for text in texts], dtype=np.float64)
+    mismatches = np.nonzero(engine != reference)[0]
+    return {
+        "count": len(texts),
+        "identical": bool(mismatches.size == 0),
+        "max_abs_diff": float(np.abs(engine - reference).max()) if texts else 0.0,
+        "mismatches": [
+            {"text": texts[i], "engine": float(engine[i]), "textblob": float(reference[i])}
+            for i in mismatches[:10]
+        ],
+    }
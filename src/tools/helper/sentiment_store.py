@@ -0,0 +1,262 @@
+import os
+import json
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.tools.helper.sentiment import SENTIMENT_HISTOGRAM_BINS, sentiment_scores
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# SQLite file holding per-comment scores and running aggregates
+SENTIMENT_STORE_PATH = os.getenv("SENTIMENT_STORE_PATH", "/tmp/brandview/sentiment.sqlite3")
+
+HISTOGRAM_EDGES = np.linspace(-1.0, 1.0, SENTIMENT_HISTOGRAM_BINS + 1)
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_BATCH = 500
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class SentimentStore:
+    """
+    Persistent sentiment memo plus incrementally maintained aggregates.
+
+    Tables:
+        text_scores  text_hash → polarity, shared by every caller scoring the same text
+        comments     comment_id → video, channel, text_hash and polarity of its current text, and
+                     whether it counts towards the aggregates (duplicates and spam do not)
+        aggregates   (scope, key) → count, sum, sum of squares, sign counts and histogram bins,
+                     for scope "video" and "channel"
+    """
+
+    def __init__(self, path: str = SENTIMENT_STORE_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS text_scores (
+                    text_hash TEXT PRIMARY KEY,
+                    score REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS comments (
+                    comment_id TEXT PRIMARY KEY,
+                    video_id TEXT NOT NULL,
+                    channel_id TEXT,
+                    text_hash TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    counted INTEGER NOT NULL DEFAULT 1
+                );
+                CREATE TABLE IF NOT EXISTS aggregates (
+                    scope TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    sum REAL NOT NULL,
+                    sum_sq REAL NOT NULL,
+                    negative INTEGER NOT NULL,
+                    neutral INTEGER NOT NULL,
+                    positive INTEGER NOT NULL,
+                    histogram TEXT NOT NULL,
+                    PRIMARY KEY (scope, key)
+                );
+            """)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(comments)")}
+            if "counted" not in columns:
+                self._conn.execute("ALTER TABLE comments ADD COLUMN counted INTEGER NOT NULL DEFAULT 1")
+
+    # ─── Memoized scoring ─────────────────────────────────────────────────────
+    def _cached_scores(self, hashes: Sequence[str]) -> Dict[str, float]:
+        found: Dict[str, float] = {}
+        unique = list(dict.fromkeys(hashes))
+        for i in range(0, len(unique), _QUERY_BATCH):
+            batch = unique[i:i + _QUERY_BATCH]
+            rows = self._conn.execute(
+                f"SELECT text_hash, score FROM text_scores WHERE text_hash IN ({','.join('?' * len(batch))})",
+                batch
+            ).fetchall()
+            found.update(rows)
+        return found
+
+    def scores_for_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Polarity for every text; only texts never seen before are scored.
+        """
+        hashes = [text_hash(text) for text in texts]
+        with self._lock:
+            cached = self._cached_scores(hashes)
+
+        missing = {h: text for h, text in zip(hashes, texts) if h not in cached}
+        if missing:
+            new_scores = sentiment_scores(list(missing.values()))
+            cached.update(zip(missing.keys(), new_scores.tolist()))
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO text_scores (text_hash, score) VALUES (?, ?)",
+                    [(h, cached[h]) for h in missing]
+                )
+        logger.info(f"Sentiment: {len(texts) - len(missing)} memoized, {len(missing)} newly scored")
+        return np.array([cached[h] for h in hashes], dtype=np.float64)
+
+    # ─── Incremental aggregates ───────────────────────────────────────────────
+    def _apply(self, scope: str, key: str, added: np.ndarray, removed: np.ndarray) -> None:
+        row = self._conn.execute(
+            "SELECT count, sum, sum_sq, negative, neutral, positive, histogram FROM aggregates WHERE scope = ? AND key = ?",
+            (scope, key)
+        ).fetchone()
+        if row is None:
+            count, total, total_sq, negative, neutral, positive = 0, 0.0, 0.0, 0, 0, 0
+            histogram = np.zeros(SENTIMENT_HISTOGRAM_BINS, dtype=np.int64)
+        else:
+            count, total, total_sq, negative, neutral, positive = row[:6]
+            histogram = np.array(json.loads(row[6]), dtype=np.int64)
+
+        for scores, sign in ((added, 1), (removed, -1)):
+            if scores.size == 0:
+                continue
+            count += sign * int(scores.size)
+            total += sign * float(scores.sum())
+            total_sq += sign * float((scores ** 2).sum())
+            negative += sign * int((scores < 0).sum())
+            neutral += sign * int((scores == 0).sum())
+            positive += sign * int((scores > 0).sum())
+            histogram += sign * np.histogram(scores, bins=HISTOGRAM_EDGES)[0]
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO aggregates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (scope, key, count, total, total_sq, negative, neutral, positive, json.dumps(histogram.tolist()))
+        )
+
+    def _known_comments(self, ids: Sequence[str]) -> Dict[str, tuple]:
+        known: Dict[str, tuple] = {}
+        for i in range(0, len(ids), _QUERY_BATCH):
+            batch = ids[i:i + _QUERY_BATCH]
+            rows = self._conn.execute(
+                f"SELECT comment_id, text_hash, score, channel_id, video_id, counted FROM comments WHERE comment_id IN ({','.join('?' * len(batch))})",
+                batch
+            ).fetchall()
+            known.update((r[0], r[1:]) for r in rows)
+        return known
+
+    def record_comments(
+        self,
+        comments: List[Dict],
+        video_id: str,
+        channel_id: Optional[str] = None,
+        excluded: Optional[Set[str]] = None
+    ) -> Dict:
+        """
+        Add fetched comments to the store. New comments are scored and added to the video and
+        channel aggregates; edited comments replace their old score; known comments cost nothing.
+        Comments whose ID is in `excluded` (spam, emoji-only, near-duplicates) are stored
+        unscored and stay out of the aggregates, so a flood of copies counts once.
+        Safe to call concurrently for the same video: the stored rows are re-read inside the
+        write transaction and only comments still new or changed there reach the aggregates.
+        """
+        # One row per comment ID; a repeated ID keeps its last text
+        comments = list({c["id"]: c for c in comments if c.get("id") and c.get("text") is not None}.values())
+        with self._lock:
+            known = self._known_comments([c["id"] for c in comments])
+
+        changed = [c for c in comments if c["id"] not in known or known[c["id"]][0] != text_hash(c["text"])]
+        if not changed:
+            return {"new": 0, "updated": 0, "unchanged": len(comments)}
+
+        excluded = excluded or set()
+        # Scoring runs outside the lock, so another call may store the same comments meanwhile
+        counted = [c for c in changed if c["id"] not in excluded]
+        scored = dict(zip((c["id"] for c in counted), self.scores_for_texts([c["text"] for c in counted]).tolist()))
+
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            current = self._known_comments([c["id"] for c in changed])
+            rows = []
+            updated = 0
+            # (scope, key) → (scores to add, scores to remove); an edited comment leaves the video
+            # and channel it was stored under, which may differ from (or fill in) the new ones
+            deltas: Dict[Tuple[str, str], Tuple[List[float], List[float]]] = defaultdict(lambda: ([], []))
+            for c in changed:
+                new_hash = text_hash(c["text"])
+                stored = current.get(c["id"])
+                if stored is not None and stored[0] == new_hash:
+                    continue
+                row_channel = channel_id or (stored[2] if stored is not None else None)
+                if stored is not None:
+                    updated += 1
+                    old_score, old_channel, old_video, old_counted = stored[1:]
+                    if old_counted:
+                        deltas[("video", old_video)][1].append(old_score)
+                        if old_channel:
+                            deltas[("channel", old_channel)][1].append(old_score)
+                # Excluded comments keep a placeholder score that no aggregate ever sees
+                score = scored.get(c["id"])
+                rows.append((c["id"], video_id, row_channel, new_hash, score or 0.0, int(score is not None)))
+                if score is not None:
+                    deltas[("video", video_id)][0].append(score)
+                    if row_channel:
+                        deltas[("channel", row_channel)][0].append(score)
+
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO comments (comment_id, video_id, channel_id, text_hash, score, counted) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                for (scope, key), (added, removed) in deltas.items():
+                    self._apply(scope, key, np.array(added, dtype=np.float64), np.array(removed, dtype=np.float64))
+
+        return {"new": len(rows) - updated, "updated": updated, "unchanged": len(comments) - len(rows)}
+
+    def aggregate(self, scope: str, key: str) -> Dict:
+        """
+        Summary statistics for a video or channel from its running aggregates.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT count, sum, sum_sq, negative, neutral, positive, histogram FROM aggregates WHERE scope = ? AND key = ?",
+                (scope, key)
+            ).fetchone()
+        if row is None or row[0] == 0:
+            return {scope + "_id": key, "count": 0}
+
+        count, total, total_sq, negative, neutral, positive, histogram = row
+        mean = total / count
+        variance = max(total_sq / count - mean ** 2, 0.0)
+        return {
+            scope + "_id": key,
+            "count": count,
+            "mean": mean,
+            "std": variance ** 0.5,
+            "share_negative": negative / count,
+            "share_neutral": neutral / count,
+            "share_positive": positive / count,
+            "histogram": {
+                "edges": [round(float(e), 2) for e in HISTOGRAM_EDGES],
+                "counts": json.loads(histogram),
+            },
+        }
+
+
+_store: Optional[SentimentStore] = None
+_store_lock = threading.Lock()
+
+
+def get_sentiment_store() -> SentimentStore:
+    """
+    Return the process-wide sentiment store, opening the database on first use.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SentimentStore()
+    return _store
@@ -0,0 +1,68 @@
+import re
+from collections import Counter
+from typing import Dict, List
+
+# A brand name: up to four capitalised words ("Squarespace", "Raid Shadow Legends", "NordVPN")
+_BRAND = r"@?([A-Z0-9](?:[\w&'’-]|\.(?=\w))*(?:[ \t]+[A-Z0-9](?:[\w&'’-]|\.(?=\w))*){0,3})"
+
+BRAND_RES = [
+    re.compile(r"(?i:sponsored|brought to you|presented|powered|supported) by\s+(?:our friends at\s+)?" + _BRAND),
+    re.compile(r"(?i:thanks?(?: you)? to)\s+" + _BRAND + r"\s+(?i:for (?:sponsoring|supporting|partnering))"),
+    re.compile(r"(?i:in (?:paid )?partnership with|partnered with|sponsor(?:ed)? of this video is)\s+" + _BRAND),
+]
+CODE_RE = re.compile(
+    r"(?i:(?:use|with|enter|apply)\s+(?:my\s+|the\s+|our\s+)?(?:promo\s+|discount\s+|coupon\s+)?code)\s*[:\"'“]?\s*([A-Z0-9][A-Za-z0-9_-]{2,})"
+)
+MARKER_RES = {
+    "#ad": re.compile(r"(?<!\w)#(?:ad|advert|advertisement)\b", re.IGNORECASE),
+    "#sponsored": re.compile(r"(?<!\w)#(?:sponsored|sponsor|partner|paidpartnership)\b", re.IGNORECASE),
+    "sponsor mention": re.compile(r"\bsponsor(?:ed|ing|ship)?\b", re.IGNORECASE),
+    "paid promotion": re.compile(r"\bpaid (?:promotion|partnership|placement)\b", re.IGNORECASE),
+    "affiliate link": re.compile(r"\baffiliate\b|amzn\.to/|[?&](?:ref|aff|affiliate)=", re.IGNORECASE),
+    "promo code": re.compile(r"\b(?:promo|discount|coupon) code\b|\buse code\b", re.IGNORECASE),
+}
+# Markers that disclose a sponsorship on their own; a bare "sponsor" may be "not sponsored"
+DISCLOSURE_MARKERS = {"#ad", "#sponsored", "paid promotion"}
+
+# Words that end up capitalised after "sponsored by" without being a brand
+_NOT_BRANDS = {"the", "my", "our", "this", "a", "an", "me", "you", "viewers", "patreon", "members"}
+
+
+def _clean_brand(brand: str) -> str:
+    return brand.strip(" .,!:;'’-")
+
+
+def scan_description(text: str) -> Dict:
+    """
+    Sponsorship signals in a video description: named sponsors ("sponsored by X", "thanks to X
+    for sponsoring"), discount codes and disclosure markers (#ad, paid promotion, affiliate links).
+    """
+    text = text or ""
+    brands: List[str] = []
+    for pattern in BRAND_RES:
+        for match in pattern.finditer(text):
+            brand = _clean_brand(match.group(1))
+            if brand and brand.lower() not in _NOT_BRANDS and brand not in brands:
+                brands.append(brand)
+    codes = list(dict.fromkeys(match.group(1) for match in CODE_RE.finditer(text)))
+    markers = [name for name, pattern in MARKER_RES.items() if pattern.search(text)]
+    return {
+        "sponsored": bool(brands or codes or set(markers) & DISCLOSURE_MARKERS),
+        "brands": brands,
+        "codes": codes,
+        "markers": markers,
+    }
+
+
+def summarize_scans(videos: List[Dict]) -> Dict:
+    """
+    Combine per-video scans (video dicts with a `scan` entry) into sponsored-video counts and
+    the most frequent brands.
+    """
+    sponsored = [v for v in videos if v["scan"]["sponsored"]]
+    brands = Counter(brand for v in sponsored for brand in v["scan"]["brands"])
+    return {
+        "videos_checked": len(videos),
+        "sponsored_videos": len(sponsored),
+        "brands": [{"name": name, "videos": count} for name, count in brands.most_common()],
+    }
@@ -0,0 +1,394 @@
+import os
+import re
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Prompt budget per extraction call, in tokens (estimated as characters / 4)
+TALENT_CHUNK_TOKENS = int(os.getenv("TALENT_CHUNK_TOKENS", "12000"))
+# Concurrent extraction calls per agency
+TALENT_EXTRACTION_WORKERS = int(os.getenv("TALENT_EXTRACTION_WORKERS", "4"))
+TALENT_EXTRACTION_MODEL = "gpt-4.1-mini"
+
+CHARS_PER_TOKEN = 4
+
+
+# ─── Output schema ─────────────────────────────────────────────────────────────
+class SocialLinks(BaseModel):
+    youtube: Optional[str] = None
+    instagram: Optional[str] = None
+    tiktok: Optional[str] = None
+    twitter: Optional[str] = None
+    other: Optional[str] = None
+
+
+class Talent(BaseModel):
+    name: str
+    social_links: SocialLinks = Field(default_factory=SocialLinks)
+    bio: Optional[str] = Field(None, description="Brief bio (1-2 sentences)")
+    categories: List[str] = Field(default_factory=list, description="Content niches, e.g. gaming, beauty, tech")
+
+
+class AgencyContact(BaseModel):
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    address: Optional[str] = None
+
+
+class TalentExtraction(BaseModel):
+    agency_name: Optional[str] = None
+    agency_contact: AgencyContact = Field(default_factory=AgencyContact)
+    talents: List[Talent] = Field(default_factory=list)
+
+
+# ─── Chunking ──────────────────────────────────────────────────────────────────
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def page_url(page: Any) -> Optional[str]:
+    metadata = getattr(page, "metadata", None) or {}
+    return getattr(page, "url", None) or metadata.get("sourceURL") or metadata.get("url")
+
+
+def page_text(page: Any) -> str:
+    """
+    Text of one crawled page, preferring markdown (HTML repeats the same content at several times the size).
+    """
+    return getattr(page, "markdown", None) or getattr(page, "html", None) or ""
+
+
+def _split_text(text: str, max_chars: int) -> List[str]:
+    """
+    Split text at paragraph, then line boundaries so no piece exceeds `max_chars`.
+    """
+    if len(text) <= max_chars:
+        return [text]
+    pieces: List[str] = []
+    current = ""
+    for block in re.split(r"(\n\s*\n)", text):
+        while len(block) > max_chars:
+            cut = block.rfind("\n", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(block[:cut])
+            block = block[cut:]
+        if len(current) + len(block) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += block
+    if current.strip():
+        pieces.append(current)
+    return [p for p in pieces if p.strip()]
+
+
+def chunk_pages(pages: List[Any], token_budget: int = TALENT_CHUNK_TOKENS) -> List[str]:
+    """
+    Pack crawled pages into prompt chunks of at most `token_budget` estimated tokens.
+    Pages are kept whole where possible; oversized pages are split on paragraph boundaries.
+    """
+    max_chars = token_budget * CHARS_PER_TOKEN
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for page in pages:
+        text = page_text(page).strip()
+        if not text:
+            continue
+        header = f"## Page: {page_url(page) or 'unknown'}\n"
+        for piece in _split_text(text, max_chars - len(header)):
+            section = header + piece
+            if current and size + len(section) > max_chars:
+                chunks.append("\n\n".join(current))
+                current, size = [], 0
+            current.append(section)
+            size += len(section) + 2
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+# ─── Map: extraction per chunk ─────────────────────────────────────────────────
+def _extraction_agent() -> Agent:
+    # One agent per call: agents keep run state and are not safe to share between threads
+    return Agent(
+        name="Talent Parser",
+        role="Parse talent agency website content to extract talent information",
+        model=OpenAIChat(id=TALENT_EXTRACTION_MODEL),
+        response_model=TalentExtraction,
+        instructions=[
+            "Extract the following information from the website content:",
+            "1. Agency name",
+            "2. Agency contact information (email, phone, address)",
+            "3. List of talents with:",
+            "   - Name",
+            "   - Social media links, only if they appear as plain text (links were already extracted from the page markup)",
+            "   - Brief bio (1-2 sentences)",
+            "   - Categories (content niches such as gaming, beauty, tech)",
+            "The content is one part of a larger website; only report what appears in this part.",
+            "Leave fields empty rather than guessing. Never invent talents or links."
+        ]
+    )
+
+
+def parse_extraction(content: Any) -> TalentExtraction:
+    """
+    Validate a model response against the TalentExtraction schema.
+    """
+    if isinstance(content, TalentExtraction):
+        return content
+    if isinstance(content, BaseModel):
+        return TalentExtraction.model_validate(content.model_dump())
+    if isinstance(content, dict):
+        return TalentExtraction.model_validate(content)
+    if isinstance(content, str):
+        # Tolerate a fenced ```json block around the object
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        if match:
+            return TalentExtraction.model_validate_json(match.group(0))
+    raise ValueError(f"Unexpected extraction output of type {type(content).__name__}")
+
+
+def _extract_chunk(chunk: str) -> Optional[TalentExtraction]:
+    try:
+        response = _extraction_agent().run(f"Website content:\n{chunk}")
+        return parse_extraction(response.content)
+    except (ValidationError, ValueError) as e:
+        logger.warning(f"Discarding invalid talent extraction: {e}")
+    except Exception as e:
+        logger.warning(f"Talent extraction failed for one chunk: {e}")
+    return None
+
+
+# ─── Reduce: merge and deduplicate ─────────────────────────────────────────────
+_HANDLE_RE = re.compile(
+    r"(?:youtube\.com/(?:@|c/|user/|channel/)|instagram\.com/|tiktok\.com/@|(?:twitter|x)\.com/)([\w.\-]+)",
+    re.IGNORECASE
+)
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"[^\w]+", " ", name).strip().lower()
+
+
+def social_handle(url: Optional[str]) -> Optional[str]:
+    """
+    Platform-qualified handle from a social profile URL, e.g. "instagram:jane.doe".
+    """
+    if not url:
+        return None
+    match = _HANDLE_RE.search(url)
+    if not match:
+        return None
+    platform = re.match(r"(youtube|instagram|tiktok|twitter|x)\.com", match.group(0), re.IGNORECASE).group(1).lower()
+    platform = "twitter" if platform == "x" else platform
+    return f"{platform}:{match.group(1).lower().rstrip('.')}"
+
+
+def talent_keys(talent: Dict) -> List[str]:
+    keys = [f"name:{_normalize_name(talent['name'])}"] if talent.get("name") else []
+    keys += [h for h in (social_handle(url) for url in talent.get("social_links", {}).values()) if h]
+    return keys
+
+
+def _merge_talent(into: Dict, other: Dict) -> None:
+    for platform, url in other.get("social_links", {}).items():
+        if url and not into["social_links"].get(platform):
+            into["social_links"][platform] = url
+    if len(other.get("bio") or "") > len(into.get("bio") or ""):
+        into["bio"] = other["bio"]
+    for category in other.get("categories") or []:
+        if category not in into.setdefault("categories", []):
+            into["categories"].append(category)
+    for field in ("email", "youtube_channel_id"):
+        if other.get(field) and not into.get(field):
+            into[field] = other[field]
+
+
+def merge_rosters(rosters: List[Dict]) -> Dict:
+    """
+    Combine partial rosters (per chunk or per page): the most frequent agency name, the first
+    value of every contact field, and talents deduplicated by normalized name or any shared
+    social handle.
+    """
+    names = Counter(r["agency_name"].strip() for r in rosters if r.get("agency_name") and r["agency_name"].strip())
+    contact: Dict[str, Optional[str]] = {"email": None, "phone": None, "address": None}
+    talents: List[Optional[Dict]] = []
+    index: Dict[str, int] = {}
+    unassigned: List[Dict] = []
+
+    for roster in rosters:
+        for field, value in (roster.get("agency_contact") or {}).items():
+            contact[field] = contact.get(field) or value
+        unassigned.extend(roster.get("unassigned_links") or [])
+        for talent in roster.get("talents") or []:
+            data = {
+                **talent,
+                "social_links": {k: v for k, v in (talent.get("social_links") or {}).items() if v},
+                "categories": list(talent.get("categories") or []),
+            }
+            keys = talent_keys(data)
+            if not keys:
+                continue
+            matches = {index[k] for k in keys if k in index}
+            if matches:
+                target = min(matches)
+                _merge_talent(talents[target], data)
+                # Records that turn out to be the same person are folded into one
+                for other in matches - {target}:
+                    _merge_talent(talents[target], talents[other])
+                    for key in talent_keys(talents[other]):
+                        index[key] = target
+                    talents[other] = None
+            else:
+                target = len(talents)
+                talents.append(data)
+            for key in talent_keys(talents[target]):
+                index[key] = target
+
+    merged = {
+        "agency_name": names.most_common(1)[0][0] if names else None,
+        "agency_contact": contact,
+        "talents": [t for t in talents if t is not None],
+    }
+    if unassigned:
+        merged["unassigned_links"] = unassigned
+    return merged
+
+
+def merge_extractions(extractions: List[TalentExtraction]) -> Dict:
+    """
+    Merge validated chunk results into one roster (see `merge_rosters`).
+    """
+    return merge_rosters([e.model_dump() for e in extractions])
+
+
+def roster_diff(previous: List[Dict], current: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Talents added to and removed from a roster. A talent counts as the same person when
+    any name or social handle key matches, so a renamed profile is not reported twice.
+    """
+    previous_keys = {key for talent in previous for key in talent_keys(talent)}
+    current_keys = {key for talent in current for key in talent_keys(talent)}
+    return {
+        "added": [t for t in current if not previous_keys.intersection(talent_keys(t))],
+        "removed": [t for t in previous if not current_keys.intersection(talent_keys(t))],
+    }
+
+
+def extract_talents(pages: List[Any], token_budget: int = TALENT_CHUNK_TOKENS, max_workers: int = TALENT_EXTRACTION_WORKERS) -> Dict:
+    """
+    Map-reduce talent extraction over crawled pages: token-budgeted chunks are extracted
+    concurrently and the validated results merged, so cost grows linearly with site size.
+    """
+    chunks = chunk_pages(pages, token_budget)
+    if not chunks:
+        return {"agency_name": None, "agency_contact": {}, "talents": [], "chunks": 0, "failed_chunks": 0}
+
+    logger.info(f"Extracting talents from {len(pages)} pages in {len(chunks)} chunks")
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        results = list(executor.map(_extract_chunk, chunks))
+
+    extractions = [r for r in results if r is not None]
+    if not extractions:
+        raise ValueError("Failed to parse talent information from any part of the website")
+    return {**merge_extractions(extractions), "chunks": len(chunks), "failed_chunks": len(chunks) - len(extractions)}
+
+
+def extract_page_talents(
+    pages: List[Any],
+    token_budget: int = TALENT_CHUNK_TOKENS,
+    max_workers: int = TALENT_EXTRACTION_WORKERS
+) -> List[Optional[Dict]]:
+    """
+    Extract a separate roster for every page, so results can be stored and reused per page.
+    All chunks of all pages share one worker pool. A page whose chunks all failed yields
+    None; a page without text yields an empty roster without a model call.
+    """
+    page_chunks = [chunk_pages([page], token_budget) for page in pages]
+    flat = [chunk for chunks in page_chunks for chunk in chunks]
+    if flat:
+        logger.info(f"Extracting talents from {len(pages)} pages in {len(flat)} chunks")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(flat)))) as executor:
+            results = iter(list(executor.map(_extract_chunk, flat)))
+
+    rosters: List[Optional[Dict]] = []
+    for chunks in page_chunks:
+        extractions = [e for e in (next(results) for _ in chunks) if e is not None]
+        if chunks and not extractions:
+            rosters.append(None)
+        else:
+            rosters.append(merge_extractions(extractions))
+    return rosters
+
+
+def merge_link_cards(roster: Dict, pages: List[Dict], youtube_ids: Optional[Dict[str, Dict]] = None) -> Dict:
+    """
+    Fold deterministically harvested talent cards (`link_extraction.extract_page_links`)
+    into an LLM-extracted roster. Harvested profile links are authoritative; cards that the
+    LLM missed become talents of their own, and unnamed cards are reported separately.
+    Cards named like the agency itself only contribute to the agency contact.
+    """
+    youtube_ids = youtube_ids or {}
+    talents = roster.setdefault("talents", [])
+    index = {key: i for i, talent in enumerate(talents) for key in talent_keys(talent)}
+    unassigned: List[Dict] = []
+    agency_name = _normalize_name(roster.get("agency_name") or "")
+    emails = [e for page in pages for e in page["emails"]]
+    phones = [p for page in pages for p in page["phones"]]
+
+    for page in pages:
+        for card in page["cards"]:
+            if agency_name and card["name"] and _normalize_name(card["name"]) == agency_name:
+                emails += card.get("emails") or []
+                phones += card.get("phones") or []
+                continue
+            data = {
+                "name": card["name"],
+                "social_links": dict(card["social_links"]),
+                "bio": None,
+                "categories": [],
+            }
+            if card.get("emails"):
+                data["email"] = card["emails"][0]
+            keys = talent_keys(data)
+            matches = sorted({index[k] for k in keys if k in index})
+            if matches:
+                position = matches[0]
+                talents[position]["social_links"].update(data["social_links"])
+                if data.get("email"):
+                    talents[position].setdefault("email", data["email"])
+            elif card["name"]:
+                position = len(talents)
+                talents.append(data)
+            else:
+                unassigned.append({**data, "page": page["url"]})
+                continue
+            for key in talent_keys(talents[position]):
+                index[key] = position
+
+    for talent in talents:
+        channel = youtube_ids.get(talent.get("social_links", {}).get("youtube"))
+        if channel:
+            talent["youtube_channel_id"] = channel["channel_id"]
+
+    contact = roster.setdefault("agency_contact", {})
+    if emails and not contact.get("email"):
+        contact["email"] = emails[0]
+    if phones and not contact.get("phone"):
+        contact["phone"] = phones[0]
+    if unassigned:
+        roster["unassigned_links"] = unassigned
+    return roster
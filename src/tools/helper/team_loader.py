@@ -0,0 +1,70 @@
+import os
+import time
+import logging
+import importlib
+import threading
+from typing import Any
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Module that defines the agents and the team
+TEAM_MODULE = "youtube_agent_team"
+# "coordinate" (the team's coordinator LLM hands tasks to members one at a time) or
+# "parallel" (plan a task graph up front and run independent member tasks concurrently)
+TEAM_MODE = os.getenv("TEAM_MODE", "coordinate")
+
+_team: Any = None
+_runner: Any = None
+_team_lock = threading.Lock()
+_warm_up_thread = None
+
+
+def get_youtube_team() -> Any:
+    """
+    Return the YouTube analysis team, importing the tool modules and building the agents on
+    first use. Concurrent callers wait for the same build instead of starting a second one.
+    """
+    global _team
+    if _team is None:
+        with _team_lock:
+            if _team is None:
+                start = time.perf_counter()
+                _team = importlib.import_module(TEAM_MODULE).youtube_team
+                logger.info(f"YouTube team ready in {time.perf_counter() - start:.2f} s")
+    return _team
+
+
+def warm_up_team(background: bool = True) -> None:
+    """
+    Build the team ahead of the first request. With `background=True` the build runs in a
+    daemon thread, so the web server or page is up while the agents are assembled.
+    """
+    global _warm_up_thread
+    if background:
+        with _team_lock:
+            if _warm_up_thread is None and _team is None:
+                _warm_up_thread = threading.Thread(target=get_youtube_team, name="team-warm-up", daemon=True)
+                _warm_up_thread.start()
+    else:
+        get_youtube_team()
+
+
+def get_team_runner() -> Any:
+    """
+    Return what answers open-ended requests in the configured TEAM_MODE: the team itself, or
+    a ParallelTeamRunner around it. Both offer `run(message, session_id=...)` and
+    `arun(message, session_id=...)`.
+    """
+    global _runner
+    if TEAM_MODE != "parallel":
+        return get_youtube_team()
+    if _runner is None:
+        team = get_youtube_team()
+        with _team_lock:
+            if _runner is None:
+                from src.tools.helper.parallel_team import ParallelTeamRunner
+
+                _runner = ParallelTeamRunner(team)
+    return _runner
@@ -0,0 +1,302 @@
+import os
+import json
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+# ─── Logging setup ─────────────────────────────────────────────────────────────
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Directory holding the on-disk thumbnail embedding index
+THUMBNAIL_INDEX_DIR = os.getenv("THUMBNAIL_INDEX_DIR", "/tmp/brandview/thumbnail_index")
+
+# Random-hyperplane LSH parameters for approximate nearest-neighbour search
+LSH_TABLES = 8
+LSH_BITS = 12
+LSH_SEED = 1234
+
+# Two thumbnails whose perceptual hashes differ in at most this many bits count as the same image
+REUSE_MAX_DISTANCE = 6
+
+
+def perceptual_hash(img: Image.Image) -> str:
+    """
+    64-bit difference hash (dHash) of an image as a 16-character hex string.
+    Robust to re-encoding and resizing, so re-uploads of the same thumbnail collide.
+    """
+    small = np.asarray(img.convert("L").resize((9, 8), Image.LANCZOS), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return f"{value:016x}"
+
+
+def _hamming_distances(hashes: np.ndarray, query: int) -> np.ndarray:
+    xor = np.bitwise_xor(hashes, np.uint64(query))
+    # Popcount on uint64 via the byte view
+    return np.unpackbits(xor.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+
+class ThumbnailIndex:
+    """
+    Append-only on-disk index of normalized thumbnail embeddings.
+
+    Layout of THUMBNAIL_INDEX_DIR:
+        meta.json       embedding dimension of the index
+        entries.jsonl   one JSON object per row: video_id, channel_id, phash, url
+        embeddings.f32  row-major float32 matrix, one embedding per entry
+
+    An append writes the embedding before the entry, so an interrupted append leaves at
+    most a trailing partial row or an embedding without an entry; both are cut off on load.
+
+    Rows are keyed by (video_id, phash); a perceptual hash that is already indexed
+    reuses its embedding so identical images skip inference entirely.
+    """
+
+    def __init__(self, path: str = THUMBNAIL_INDEX_DIR):
+        self.path = path
+        self._entries_path = os.path.join(path, "entries.jsonl")
+        self._embeddings_path = os.path.join(path, "embeddings.f32")
+        self._meta_path = os.path.join(path, "meta.json")
+        self._lock = threading.Lock()
+
+        self.dim: Optional[int] = None
+        self.entries: List[Dict] = []
+        # Grown by doubling so appends stay amortized O(1); rows beyond len(entries) are unused
+        self._buffer = np.zeros((0, 0), dtype=np.float32)
+        self._keys = set()
+        self._by_hash: Dict[str, int] = {}
+        self._hash_values = np.zeros(0, dtype=np.uint64)
+        self._planes = None
+        self._buckets: List[Dict[int, List[int]]] = [defaultdict(list) for _ in range(LSH_TABLES)]
+
+        os.makedirs(path, exist_ok=True)
+        self._load()
+
+    # ─── Persistence ──────────────────────────────────────────────────────────
+    def _load(self) -> None:
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path) as f:
+                self.dim = int(json.load(f)["dim"])
+        if not os.path.exists(self._entries_path) or not os.path.exists(self._embeddings_path):
+            return
+
+        entries = []
+        with open(self._entries_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Only the last line can be partial; anything after it is not trusted either
+                    break
+        raw = np.fromfile(self._embeddings_path, dtype=np.float32)
+        if self.dim is None:
+            # Index written before meta.json existed: infer the dimension only when it is unambiguous
+            if not entries or raw.size % len(entries):
+                if entries:
+                    logger.warning(f"Thumbnail index at {self.path} has no dimension and is inconsistent, ignoring it")
+                return
+            self._write_meta(raw.size // len(entries))
+
+        rows = min(len(entries), raw.size // self.dim)
+        if rows != len(entries) or raw.size != rows * self.dim:
+            logger.warning(
+                f"Thumbnail index at {self.path} has {len(entries)} entries and {raw.size / self.dim:.2f} "
+                f"embeddings, truncating both to {rows} rows"
+            )
+            entries = entries[:rows]
+            raw = raw[:rows * self.dim]
+            self._rewrite(entries, raw)
+        if not entries:
+            return
+
+        self.entries = entries
+        self._buffer = raw.reshape(rows, self.dim)
+        for row, entry in enumerate(entries):
+            self._register(row, entry)
+        self._hash_values = np.array([int(e["phash"], 16) for e in entries], dtype=np.uint64)
+        logger.info(f"Loaded thumbnail index with {len(entries)} entries from {self.path}")
+
+    def _write_meta(self, dim: int) -> None:
+        tmp_path = self._meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"dim": dim}, f)
+        os.replace(tmp_path, self._meta_path)
+        self.dim = dim
+
+    def _rewrite(self, entries: List[Dict], raw: np.ndarray) -> None:
+        with open(self._embeddings_path, "r+b") as f:
+            f.truncate(raw.size * raw.itemsize)
+        tmp_path = self._entries_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in entries)
+        os.replace(tmp_path, self._entries_path)
+
+    def _register(self, row: int, entry: Dict) -> None:
+        self._keys.add((entry["video_id"], entry["phash"]))
+        self._by_hash.setdefault(entry["phash"], row)
+        for table, key in enumerate(self._lsh_keys(self._vectors[row])):
+            self._buckets[table][key].append(row)
+
+    @property
+    def _vectors(self) -> np.ndarray:
+        return self._buffer[:len(self.entries)]
+
+    # ─── LSH ──────────────────────────────────────────────────────────────────
+    def _lsh_keys(self, vector: np.ndarray) -> List[int]:
+        if self._planes is None:
+            rng = np.random.default_rng(LSH_SEED)
+            self._planes = rng.standard_normal((LSH_TABLES, LSH_BITS, vector.shape[-1])).astype(np.float32)
+        bits = (self._planes @ vector) > 0  # shape (LSH_TABLES, LSH_BITS)
+        weights = 1 << np.arange(LSH_BITS)
+        return (bits * weights).sum(axis=1).tolist()
+
+    # ─── Public API ───────────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def embedding_for_hash(self, phash: str) -> Optional[np.ndarray]:
+        """
+        Return the stored embedding of an identical image, if any.
+        """
+        row = self._by_hash.get(phash)
+        return None if row is None else self._vectors[row]
+
+    def lookup_video(self, video_id: str) -> Optional[Tuple[Dict, np.ndarray]]:
+        """
+        Return the most recent (entry, embedding) indexed for a video, if any.
+        """
+        for row in range(len(self.entries) - 1, -1, -1):
+            if self.entries[row]["video_id"] == video_id:
+                return self.entries[row], self._vectors[row]
+        return None
+
+    def add(
+        self,
+        video_id: str,
+        phash: str,
+        embedding: np.ndarray,
+        channel_id: Optional[str] = None,
+        url: Optional[str] = None
+    ) -> bool:
+        """
+        Persist one thumbnail embedding. Returns False if (video_id, phash) is already indexed.
+        """
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        with self._lock:
+            if (video_id, phash) in self._keys:
+                return False
+            if self.dim is None:
+                self._write_meta(vector.shape[0])
+            elif vector.shape[0] != self.dim:
+                raise ValueError(f"Embedding dimension {vector.shape[0]} does not match index dimension {self.dim}")
+
+            entry = {"video_id": video_id, "channel_id": channel_id, "phash": phash, "url": url}
+            with open(self._embeddings_path, "ab") as f:
+                f.write(vector.tobytes())
+            with open(self._entries_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+            row = len(self.entries)
+            if row >= self._buffer.shape[0]:
+                grown = np.zeros((max(64, 2 * row), vector.shape[0]), dtype=np.float32)
+                if row:
+                    grown[:row] = self._buffer[:row]
+                self._buffer = grown
+            self._buffer[row] = vector
+            self.entries.append(entry)
+            self._hash_values = np.append(self._hash_values, np.uint64(int(phash, 16)))
+            self._register(row, entry)
+            return True
+
+    def search(self, vector: np.ndarray, k: int = 10, exclude_video_ids: Iterable[str] = ()) -> List[Dict]:
+        """
+        Approximate k-nearest thumbnails by cosine similarity.
+        Candidates come from the LSH buckets and are re-ranked exactly; if the buckets
+        yield too few candidates the whole index is scanned.
+        """
+        if not self.entries:
+            return []
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        exclude = set(exclude_video_ids)
+
+        candidates = set()
+        for table, key in enumerate(self._lsh_keys(vector)):
+            candidates.update(self._buckets[table].get(key, ()))
+        rows = np.fromiter(candidates, dtype=np.int64)
+        if len(rows) < k + len(exclude):
+            rows = np.arange(len(self.entries))
+
+        similarities = self._vectors[rows] @ vector
+        order = np.argsort(-similarities)
+        results = []
+        for i in order:
+            entry = self.entries[rows[i]]
+            if entry["video_id"] in exclude:
+                continue
+            results.append({**entry, "similarity": round(float(similarities[i]), 4)})
+            if len(results) >= k:
+                break
+        return results
+
+    def find_reuse(self, phash: str, max_distance: int = REUSE_MAX_DISTANCE) -> List[Dict]:
+        """
+        Return every indexed thumbnail whose perceptual hash is within `max_distance` bits.
+        """
+        if not self.entries:
+            return []
+        distances = _hamming_distances(self._hash_values, int(phash, 16))
+        rows = np.nonzero(distances <= max_distance)[0]
+        return sorted(
+            ({**self.entries[row], "distance": int(distances[row])} for row in rows),
+            key=lambda e: e["distance"]
+        )
+
+    def channel_centroid(self, channel_id: str) -> Optional[np.ndarray]:
+        rows = [row for row, entry in enumerate(self.entries) if entry.get("channel_id") == channel_id]
+        if not rows:
+            return None
+        centroid = self._vectors[rows].mean(axis=0)
+        return centroid / np.linalg.norm(centroid)
+
+    def similar_channels(self, vector: np.ndarray, k: int = 10, exclude_channel_ids: Iterable[str] = ()) -> List[Dict]:
+        """
+        Rank channels by how closely their thumbnails resemble `vector`
+        (mean similarity of each channel's best-matching thumbnails).
+        """
+        exclude = set(exclude_channel_ids)
+        by_channel: Dict[str, List[float]] = defaultdict(list)
+        for hit in self.search(vector, k=max(50, k * 10)):
+            if hit.get("channel_id") and hit["channel_id"] not in exclude:
+                by_channel[hit["channel_id"]].append(hit["similarity"])
+
+        ranked = [
+            {"channel_id": channel_id, "similarity": round(float(np.mean(sims[:5])), 4), "matches": len(sims)}
+            for channel_id, sims in by_channel.items()
+        ]
+        ranked.sort(key=lambda c: c["similarity"], reverse=True)
+        return ranked[:k]
+
+
+_index: Optional[ThumbnailIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_thumbnail_index() -> ThumbnailIndex:
+    """
+    Return the process-wide thumbnail index, loading it from disk on first use.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = ThumbnailIndex()
+    return _index
@@ -0,0 +1,117 @@
+from typing import Any, Dict, Optional
+from typing import Annotated
+from agno.tools import tool
+from src.tools.helper.helper import _influencer_metrics, _max_price_for_cpm
+
+@tool(
+    name="calculate_influencer_metrics",
+    description="Calculate CPM, CPV, CPA, engagement rate and median expected views (with confidence bands) for a YouTube channel in one call.",
+    show_result=True,
+    cache_results=True,
+    cache_ttl=3600,
+    cache_dir="/tmp/agno_cache"
+)
+def calculate_influencer_metrics(
+    identifier: Annotated[str, """
+        The channel to evaluate: a channel ID, @handle, channel URL or channel name.
+        Example: "@MrBeast" or "UCX6OQ3DkcsbYNE6H8uQQuVA"
+    """],
+    price: Annotated[Optional[float], """
+        Price of one sponsored video, in the brand's currency. Required for CPM, CPV and CPA.
+        Example: 5000. Default: None
+    """] = None,
+    conversions: Annotated[Optional[float], """
+        Expected conversions (sign-ups, sales, installs) from the video. Required for CPA.
+        Example: 120. Default: None
+    """] = None,
+    target_cpm: Annotated[Optional[float], """
+        CPM the brand is willing to pay. If given, the maximum price for that CPM is included.
+        Example: 25. Default: None
+    """] = None,
+    max_results: Annotated[int, """
+        Number of recent videos (longer than 3 minutes) the metrics are based on.
+        Default: 10
+    """] = 10,
+    months: Annotated[int, """
+        Only videos published within this many months are used.
+        Default: 6
+    """] = 6,
+    confidence_level: Annotated[float, """
+        Coverage of the bootstrap confidence bands. Must be between 0 and 1.
+        Default: 0.90
+    """] = 0.90
+) -> Dict[str, Any]:
+    """
+    Fetch recent video statistics for a channel and compute influencer marketing metrics.
+    Expected views are the MEDIAN views of the recent videos; every metric has a bootstrap band.
+
+    Args:
+        identifier (str): Channel ID, @handle, URL or name
+        price (Optional[float]): Price of the sponsored video
+        conversions (Optional[float]): Expected conversions from the video
+        target_cpm (Optional[float]): CPM the brand is willing to pay
+        max_results (int): Recent videos used (default: 10)
+        months (int): Look-back window in months (default: 6)
+        confidence_level (float): Coverage of the bands (default: 0.90)
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - channel_id, videos: The resolved channel and the number of videos used
+            - expected_views: Median views with low/high band
+            - mean_views, median_likes, median_comments: Raw central values
+            - engagement_rate: Median (likes + comments) / views with low/high band (None without views)
+            - overall_engagement_rate: Total (likes + comments) / total views
+            - cpm, cpv: Cost per mille and per view with low/high band (only with price)
+            - cpa, conversion_rate: Only with price and conversions
+            - max_price, max_price_conservative, max_price_optimistic: Only with target_cpm
+    """
+    return _influencer_metrics(identifier, price, conversions, target_cpm, max_results, months, confidence_level)
+
+@tool(
+    name="max_price_for_cpm",
+    description="Calculate the maximum price for a sponsored video on a YouTube channel that keeps the CPM under a target.",
+    show_result=True,
+    cache_results=True,
+    cache_ttl=3600,
+    cache_dir="/tmp/agno_cache"
+)
+def max_price_for_cpm(
+    identifier: Annotated[str, """
+        The channel to price: a channel ID, @handle, channel URL or channel name.
+        Example: "@MrBeast" or "UCX6OQ3DkcsbYNE6H8uQQuVA"
+    """],
+    target_cpm: Annotated[float, """
+        The highest acceptable cost per 1,000 views.
+        Example: 25
+    """],
+    max_results: Annotated[int, """
+        Number of recent videos (longer than 3 minutes) the expected views are based on.
+        Default: 10
+    """] = 10,
+    months: Annotated[int, """
+        Only videos published within this many months are used.
+        Default: 6
+    """] = 6,
+    confidence_level: Annotated[float, """
+        Coverage of the bootstrap band behind the conservative and optimistic prices.
+        Default: 0.90
+    """] = 0.90
+) -> Dict[str, Any]:
+    """
+    Answer "what is the most we should pay for a CPM under X" in one call.
+
+    Args:
+        identifier (str): Channel ID, @handle, URL or name
+        target_cpm (float): Highest acceptable CPM
+        max_results (int): Recent videos used (default: 10)
+        months (int): Look-back window in months (default: 6)
+        confidence_level (float): Coverage of the views band (default: 0.90)
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - channel_id, videos, expected_views: The channel, videos used and median views
+            - max_price: target_cpm × median views / 1000
+            - max_price_conservative: Price that still meets the target at the low end of the views band
+            - max_price_optimistic: Price at the high end of the views band
+    """
+    return _max_price_for_cpm(identifier, target_cpm, max_results, months, confidence_level)
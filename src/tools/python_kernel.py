@@ -0,0 +1,101 @@
+import json
+from typing import Any, Dict
+
+from agno.agent import Agent
+from agno.tools import Toolkit
+from src.tools.helper.kernels import current_kernel_session, get_kernel_pool
+from src.tools.helper.helper import _resolve_channel_id, _fetch_video_statistics
+
+# Characters of kernel output returned to the model
+MAX_OUTPUT_CHARS = 8000
+
+
+def _session_key(agent: Agent) -> str:
+    # The entry points name the conversation explicitly (kernel_session); the agent's own session
+    # IDs are only a fallback for direct use, since the shared team keeps one ID for every caller
+    return (
+        current_kernel_session()
+        or getattr(agent, "team_session_id", None)
+        or getattr(agent, "session_id", None)
+        or "default"
+    )
+
+
+def _format(result: Dict[str, Any]) -> str:
+    parts = []
+    if result["stdout"]:
+        parts.append(result["stdout"])
+    parts.extend(result["results"])
+    if result["stderr"]:
+        parts.append(f"stderr:\n{result['stderr']}")
+    if result["error"]:
+        parts.append(f"Error:\n{result['error']}")
+    output = "\n".join(parts).strip() or "Code ran successfully (no output). Use print() to show values."
+    if len(output) > MAX_OUTPUT_CHARS:
+        output = output[:MAX_OUTPUT_CHARS] + f"\n… output truncated ({len(output)} characters)"
+    return output
+
+
+class WarmPythonTools(Toolkit):
+    """
+    Runs Python in a persistent, per-session IPython kernel with numpy (np), pandas (pd),
+    matplotlib.pyplot (plt, Agg backend), json, math and statistics already imported.
+    Variables survive between calls, so follow-up calculations reuse data already in memory.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(name="warm_python_tools", **kwargs)
+        self.register(self.run_python_code, sanitize_arguments=False)
+        self.register(self.list_variables)
+        self.register(self.load_video_statistics)
+
+    def run_python_code(self, agent: Agent, code: str) -> str:
+        """Runs Python code in this conversation's persistent kernel and returns its printed output.
+
+        numpy (np), pandas (pd), matplotlib.pyplot (plt), json, math and statistics are already imported.
+        Variables from earlier calls (including data loaded with load_video_statistics) are still defined,
+        so do not re-create data that already exists. Save plots with plt.savefig("name.png").
+
+        :param code: The Python code to run. Use print() for every value you need to see.
+        :return: The printed output, the value of the last expression, or the error traceback.
+        """
+        return _format(get_kernel_pool().get(_session_key(agent)).execute(code))
+
+    def list_variables(self, agent: Agent) -> str:
+        """Lists the variables currently defined in this conversation's Python kernel with their types and shapes.
+
+        :return: One line per variable: name, type and shape (for arrays and DataFrames).
+        """
+        return get_kernel_pool().get(_session_key(agent)).variables() or "No variables defined yet."
+
+    def load_video_statistics(
+        self,
+        agent: Agent,
+        identifier: str,
+        max_results: int = 10,
+        months: int = 6,
+        min_duration_minutes: int = 3
+    ) -> str:
+        """Fetches statistics of a channel's recent videos straight into the Python kernel.
+
+        Defines `video_stats` (list of dicts with videoId, viewCount, likeCount, commentCount,
+        favoriteCount, durationMinutes, publishedAt), `video_stats_df` (the same as a pandas DataFrame)
+        and `channel_id`. Only a short summary is returned; compute on the variables with run_python_code.
+
+        :param identifier: Channel ID, @handle, channel URL or channel name.
+        :param max_results: Maximum number of videos to load (default: 10).
+        :param months: Only videos from the last this many months (default: 6).
+        :param min_duration_minutes: Skip videos shorter than this, e.g. Shorts (default: 3).
+        :return: Summary of the loaded data.
+        """
+        channel_id = _resolve_channel_id(identifier)
+        video_stats = _fetch_video_statistics(channel_id, max_results, months, min_duration_minutes)
+        kernel = get_kernel_pool().get(_session_key(agent))
+        kernel.set_variables({"video_stats": video_stats, "channel_id": channel_id})
+        return json.dumps({
+            "channel_id": channel_id,
+            "variables": ["video_stats", "video_stats_df", "channel_id"] if video_stats else ["video_stats", "channel_id"],
+            "videos": len(video_stats),
+            "columns": list(video_stats[0].keys()) if video_stats else [],
+            "first_row": video_stats[0] if video_stats else None,
+        })
@@ -1,7 +1,7 @@
 from typing import List, Union, Dict, Any
 from typing import Annotated
 from agno.tools import tool
-from src.tools.helper.helper import _sentiment_score
+from src.tools.helper.helper import _sentiment_score, _sentiment_distribution, _video_sentiment, _channel_sentiment, _stream_comment_sentiment
 
 @tool(
     name="sentiment_score",
@@ -35,4 +35,159 @@ def sentiment_score(
         >>> sentiment_score(comments)
         -0.06666666666666667
     """
-    return _sentiment_score(texts)
\ No newline at end of file
+    return _sentiment_score(texts)
+
+@tool(
+    name="sentiment_distribution",
+    description="Calculate the full sentiment distribution (mean, percentiles, histogram, share negative) for a list of texts.",
+    show_result=True,
+    cache_results=True,
+    cache_ttl=3600,
+    cache_dir="/tmp/agno_cache"
+)
+def sentiment_distribution(
+    texts: Annotated[Union[str, List[str]], """
+        A single text string or a list of text strings to analyze, e.g. all comments of a video.
+        Example: ["Great video!", "This was terrible", "I learned a lot"]
+    """]
+) -> Dict[str, Any]:
+    """
+    Score every text with TextBlob polarity (-1.0 to 1.0) and summarize the distribution.
+
+    Args:
+        texts (Union[str, List[str]]): A single text string or a list of text strings to analyze
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - count, mean, std: Number of texts and the mean/standard deviation of their polarity
+            - p5, p25, p50, p75, p95: Polarity percentiles
+            - share_negative, share_neutral, share_positive: Fraction of texts below, at and above 0
+            - histogram: 10 equal-width bins over [-1, 1] with their edges and counts
+    """
+    return _sentiment_distribution(texts)
+
+@tool(
+    name="video_sentiment",
+    description="Fetch the newest comments of a video and return its running comment sentiment aggregate.",
+    show_result=True
+)
+def video_sentiment(
+    video_id: Annotated[str, """
+        The YouTube video ID whose comment sentiment should be summarized.
+        Example: "dQw4w9WgXcQ"
+    """],
+    max_comments: Annotated[int, """
+        How many of the newest comments to fetch before summarizing.
+        Comments scored on earlier calls are reused, so only new or edited comments cost work.
+        Default: 100
+    """] = 100
+) -> Dict[str, Any]:
+    """
+    Update and return the comment sentiment aggregate of a single video. Unlike sentiment_score,
+    no comment text has to be passed in: comments are fetched, scored once per comment and
+    added to a running aggregate that persists between calls.
+
+    Args:
+        video_id (str): The YouTube video ID
+        max_comments (int): Number of newest comments to fetch (default: 100)
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - video_id: The video ID
+            - count: Number of comments in the aggregate
+            - mean, std: Mean and standard deviation of comment polarity (-1.0 to 1.0)
+            - share_negative, share_neutral, share_positive: Fraction of comments below, at and above 0
+            - histogram: 10 equal-width bins over [-1, 1] with their edges and counts
+    """
+    return _video_sentiment(video_id, max_comments)
+
+@tool(
+    name="channel_sentiment",
+    description="Fetch the newest comments on a channel's recent videos and return its running comment sentiment aggregate.",
+    show_result=True
+)
+def channel_sentiment(
+    identifier: Annotated[str, """
+        The channel to analyze: a channel ID, @handle, channel URL or channel name.
+        Example: "@MrBeast" or "UCX6OQ3DkcsbYNE6H8uQQuVA"
+    """],
+    max_videos: Annotated[int, """
+        How many of the channel's most recent videos to fetch comments for.
+        Default: 10
+    """] = 10,
+    max_comments: Annotated[int, """
+        How many of the newest comments to fetch per video.
+        Default: 100
+    """] = 100
+) -> Dict[str, Any]:
+    """
+    Update and return the comment sentiment aggregate of a channel. Every comment is scored
+    once and kept in per-video and per-channel running aggregates, so repeated questions about
+    the same channel only pay for comments posted since the last call.
+
+    Args:
+        identifier (str): Channel ID, @handle, URL or name
+        max_videos (int): Number of recent videos to fetch comments for (default: 10)
+        max_comments (int): Number of newest comments to fetch per video (default: 100)
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - channel_id: The resolved channel ID
+            - count: Number of comments recorded for the channel so far
+            - mean, std: Mean and standard deviation of comment polarity (-1.0 to 1.0)
+            - share_negative, share_neutral, share_positive: Fraction of comments below, at and above 0
+            - histogram: 10 equal-width bins over [-1, 1] with their edges and counts
+    """
+    return _channel_sentiment(identifier, max_videos, max_comments)
+
+@tool(
+    name="comment_sentiment",
+    description="Fetch and score a video's comments in one pipelined step and return only the sentiment distribution and the most extreme comments.",
+    show_result=True,
+    cache_results=True,
+    cache_ttl=3600,
+    cache_dir="/tmp/agno_cache"
+)
+def comment_sentiment(
+    video_id: Annotated[str, """
+        The YouTube video ID whose comments should be analyzed.
+        Example: "dQw4w9WgXcQ"
+    """],
+    max_comments: Annotated[int, """
+        Maximum number of newest comments to fetch and score.
+        Default: 500
+    """] = 500,
+    sample_size: Annotated[int, """
+        How many of the most positive and of the most negative comments to return as examples.
+        Default: 5
+    """] = 5,
+    collapse_duplicates: Annotated[bool, """
+        If True, near-duplicate (copy-paste) comments are collapsed into one representative
+        weighted by the number of copies and their likes, and emoji-only and spam comments are
+        dropped, so bot waves cannot skew the distribution.
+        Default: True
+    """] = True
+) -> Dict[str, Any]:
+    """
+    Stream a video's comments page by page and score each page while the next one downloads.
+    Use this instead of fetch_comments followed by sentiment_score: the raw comments never
+    have to pass through the conversation, only their summary does.
+
+    Args:
+        video_id (str): The YouTube video ID
+        max_comments (int): Maximum number of comments to fetch (default: 500)
+        sample_size (int): Number of example comments per extreme (default: 5)
+        collapse_duplicates (bool): Collapse near-duplicates and drop spam before scoring (default: True)
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - video_id, pages: The video ID and the number of comment pages fetched
+            - count, mean, std: Number of comments and the mean/standard deviation of their polarity
+            - p5, p25, p50, p75, p95: Polarity percentiles
+            - share_negative, share_neutral, share_positive: Fraction of comments below, at and above 0
+            - histogram: 10 equal-width bins over [-1, 1] with their edges and counts
+            - dedup: Comments seen, representatives kept, dropped and collapsed counts and the
+              compression ratio (None when collapse_duplicates is False)
+            - most_positive, most_negative: Example comments (text, author, likeCount, duplicates, sentiment)
+    """
+    return _stream_comment_sentiment(video_id, max_comments, sample_size, collapse_duplicates)
@@ -1,7 +1,7 @@
-from typing import Dict, Annotated
+from typing import Dict, List, Annotated
 from agno.tools import tool
 from agno.tools.tavily import TavilyTools
-from src.tools.helper.helper import _crawl_talent_agency
+from src.tools.helper.helper import _crawl_talent_agency, _start_talent_crawls, _talent_crawl_status
 
 @tool(
     name="crawl_talent_agency",
@@ -32,11 +32,78 @@ def crawl_talent_agency(
     Returns:
         Dict: A dictionary containing:
             - agency_name: Name of the talent agency
-            - talents: List of talent information including:
+            - agency_contact: Dictionary with email, phone and address
+            - talents: List of talent information (deduplicated by name and social handle) including:
                 - name: Talent's name
                 - social_links: Dictionary of social media links
                 - bio: Short biography
-                - categories: List of talent categories
-                - stats: Dictionary of social media statistics
+                - categories: Content niches
+                - email: Talent's own contact e-mail, when listed on the site
+                - youtube_channel_id: Verified channel ID of the talent's YouTube profile
+            - unassigned_links: Profile links found on the site that could not be tied to a named talent
+            - added, removed: Talents that joined or left the roster since the previous crawl
+            - first_crawl: Whether the agency had not been crawled before
+            - pages, changed_pages, unchanged_pages, failed_pages, removed_pages: Page counts of this crawl
     """
-    return _crawl_talent_agency(agency_url, limit)
\ No newline at end of file
+    return _crawl_talent_agency(agency_url, limit)
+
+@tool(
+    name="start_agency_crawls",
+    description="Start crawling several talent agency websites at once in the background. Returns job IDs to poll with agency_crawl_status.",
+    show_result=True
+)
+def start_agency_crawls(
+    agency_urls: Annotated[List[str], """
+        The main URLs of the talent agency websites to crawl.
+        Example: ['https://www.talentagency.com', 'https://www.otheragency.com']
+    """],
+    limit: Annotated[int, """
+        Maximum number of pages to crawl per website.
+        Default is 50. Higher values will take longer but may find more talents.
+    """] = 50
+) -> Dict:
+    """
+    Submit crawl jobs for several talent agencies. Crawling and talent extraction run in the
+    background; pages are extracted as soon as they are crawled.
+
+    Args:
+        agency_urls (List[str]): The URLs of the talent agency websites
+        limit (int): Maximum number of pages to crawl per website (default: 50)
+
+    Returns:
+        Dict: A dictionary containing:
+            - jobs: List of started jobs with job_id, agency_url and status
+            - errors: Agencies whose crawl could not be started, with the error
+    """
+    return _start_talent_crawls(agency_urls, limit)
+
+@tool(
+    name="agency_crawl_status",
+    description="Get progress and the talents found so far for crawl jobs started with start_agency_crawls.",
+    show_result=True
+)
+def agency_crawl_status(
+    job_ids: Annotated[List[str], """
+        The job IDs returned by start_agency_crawls.
+    """],
+    wait_seconds: Annotated[float, """
+        How long to wait for the jobs to finish before returning partial results.
+        Default is 10 seconds.
+    """] = 10
+) -> Dict:
+    """
+    Poll talent agency crawl jobs. Finished jobs return the full roster with the diff against the
+    previous crawl; running jobs return the talents extracted from the pages crawled so far.
+
+    Args:
+        job_ids (List[str]): The job IDs to poll
+        wait_seconds (float): Maximum time to wait for the jobs to finish (default: 10)
+
+    Returns:
+        Dict: A dictionary containing:
+            - jobs: One entry per job with job_id, agency_url, status, done, error (if any),
+              agency_name, agency_contact, talents, added (and removed once done) and page counts;
+              running jobs also report pages_total, the number of pages the crawler has found
+            - all_done: Whether every job has finished
+    """
+    return _talent_crawl_status(job_ids, wait_seconds)
\ No newline at end of file
@@ -1,49 +1,12 @@
-import logging
-import requests
-from io import BytesIO
-from PIL import Image
-import torch
-import numpy as np
-from transformers import CLIPProcessor, CLIPModel
-import torch.nn.functional as F
-from typing import Annotated
+from typing import Annotated, Dict, List, Optional
 from agno.tools import tool
-from src.tools.helper.helper import _score_thumbnail
-
-# ─── Logging setup ─────────────────────────────────────────────────────────────
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Initialize CLIP model and processor globally
-CLIP_MODEL_NAME = "openai/clip-vit-large-patch14"
-logger.info(f"Loading CLIP model {CLIP_MODEL_NAME}…")
-model = CLIPModel.from_pretrained(CLIP_MODEL_NAME)
-processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
-
-# Global parameters
-TEMPERATURE = 0.07
-SCALE = 5.0
-
-# Prompts covering design, clarity, emotion, composition
-POSITIVE_PROMPTS = [
-    "eye-catching thumbnail",
-    "bold, vibrant colors",
-    "clear, readable text",
-    "prominent faces",
-    "professional design"
-]
-NEGATIVE_PROMPTS = [
-    "blurry or out of focus",
-    "dark or underexposed",
-    "dull colors",
-    "small or unreadable text",
-    "cluttered layout"
-]
-
-def _download_image(url: str) -> Image.Image:
-    resp = requests.get(url, timeout=5)
-    resp.raise_for_status()
-    return Image.open(BytesIO(resp.content)).convert("RGB")
+from src.tools.helper.helper import (
+    _score_thumbnail,
+    _score_thumbnails,
+    _find_similar_thumbnails,
+    _find_similar_channels,
+    _check_thumbnail_reuse
+)
 
 @tool(
     name="score_thumbnail",
@@ -58,9 +21,121 @@ def score_thumbnail(
         The URL of the YouTube video thumbnail to analyze.
         This should be a direct URL to the image file.
         Example: 'https://i.ytimg.com/vi/dQw4w9WgXcQ/maxresdefault.jpg'
-    """]
+    """],
+    positive_prompts: Annotated[Optional[List[str]], """
+        Optional descriptions of a good thumbnail that replace the default positive prompts.
+        Example: ['eye-catching thumbnail', 'prominent faces']
+    """] = None,
+    negative_prompts: Annotated[Optional[List[str]], """
+        Optional descriptions of a bad thumbnail that replace the default negative prompts.
+        Example: ['blurry or out of focus', 'cluttered layout']
+    """] = None
 ) -> float:
     """
     Compute a 0–1 score for how "attractive" a thumbnail is.
     """
-    return _score_thumbnail(thumbnail_url)
\ No newline at end of file
+    return _score_thumbnail(thumbnail_url, positive_prompts, negative_prompts)
+
+@tool(
+    name="score_thumbnails",
+    description="Scores many YouTube thumbnails in one call and returns per-thumbnail scores plus channel-level aggregates.",
+    show_result=True,
+    cache_results=True,
+    cache_ttl=3600,
+    cache_dir="/tmp/agno_cache"
+)
+def score_thumbnails(
+    thumbnail_urls: Annotated[List[str], """
+        The URLs of the thumbnails to analyze, e.g. the thumbnails of a channel's recent videos.
+        Example: ['https://i.ytimg.com/vi/dQw4w9WgXcQ/maxresdefault.jpg', 'https://i.ytimg.com/vi/9bZkp7q19f0/hqdefault.jpg']
+    """],
+    positive_prompts: Annotated[Optional[List[str]], """
+        Optional descriptions of a good thumbnail that replace the default positive prompts.
+    """] = None,
+    negative_prompts: Annotated[Optional[List[str]], """
+        Optional descriptions of a bad thumbnail that replace the default negative prompts.
+    """] = None,
+    channel_id: Annotated[Optional[str], """
+        Optional YouTube channel ID the thumbnails belong to. Stored in the thumbnail index
+        so the channel can later be compared with find_similar_channels.
+    """] = None
+) -> Dict:
+    """
+    Compute 0–1 attractiveness scores for a batch of thumbnails.
+
+    Args:
+        thumbnail_urls (List[str]): Thumbnail image URLs
+        positive_prompts (List[str], optional): Replacement positive prompts
+        negative_prompts (List[str], optional): Replacement negative prompts
+        channel_id (str, optional): Channel the thumbnails belong to
+
+    Returns:
+        Dict: A dictionary containing:
+            - thumbnails: List of {url, score, cached, error} in input order
+            - aggregates: count, scored, cached, failed, mean, median, std, min, max, p10, p90,
+              share_above_0_5, best and worst thumbnail
+    """
+    return _score_thumbnails(thumbnail_urls, positive_prompts, negative_prompts, channel_id)
+
+@tool(
+    name="find_similar_thumbnails",
+    description="Finds previously analyzed thumbnails that look most similar to a given thumbnail.",
+    show_result=True,
+    cache_results=False
+)
+def find_similar_thumbnails(
+    query: Annotated[str, """
+        A YouTube video ID or a thumbnail URL.
+        Example: 'dQw4w9WgXcQ' or 'https://i.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg'
+    """],
+    k: Annotated[int, "Number of similar thumbnails to return. Default is 10."] = 10
+) -> List[Dict]:
+    """
+    Search the local thumbnail index for visually similar thumbnails.
+
+    Returns:
+        List[Dict]: Similar thumbnails with video_id, channel_id, url and similarity (cosine, -1 to 1)
+    """
+    return _find_similar_thumbnails(query, k)
+
+@tool(
+    name="find_similar_channels",
+    description="Finds channels whose thumbnail style resembles a given channel or thumbnail.",
+    show_result=True,
+    cache_results=False
+)
+def find_similar_channels(
+    query: Annotated[str, """
+        A YouTube channel ID (UC...) whose thumbnails were scored with score_thumbnails,
+        or a video ID / thumbnail URL to use as the style reference.
+    """],
+    k: Annotated[int, "Number of channels to return. Default is 5."] = 5
+) -> List[Dict]:
+    """
+    Rank indexed channels by thumbnail style similarity.
+
+    Returns:
+        List[Dict]: Channels with channel_id, similarity and the number of matching thumbnails
+    """
+    return _find_similar_channels(query, k)
+
+@tool(
+    name="check_thumbnail_reuse",
+    description="Checks whether a thumbnail image has already been used by other videos.",
+    show_result=True,
+    cache_results=False
+)
+def check_thumbnail_reuse(
+    query: Annotated[str, """
+        A YouTube video ID or a thumbnail URL.
+        Example: 'dQw4w9WgXcQ' or 'https://i.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg'
+    """]
+) -> List[Dict]:
+    """
+    Find indexed thumbnails that are the same image (matching perceptual hash).
+
+    Returns:
+        List[Dict]: Other videos using the image, with video_id, channel_id, url and
+        distance (differing hash bits, 0 = identical)
+    """
+    return _check_thumbnail_reuse(query)
@@ -1,16 +1,12 @@
 import os
-import torch
 from typing import Dict, List, Optional, Tuple, Annotated, Callable, Any
-import whisper
-from transformers import AutoTokenizer, AutoModelForCausalLM
 import requests
 from pathlib import Path
 import tempfile
-import yt_dlp
 from agno.tools import tool
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
-from src.tools.helper.helper import _video_to_text, _analyze_video_content
+from src.tools.helper.helper import _video_to_text, _analyze_video_content, VISUAL_SAMPLE_RATE, VISUAL_MAX_FRAMES
 
 def logger_hook(function_name: str, function_call: Callable, arguments: Dict[str, Any]):
     """Pre-hook function that runs before the tool execution"""
@@ -66,21 +62,34 @@ def analyze_video_content(
         The unique identifier of the YouTube video.
         This is the part of the YouTube URL after 'v='. For example:
         - For the URL 'https://www.youtube.com/watch?v=dQw4w9WgXcQ', the `video_id` would be 'dQw4w9WgXcQ'.
-    """]
+    """],
+    sample_rate: Annotated[float, """
+        Number of video frames sampled per second for visual sponsor detection.
+        Default is 0.2 (one frame every 5 seconds). Long videos are sampled more sparsely
+        so that `max_frames` is never exceeded.
+    """] = VISUAL_SAMPLE_RATE,
+    max_frames: Annotated[int, """
+        Maximum number of frames analyzed per video. Default is 48.
+    """] = VISUAL_MAX_FRAMES
 ) -> Dict:
     """
     Analyze video content with scene-based transcription and sponsor detection.
     
     Args:
         video_id (str): YouTube video ID
+        sample_rate (float): Frames per second sampled for the visual track (default: 0.2)
+        max_frames (int): Frame budget for the visual track (default: 48)
         
     Returns:
         Dict: Analysis results including:
             - scenes: List of scenes with timestamps, transcriptions, summaries, and sponsor mentions
             - sponsors: List of detected sponsors
+            - visual_hits: Sampled frames showing sponsor logos, overlays or product placements
+            - timeline: Transcript and visual sponsor segments merged into one timeline
             - metadata: Dictionary containing video title and description
             
     Raises:
+        ValueError: If sample_rate is not positive or max_frames is below 1
         Exception: If video download or analysis fails
     """
-    return _analyze_video_content(video_id)
\ No newline at end of file
+    return _analyze_video_content(video_id, sample_rate, max_frames)
\ No newline at end of file
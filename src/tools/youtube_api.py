@@ -297,7 +297,12 @@ def fetch_comments(
         - For the URL 'https://www.youtube.com/watch?v=dQw4w9WgXcQ', the `video_id` would be 'dQw4w9WgXcQ'.
         - This ID is used to fetch the comments for the specific video.
     """],
-    max_results: int = 100
+    max_results: int = 100,
+    collapse_duplicates: Annotated[bool, """
+        If True, copy-paste and near-duplicate comments are collapsed into one representative
+        (the most-liked copy) and emoji-only and spam comments are dropped.
+        Use this to keep large comment sets small. Default: False
+    """] = False
 ) -> List[Dict]:
     """
     Fetch comments for a video.
@@ -305,6 +310,7 @@ def fetch_comments(
     Args:
         video_id (str): The YouTube video ID
         max_results (int): Maximum number of comments to fetch (default: 100)
+        collapse_duplicates (bool): Collapse near-duplicate comments and drop spam (default: False)
         
     Returns:
         List[Dict]: List of comment information including:
@@ -313,8 +319,10 @@ def fetch_comments(
             - text: Comment text
             - likeCount: Number of likes
             - publishedAt: Publication date
+            - duplicates, weight: Only with collapse_duplicates; number of collapsed copies and
+              the summed weight (1 + likeCount per copy) of the group
     """
-    return _fetch_comments(video_id, max_results)
+    return _fetch_comments(video_id, max_results, collapse_duplicates=collapse_duplicates)
     
 @tool(
     name="introspect_channel",
@@ -0,0 +1,34 @@
+from src.tools.helper.link_extraction import extract_page_links
+
+
+def _card(name):
+    handle = name.lower().replace(" ", "")
+    return (
+        f'<div><h3>{name}</h3>'
+        f'<a href="https://www.instagram.com/{handle}/">Instagram</a>'
+        f'<a href="https://www.youtube.com/@{handle}">YouTube</a></div>'
+    )
+
+
+def _names(html):
+    return [card["name"] for card in extract_page_links(html, url="https://agency.test/roster")["cards"]]
+
+
+def test_cards_are_named_after_their_heading():
+    assert _names(f"<main>{_card('Jane Doe')}{_card('John Roe')}</main>") == ["Jane Doe", "John Roe"]
+
+
+def test_void_name_elements_do_not_block_later_names():
+    html = (
+        '<main><meta itemprop="name" content="Agency"><img class="name-badge" src="x.png">'
+        f"{_card('Jane Doe')}{_card('John Roe')}</main>"
+    )
+    assert _names(html) == ["Jane Doe", "John Roe"]
+
+
+def test_unclosed_name_element_ends_with_its_block():
+    unclosed = (
+        '<div><a href="https://www.instagram.com/janedoe/">Instagram</a>'
+        '<a href="https://www.youtube.com/@janedoe">YouTube</a><span class="name">Jane Doe</div>'
+    )
+    assert _names(f"<main>{unclosed}{_card('John Roe')}</main>") == ["Jane Doe", "John Roe"]
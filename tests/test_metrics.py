@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from src.tools.helper.metrics import bootstrap_ci, engagement_rates, influencer_metrics, max_price_for_cpm
+
+
+def _videos(views, likes=None, comments=None):
+    likes = likes or [0] * len(views)
+    comments = comments or [0] * len(views)
+    return [
+        {"viewCount": v, "likeCount": l, "commentCount": c}
+        for v, l, c in zip(views, likes, comments)
+    ]
+
+
+# ─── engagement_rates ──────────────────────────────────────────────────────────
+def test_engagement_rates_known_values():
+    rates = engagement_rates(np.array([100.0, 200.0]), np.array([5.0, 10.0]), np.array([5.0, 30.0]))
+    np.testing.assert_allclose(rates, [0.1, 0.2])
+
+
+def test_engagement_rates_without_views_are_nan():
+    rates = engagement_rates(np.array([0.0, 50.0]), np.array([3.0, 5.0]), np.array([1.0, 0.0]))
+    assert np.isnan(rates[0])
+    assert rates[1] == pytest.approx(0.1)
+
+
+# ─── bootstrap_ci ──────────────────────────────────────────────────────────────
+def test_bootstrap_ci_constant_sample_has_zero_width():
+    assert bootstrap_ci([7.0, 7.0, 7.0]) == (7.0, 7.0)
+
+
+def test_bootstrap_ci_contains_median_and_is_deterministic():
+    values = np.arange(1, 101, dtype=np.float64)
+    low, high = bootstrap_ci(values)
+    assert low <= np.median(values) <= high
+    assert bootstrap_ci(values) == (low, high)
+
+
+def test_bootstrap_ci_widens_with_confidence_level():
+    values = np.arange(1, 101, dtype=np.float64)
+    low_90, high_90 = bootstrap_ci(values, confidence_level=0.90)
+    low_99, high_99 = bootstrap_ci(values, confidence_level=0.99)
+    assert low_99 <= low_90 and high_90 <= high_99
+
+
+def test_bootstrap_ci_supports_other_statistics():
+    low, high = bootstrap_ci([1.0, 2.0, 3.0, 4.0], statistic=np.mean)
+    assert 1.0 <= low <= 2.5 <= high <= 4.0
+
+
+def test_bootstrap_ci_ignores_non_finite_values():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert bootstrap_ci(values + [np.nan, np.inf]) == bootstrap_ci(values)
+
+
+@pytest.mark.parametrize("values", [[], [np.nan, np.nan], [np.inf]])
+def test_bootstrap_ci_rejects_empty_samples(values):
+    with pytest.raises(ValueError):
+        bootstrap_ci(values)
+
+
+@pytest.mark.parametrize("confidence_level", [0.0, 1.0, 1.5])
+def test_bootstrap_ci_rejects_invalid_confidence_level(confidence_level):
+    with pytest.raises(ValueError):
+        bootstrap_ci([1.0, 2.0], confidence_level=confidence_level)
+
+
+# ─── influencer_metrics ────────────────────────────────────────────────────────
+def test_influencer_metrics_known_values():
+    result = influencer_metrics(
+        _videos([1000, 2000, 3000], likes=[50, 100, 150], comments=[10, 20, 30]),
+        price=30.0,
+        conversions=10
+    )
+    assert result["videos"] == 3
+    assert result["expected_views"]["value"] == 2000
+    assert result["mean_views"] == 2000
+    assert result["median_likes"] == 100
+    assert result["engagement_rate"]["value"] == pytest.approx(0.06)
+    assert result["overall_engagement_rate"] == pytest.approx(0.06)
+    assert result["cpm"]["value"] == pytest.approx(15.0)
+    assert result["cpv"]["value"] == pytest.approx(0.015)
+    assert result["cpa"] == 3.0
+    assert result["conversion_rate"] == pytest.approx(0.005)
+
+
+def test_influencer_metrics_cost_bands_invert_views_band():
+    result = influencer_metrics(_videos([800, 1200, 1500, 2000, 2600, 5000]), price=100.0)
+    views, cpm = result["expected_views"], result["cpm"]
+    assert views["low"] <= views["value"] <= views["high"]
+    assert cpm["low"] <= cpm["value"] <= cpm["high"]
+    assert cpm["low"] == pytest.approx(100.0 / views["high"] * 1000, abs=0.01)
+
+
+def test_influencer_metrics_without_price_has_no_cost_metrics():
+    result = influencer_metrics(_videos([1000, 2000]))
+    assert "cpm" not in result and "cpa" not in result and "max_price" not in result
+
+
+def test_influencer_metrics_without_views_returns_empty_engagement_band():
+    result = influencer_metrics(_videos([0, 0, 0], likes=[1, 0, 2]))
+    assert result["engagement_rate"] == {"value": None, "low": None, "high": None}
+    assert result["overall_engagement_rate"] is None
+    assert result["expected_views"]["value"] == 0
+
+
+def test_influencer_metrics_skips_videos_without_views_in_engagement():
+    result = influencer_metrics(_videos([0, 100, 100], likes=[5, 10, 10]))
+    assert result["engagement_rate"]["value"] == pytest.approx(0.1)
+
+
+def test_influencer_metrics_with_target_cpm_adds_max_price():
+    result = influencer_metrics(_videos([1000, 2000, 3000]), target_cpm=20.0)
+    assert result["max_price"] == 40.0
+
+
+def test_influencer_metrics_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        influencer_metrics([])
+    with pytest.raises(ValueError):
+        influencer_metrics(_videos([1000]), price=-1.0)
+    with pytest.raises(ValueError):
+        influencer_metrics(_videos([0, 0]), price=100.0)
+    with pytest.raises(ValueError):
+        influencer_metrics(_videos([1000]), price=100.0, conversions=0)
+
+
+# ─── max_price_for_cpm ─────────────────────────────────────────────────────────
+def test_max_price_for_cpm_known_values():
+    result = max_price_for_cpm([1000, 2000, 3000], target_cpm=20.0)
+    assert result["target_cpm"] == 20.0
+    assert result["max_price"] == 40.0
+    assert result["max_price_conservative"] <= result["max_price"] <= result["max_price_optimistic"]
+
+
+def test_max_price_for_cpm_constant_views():
+    result = max_price_for_cpm([5000, 5000, 5000], target_cpm=10.0)
+    assert result["max_price"] == result["max_price_conservative"] == result["max_price_optimistic"] == 50.0
+
+
+@pytest.mark.parametrize("target_cpm", [0.0, -5.0])
+def test_max_price_for_cpm_rejects_non_positive_target(target_cpm):
+    with pytest.raises(ValueError):
+        max_price_for_cpm([1000, 2000], target_cpm=target_cpm)
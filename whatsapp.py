@@ -1,11 +1,24 @@
 from fastapi import FastAPI, Form
 from twilio.rest import Client
 import os
-from youtube_agent_team import youtube_team
+import asyncio
+from src.tools.helper.team_loader import get_team_runner, warm_up_team
+from src.tools.helper.intent_router import route_message
+from src.tools.helper.models import warm_up_from_env
+from src.tools.helper.kernels import get_kernel_pool, kernel_session
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Optionally start loading CLIP in the background (WARM_UP_MODELS=1)
+warm_up_from_env()
+
+# Import the tools and build the agent team in the background; the server accepts requests meanwhile
+warm_up_team()
+
+# Start spare Python kernels for the calculation agents in the background (PYTHON_KERNEL_SPARES=0 disables)
+get_kernel_pool().warm_up()
+
 app = FastAPI()
 
 # Twilio credentials from environment variables
@@ -23,7 +36,13 @@ async def whatsapp_reply(Body: str = Form(...), From: str = Form(...)):
     """
     print(f"Incoming message from {From}: {Body}")
     try:
-        response = youtube_team.run(Body)
+        # Common lookups are answered directly; everything else goes to the team. The lookups make
+        # blocking YouTube API calls, so they run in a worker thread to keep the event loop free
+        response = await asyncio.to_thread(route_message, Body)
+        if response is None:
+            # Each sender gets their own agent session and Python kernel
+            with kernel_session(From):
+                response = await get_team_runner().arun(Body, session_id=From)
         reply_text = response.content
 
         # Send response back to user via Twilio
@@ -13,13 +13,21 @@ from src.tools.youtube_api import (
     search_youtube_channels
 )
 from src.tools.document_output import Document_Output
+from src.tools.batch_reports import generate_channel_reports
+from src.tools.analysis import predict_next_video_views, rank_channels_by_expected_views
+from src.tools.metrics import calculate_influencer_metrics, max_price_for_cpm
 from src.tools.video_analysis import video_to_text, analyze_video_content
-from src.tools.talents import crawl_talent_agency
-from agno.tools.python import PythonTools
+from src.tools.talents import crawl_talent_agency, start_agency_crawls, agency_crawl_status
+from src.tools.thumbnail_analysis import (
+    score_thumbnails,
+    find_similar_thumbnails,
+    find_similar_channels,
+    check_thumbnail_reuse
+)
+from src.tools.python_kernel import WarmPythonTools
 from agno.tools.tavily import TavilyTools
-from pathlib import Path
 
-from src.tools.risk import sentiment_score
+from src.tools.risk import sentiment_score, sentiment_distribution, video_sentiment, channel_sentiment, comment_sentiment
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -51,12 +59,18 @@ channel_collector = Agent(
         search_youtube_channel_videos,
         fetch_channel_info,
         fetch_videos,
-        introspect_channel
+        introspect_channel,
+        score_thumbnails,
+        find_similar_thumbnails,
+        find_similar_channels,
+        check_thumbnail_reuse
     ],
     instructions=[
         "You are responsible for collecting comprehensive data about YouTube channels.",
         "You can search for videos within channels, fetch channel information, and get recent videos.",
         "Use the introspect_channel tool for a complete channel analysis.",
+        "To evaluate thumbnails, pass all thumbnail URLs to score_thumbnails in a single call, together with the channel ID.",
+        "Use find_similar_thumbnails, find_similar_channels and check_thumbnail_reuse for thumbnail style comparisons and reuse checks.",
         "Present the data in a well-organized, readable format."
     ],
     markdown=True
@@ -139,7 +153,7 @@ risk_sentiment_analyzer = Agent(
     name="risk_sentiment_analyzer",
     role="Analyzes both potential risks and sentiment for YouTube channels, videos, and comments",
     model=OpenAIChat(id="gpt-4.1-mini"),
-    tools=[TavilyTools(), sentiment_score],
+    tools=[TavilyTools(), sentiment_score, sentiment_distribution, video_sentiment, channel_sentiment, comment_sentiment],
     instructions=[
         "You are a comprehensive risk and sentiment analysis specialist responsible for evaluating both brand safety and sentiment.",
         "For risk analysis:",
@@ -149,6 +163,9 @@ risk_sentiment_analyzer = Agent(
         "For sentiment analysis:",
         "1. Use sentiment_score tool to analyze the sentiment of provided text (comments, video descriptions, etc.)",
         "2. Provide both individual and aggregate sentiment scores when analyzing multiple items",
+        "   For large sets of comments, use sentiment_distribution to get the mean, percentiles and share of negative comments in one call",
+        "   To judge the comment sentiment of a whole video or channel, use video_sentiment or channel_sentiment instead of fetching and passing comments yourself",
+        "   When you need percentiles or example comments for a video, use comment_sentiment: it fetches and scores the comments in one step",
         "3. Consider context when interpreting sentiment scores",
         "At the end of your analysis, return a JSON object with:",
         "1. risk_score: A numerical assessment of the overall risk level (0-1)",
@@ -178,10 +195,11 @@ document_generator = Agent(
     name="document_generator",
     role="Generates structured documents and reports from data.",
     model=OpenAIChat(id="gpt-4.1-mini"),
-    tools=[Document_Output],
+    tools=[Document_Output, generate_channel_reports],
     instructions=[
         "1. Use Document_Output tool to create all reports and documents",
-        "2. Format content with clear sections and bullet points",
+        "   For reports on several channels (comparison packs, shortlists), call generate_channel_reports once with all channel IDs instead",
+        "2. Write the content as markdown: a # title, ## sections, - bullet points, | tables | and **bold** text; it is laid out as written",
         "3. Include any provided graphs or visualizations in the document",
         "4. Return the document URL to the user",
         "5. Never use Python scripts for document generation"
@@ -195,9 +213,10 @@ python_script_executor = Agent(
     name="python_script_executor",
     role="Executes Python scripts for calculations.",
     model=OpenAIChat(id="gpt-4.1-mini"),
-    tools=[PythonTools(base_dir=Path("tmp/python"))],
+    tools=[WarmPythonTools()],
     instructions=[
-        "1. Use PythonTools to write and execute Python scripts for any calculations",
+        "1. Use run_python_code to run Python for any calculations; numpy, pandas and matplotlib are already imported",
+        "   Variables persist between calls: check list_variables before re-creating data, and use load_video_statistics to load channel statistics directly into the kernel",
         "2. Use real data from other agents for calculations",
         "3. Never generate reports or documents nor fetch new data - refuse similar tasks."
     ],
@@ -210,10 +229,12 @@ metrics_calculator = Agent(
     name="metrics_calculator",
     role="Calculates influencer marketing metrics using real data provided.",
     model=OpenAIChat(id="gpt-4.1-mini"),
-    tools=[PythonTools(base_dir=Path("tmp/python"))],
+    tools=[calculate_influencer_metrics, max_price_for_cpm, WarmPythonTools()],
     instructions=[
-        "Receive real data outputs (views, likes, comments, etc.) from Python Script Executor agent.",
-        "Calculate CPM, CPV, CPA, engagement rate, and other influencer marketing metrics.",
+        "Use calculate_influencer_metrics to get CPM, CPV, CPA, engagement rate and expected views for a channel in one call.",
+        "Use max_price_for_cpm when asked for the maximum price that keeps the CPM under a target.",
+        "Both tools fetch the channel's video statistics themselves; pass the channel and the price, conversions or target CPM.",
+        "Only write Python scripts for metrics these tools do not cover, using real data outputs (views, likes, comments, etc.) from other agents.",
         "Use the median rather than mean when estimating values like expected views.",
         "For the views estimation, use strictly the MEDIAN because we're always estimating.",
         "Do not generate or simulate synthetic data; only work with provided data.",
@@ -228,12 +249,20 @@ video_statistics_specialist = Agent(
     name="video_statistics_specialist",
     role="Analyzes engagement statistics for recent videos on a YouTube channel",
     model=OpenAIChat(id="gpt-4.1-mini"),
-    tools=[PythonTools(base_dir=Path("tmp/python")), resolve_channel_id, fetch_video_statistics],
+    tools=[
+        WarmPythonTools(),
+        resolve_channel_id,
+        fetch_video_statistics,
+        predict_next_video_views,
+        rank_channels_by_expected_views
+    ],
     instructions=[
         "You are a video statistics specialist focused on analyzing engagement metrics.",
         "First resolve the channel identifier to get the official channel ID.",
         "Then fetch statistics for recent videos including views, likes, comments, and favorites.",
-        "If you need to do any calculations, use the python tools for it.",
+        "To forecast views of the next video, use predict_next_video_views with the fetched view counts.",
+        "To compare or rank several channels by expected views, use rank_channels_by_expected_views in a single call.",
+        "If you need to do any other calculations, use load_video_statistics to load the statistics into the Python kernel and run_python_code to compute on them.",
         "Present the statistics in a clear, tabular format.",
         "Focus on providing insights about video performance and engagement patterns."
     ],
@@ -246,13 +275,15 @@ talent_specialist = Agent(
     name="talent_specialist",
     role="Discovers and analyzes talents from talent agency websites",
     model=OpenAIChat(id="gpt-4.1-mini"),
-    tools=[TavilyTools(), crawl_talent_agency],
+    tools=[TavilyTools(), crawl_talent_agency, start_agency_crawls, agency_crawl_status],
     instructions=[
         "You are a talent specialist responsible for discovering and analyzing talents from talent agency websites.",
         "Your workflow should be:",
         "1. Use Tavily search to find relevant talent agency websites based on the search criteria",
-        "2. For each found agency website, use crawl_talent_agency to extract talent information",
-        "3. Present the findings in a clear, organized format",
+        "2. Start crawling all found agency websites at once with start_agency_crawls",
+        "3. Poll agency_crawl_status with the job IDs; it returns the talents found so far, so report early findings and keep polling until all_done is true",
+        "   For a single agency, crawl_talent_agency returns the finished result in one call",
+        "4. Present the findings in a clear, organized format",
         "When searching for agencies:",
         "- Use specific search terms like 'influencer talent agency [location/niche]'",
         "- Focus on finding official agency websites",
@@ -310,7 +341,8 @@ youtube_team = Team(
         "Use strictly the tool transfer_task_to_member to transfer the task to the appropriate agent.",
         "Consider the chat history provided in the memory context when responding to maintain conversation continuity.",
         "To generate a report or document, use the document_generator agent.",
-        "For data processing and calculations, use the python_script_executor agent - but only after data has been gathered by other agents.",
+        "For influencer pricing metrics (CPM, CPV, CPA, engagement rate, maximum price for a target CPM), use the metrics_calculator agent directly - it fetches the channel statistics itself.",
+        "For other data processing and calculations, use the python_script_executor agent - but only after data has been gathered by other agents.",
         "Remember that the python_script_executor agent should never be used to fetch or gather new data - it only processes existing data."
     ],
     expected_output="Present all data in a clear, organized format using markdown.",